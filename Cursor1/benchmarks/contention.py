@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Multi-process contention harness.
+
+    python -m benchmarks.contention --readers 4 --writers 4 --duration 10 --mode both
+
+Runs N reader and M writer processes against one database file through
+EmployeeDAO, all starting at the same instant, and reports per role the
+throughput, latency percentiles and how many operations failed with
+"database is locked". `--mode default` uses the rollback journal without
+the concurrency settings, `--mode wal` enables ConcurrencyMode, and
+`--mode both` runs each on its own copy of the data set for comparison.
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from models.employee import Employee
+from data_access.concurrency import ConcurrencyMode, is_lock_error
+from data_access.database import DatabaseManager, EmployeeDAO
+from data_access.query import EmployeeQuery
+from benchmarks.data_generator import populate, generate_employees, remove_database
+from benchmarks.runner import summarize
+
+MODES = ("default", "wal")
+
+# Seconds between submitting the workers and the common start instant
+START_DELAY = 1.0
+
+def _read_by_id(dao: EmployeeDAO, rng: random.Random, rows: int, departments: int):
+    dao.read(rng.randint(1, rows))
+
+def _read_page(dao: EmployeeDAO, rng: random.Random, rows: int, departments: int):
+    dao.read_page(page_size=50)
+
+def _query_department(dao: EmployeeDAO, rng: random.Random, rows: int, departments: int):
+    dao.query(EmployeeQuery(department_id=rng.randint(1, departments)).order_by("salary", True).page(20))
+
+def _random_employee(rng: random.Random, departments: int, employee_id: Optional[int] = None) -> Employee:
+    name, department_id, salary, hire_date = next(generate_employees(1, departments, rng.random()))
+    return Employee(id=employee_id, name=name, department_id=department_id, salary=salary, hire_date=hire_date)
+
+def _update(dao: EmployeeDAO, rng: random.Random, rows: int, departments: int):
+    dao.update(_random_employee(rng, departments, rng.randint(1, rows)))
+
+def _create_delete(dao: EmployeeDAO, rng: random.Random, rows: int, departments: int):
+    dao.delete(dao.create(_random_employee(rng, departments)))
+
+def _create_batch(dao: EmployeeDAO, rng: random.Random, rows: int, departments: int):
+    created = [_random_employee(rng, departments) for _ in range(20)]
+    dao.create_many(created)
+
+OPERATIONS: Dict[str, List[Callable]] = {
+    "reader": [_read_by_id, _read_page, _query_department],
+    "writer": [_update, _update, _create_delete, _create_batch],
+}
+
+def _connect_mode(mode: str, lock_timeout: float, checkpoint_interval: float) -> Optional[ConcurrencyMode]:
+    if mode != "wal":
+        return None
+    return ConcurrencyMode(busy_timeout_ms=int(lock_timeout * 1000), checkpoint_interval=checkpoint_interval)
+
+def _worker(role: str, index: int, db_path: str, mode: str, rows: int, departments: int,
+            start_at: float, duration: float, lock_timeout: float, seed: int) -> Dict[str, Any]:
+    """Worker-process entry point: run `role` operations until the deadline."""
+    # One checkpointer per run is plenty; writer 0 owns it
+    concurrency = _connect_mode(mode, lock_timeout, 1.0 if role == "writer" and index == 0 else 0)
+    db_manager = DatabaseManager(db_path, pool_size=1, pool_timeout=lock_timeout, concurrency=concurrency)
+    dao = EmployeeDAO(db_manager)
+    rng = random.Random(seed * 1000 + index)
+    operations = OPERATIONS[role]
+    latencies: List[float] = []
+    lock_errors = other_errors = 0
+    time.sleep(max(0.0, start_at - time.time()))
+    deadline = start_at + duration
+    try:
+        while time.time() < deadline:
+            operation = rng.choice(operations)
+            started = time.perf_counter()
+            try:
+                operation(dao, rng, rows, departments)
+            except sqlite3.Error as e:
+                if is_lock_error(e):
+                    lock_errors += 1
+                else:
+                    other_errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+        return {"role": role, "latencies": latencies, "lock_errors": lock_errors,
+                "other_errors": other_errors, "concurrency": db_manager.concurrency_stats()}
+    finally:
+        db_manager.close()
+
+def _prepare(db_path: str, mode: str, template: str):
+    """Copy the generated data set to `db_path` in the journal mode `mode` needs."""
+    remove_database(db_path)
+    shutil.copyfile(template, db_path)
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute(f"PRAGMA journal_mode = {'WAL' if mode == 'wal' else 'DELETE'}")
+    finally:
+        conn.close()
+
+def _aggregate(results: List[Dict[str, Any]], role: str, duration: float) -> Dict[str, Any]:
+    mine = [result for result in results if result["role"] == role]
+    latencies = [latency for result in mine for latency in result["latencies"]]
+    lock_errors = sum(result["lock_errors"] for result in mine)
+    other_errors = sum(result["other_errors"] for result in mine)
+    attempts = len(latencies) + lock_errors + other_errors
+    report: Dict[str, Any] = {
+        "processes": len(mine),
+        "operations": len(latencies),
+        "throughput_ops_per_sec": len(latencies) / duration,
+        "lock_errors": lock_errors,
+        "other_errors": other_errors,
+        "lock_error_rate": lock_errors / attempts if attempts else 0.0,
+        "retries": sum(result["concurrency"]["retries"] for result in mine),
+    }
+    if latencies:
+        latency = summarize(latencies)
+        # Per-process serial rate is not meaningful across processes
+        latency.pop("ops_per_sec")
+        report["latency"] = latency
+    return report
+
+def run_contention(db_path: str, mode: str, readers: int, writers: int, duration: float,
+                   rows: int, departments: int, lock_timeout: float, seed: int) -> Dict[str, Any]:
+    """Run one contention round against `db_path` and return per-role statistics."""
+    start_at = time.time() + START_DELAY + 0.02 * (readers + writers)
+    roles = [("reader", index) for index in range(readers)] + [("writer", index) for index in range(writers)]
+    with ProcessPoolExecutor(max_workers=len(roles)) as pool:
+        futures = [pool.submit(_worker, role, index, db_path, mode, rows, departments,
+                               start_at, duration, lock_timeout, seed) for role, index in roles]
+        results = [future.result() for future in futures]
+    checkpoints = [result["concurrency"]["checkpoints"] for result in results
+                   if "checkpoints" in result["concurrency"]]
+    return {
+        "mode": mode,
+        "readers": _aggregate(results, "reader", duration),
+        "writers": _aggregate(results, "writer", duration),
+        "checkpoints": checkpoints[0] if checkpoints else None,
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Multi-process reader/writer contention harness")
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per mode")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--departments", type=int, default=15)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--mode", choices=MODES + ("both",), default="both")
+    parser.add_argument("--lock-timeout", type=float, default=5.0,
+                        help="seconds a connection waits for a lock before failing")
+    parser.add_argument("--db", help="directory for the database files (default: a temporary directory)")
+    parser.add_argument("--output", help="JSON output path (default: stdout)")
+    args = parser.parse_args(argv)
+
+    modes = MODES if args.mode == "both" else (args.mode,)
+    report: Dict[str, Any] = {"meta": {key: getattr(args, key) for key in
+                                       ("readers", "writers", "duration", "rows", "departments",
+                                        "seed", "lock_timeout")}}
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = args.db or tmp
+        os.makedirs(directory, exist_ok=True)
+        # Generate once so every mode starts from the same data
+        template = os.path.join(directory, "contention-template.db")
+        remove_database(template)
+        db_manager = DatabaseManager(template)
+        populate(db_manager, args.rows, args.departments, args.seed)
+        db_manager.close()
+        for mode in modes:
+            db_path = os.path.join(directory, f"contention-{mode}.db")
+            _prepare(db_path, mode, template)
+            result = run_contention(db_path, mode, args.readers, args.writers, args.duration,
+                                    args.rows, args.departments, args.lock_timeout, args.seed)
+            report[mode] = result
+            for role in ("readers", "writers"):
+                stats = result[role]
+                p99 = stats.get("latency", {}).get("p99_ms", float("nan"))
+                print(f"{mode:<8} {role:<8} {stats['throughput_ops_per_sec']:>10.1f} ops/s  "
+                      f"p99 {p99:>9.3f} ms  lock errors {stats['lock_errors']:>6} "
+                      f"({stats['lock_error_rate']:.2%})  retries {stats['retries']}", file=sys.stderr)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
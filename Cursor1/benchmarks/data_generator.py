@@ -0,0 +1,90 @@
+import os
+import random
+from datetime import date, timedelta
+from itertools import islice
+from typing import Iterator, List, Tuple
+from data_access.database import DatabaseManager
+
+FIRST_NAMES = [
+    "Alice", "Bob", "Carol", "David", "Erin", "Frank", "Grace", "Heidi", "Ivan", "Judy",
+    "Karl", "Laura", "Mallory", "Niaj", "Olivia", "Peggy", "Quentin", "Rupert", "Sybil",
+    "Trent", "Uma", "Victor", "Walter", "Xena", "Yusuf", "Zoe", "LaQuisha", "Mateo", "Priya", "Chen",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Lee", "Kim", "Garcia", "Martinez", "Brown", "Davis", "Lopez", "Wilson",
+    "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Thompson", "White", "Harris",
+    "Clark", "Lewis", "Robinson", "Walker", "Young", "Allen", "Wright", "Scott", "Nguyen", "Patel", "Singh",
+]
+DEPARTMENT_NAMES = [
+    "HR", "Engineering", "Sales", "Marketing", "Finance", "Legal", "Support", "Operations",
+    "Research", "Design", "Security", "Facilities", "Procurement", "Training", "Analytics",
+]
+
+HIRE_START = date(2000, 1, 1)
+HIRE_DAYS = (date(2025, 12, 31) - HIRE_START).days
+INSERT_CHUNK = 10000
+
+def generate_departments(count: int) -> List[Tuple[int, str]]:
+    """Deterministic (id, name) department rows."""
+    return [(i + 1, DEPARTMENT_NAMES[i % len(DEPARTMENT_NAMES)]
+             + ("" if i < len(DEPARTMENT_NAMES) else f" {i // len(DEPARTMENT_NAMES) + 1}"))
+            for i in range(count)]
+
+def generate_employees(rows: int, department_count: int, seed: int) -> Iterator[Tuple]:
+    """Yield (name, department_id, salary, hire_date) rows for a given seed."""
+    rng = random.Random(seed)
+    for _ in range(rows):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        department_id = rng.randint(1, department_count)
+        salary = round(rng.lognormvariate(11.1, 0.35), 2)
+        hire_date = (HIRE_START + timedelta(days=rng.randrange(HIRE_DAYS))).isoformat()
+        yield name, department_id, salary, hire_date
+
+def remove_database(db_path: str):
+    """Delete a database file and its journal, WAL and shared-memory files."""
+    for path in (db_path, db_path + "-journal", db_path + "-wal", db_path + "-shm"):
+        if os.path.exists(path):
+            os.remove(path)
+
+def populate(db_manager: DatabaseManager, rows: int, departments: int = 15, seed: int = 42):
+    """Replace the contents of a database with a synthetic data set.
+
+    Employee IDs are 1..rows, which the scenarios rely on. The FTS and
+    changelog triggers are dropped while loading and recreated afterwards,
+    with the name index rebuilt in one pass, so the load does not pay
+    per-row trigger costs and leaves an empty changelog behind.
+    """
+    with db_manager.get_connection() as conn:
+        triggers = conn.execute("""
+            SELECT name, sql FROM sqlite_master
+            WHERE type = 'trigger' AND tbl_name IN ('employees', 'departments')
+        """).fetchall()
+        for name, _ in triggers:
+            conn.execute(f"DROP TRIGGER {name}")
+        try:
+            conn.execute("DELETE FROM employees")
+            conn.execute("DELETE FROM departments")
+            # AUTOINCREMENT never reuses IDs unless its sequence is reset
+            conn.execute("DELETE FROM changelog")
+            conn.execute("DELETE FROM sqlite_sequence WHERE name IN ('employees', 'departments', 'changelog')")
+            conn.execute("UPDATE changelog_state SET purged_through = 0")
+            conn.executemany("INSERT INTO departments (id, name) VALUES (?, ?)",
+                             generate_departments(departments))
+            conn.commit()
+            employees = generate_employees(rows, departments, seed)
+            while True:
+                chunk = list(islice(employees, INSERT_CHUNK))
+                if not chunk:
+                    break
+                conn.executemany("""
+                    INSERT INTO employees (name, department_id, salary, hire_date)
+                    VALUES (?, ?, ?, ?)
+                """, chunk)
+                conn.commit()
+        finally:
+            if db_manager.fts_enabled:
+                conn.execute("INSERT INTO employees_fts (employees_fts) VALUES ('rebuild')")
+            for _, sql in triggers:
+                conn.execute(sql)
+            conn.commit()
+        conn.execute("ANALYZE")
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark runner.
+
+    python -m benchmarks.runner run --rows 100000 --seed 42 --output results.json
+    python -m benchmarks.runner compare baseline.json results.json --threshold 0.10
+
+`run` builds (or reuses) a synthetic database, times every scenario and
+writes JSON with latency percentiles. `compare` reports per-scenario p50
+changes between two result files and exits non-zero on regressions.
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import sqlite3
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from data_access.analytics import percentile
+from data_access.database import DatabaseManager
+from benchmarks.data_generator import populate, remove_database
+from benchmarks.scenarios import SCENARIOS, BenchmarkContext
+
+def summarize(durations: List[float]) -> Dict[str, Any]:
+    """Latency statistics in milliseconds for one scenario."""
+    ordered = sorted(durations)
+    total = sum(ordered)
+    return {
+        "iterations": len(ordered),
+        "mean_ms": total / len(ordered) * 1000,
+        "min_ms": ordered[0] * 1000,
+        "p50_ms": percentile(ordered, 0.5) * 1000,
+        "p90_ms": percentile(ordered, 0.9) * 1000,
+        "p99_ms": percentile(ordered, 0.99) * 1000,
+        "max_ms": ordered[-1] * 1000,
+        "ops_per_sec": len(ordered) / total if total else None,
+    }
+
+def run_benchmarks(db_path: str, rows: int, departments: int, seed: int, iterations: int,
+                   warmup: int, only: Optional[str] = None, reuse: bool = False) -> Dict[str, Any]:
+    """Populate the database if needed, then time each scenario."""
+    if not reuse:
+        # A fresh file keeps IDs at 1..rows
+        remove_database(db_path)
+    db_manager = DatabaseManager(db_path)
+    started = time.perf_counter()
+    if not reuse:
+        populate(db_manager, rows, departments, seed)
+    setup_seconds = time.perf_counter() - started
+
+    startup = db_manager.startup_timings
+    ctx = BenchmarkContext(db_manager, rows, departments, seed)
+    pattern = re.compile(only) if only else None
+    results: Dict[str, Any] = {}
+    for scenario in SCENARIOS:
+        if pattern and not pattern.search(scenario.name):
+            continue
+        if not scenario.available(ctx):
+            results[scenario.name] = {"skipped": "dependency not available"}
+            continue
+        count = max(1, iterations // 10) if scenario.heavy else iterations
+        for _ in range(0 if scenario.heavy else warmup):
+            scenario.run(ctx)
+        durations = []
+        for _ in range(count):
+            start = time.perf_counter()
+            scenario.run(ctx)
+            durations.append(time.perf_counter() - start)
+        results[scenario.name] = summarize(durations)
+        print(f"{scenario.name:<50} p50 {results[scenario.name]['p50_ms']:>10.3f} ms", file=sys.stderr)
+    db_manager.close()
+
+    return {
+        "meta": {
+            "rows": rows,
+            "departments": departments,
+            "seed": seed,
+            "iterations": iterations,
+            "setup_seconds": setup_seconds,
+            "startup": startup,
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float,
+            metric: str = "p50_ms") -> List[Dict[str, Any]]:
+    """Per-scenario change in `metric`; `regression` is set past `threshold`."""
+    rows = []
+    for name, base in baseline["results"].items():
+        new = current["results"].get(name)
+        if not new or metric not in base or metric not in new:
+            continue
+        change = (new[metric] - base[metric]) / base[metric] if base[metric] else 0.0
+        rows.append({"scenario": name, "baseline": base[metric], "current": new[metric],
+                     "change": change, "regression": change > threshold})
+    return rows
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Employee database benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run benchmarks and write JSON results")
+    run_parser.add_argument("--rows", type=int, default=10000)
+    run_parser.add_argument("--departments", type=int, default=15)
+    run_parser.add_argument("--seed", type=int, default=42)
+    run_parser.add_argument("--iterations", type=int, default=50)
+    run_parser.add_argument("--warmup", type=int, default=3)
+    run_parser.add_argument("--db", help="database file (default: a temporary file)")
+    run_parser.add_argument("--reuse", action="store_true", help="reuse --db without regenerating data")
+    run_parser.add_argument("--only", help="regex selecting scenario names")
+    run_parser.add_argument("--output", help="JSON output path (default: stdout)")
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="relative slowdown counted as a regression")
+    compare_parser.add_argument("--metric", default="p50_ms")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        if args.reuse and not args.db:
+            parser.error("--reuse requires --db")
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = args.db or os.path.join(tmp, "benchmark.db")
+            report = run_benchmarks(db_path, args.rows, args.departments, args.seed,
+                                    args.iterations, args.warmup, args.only, args.reuse)
+        output = json.dumps(report, indent=2)
+        if args.output:
+            with open(args.output, "w") as f:
+                f.write(output + "\n")
+        else:
+            print(output)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    rows = compare(baseline, current, args.threshold, args.metric)
+    print(f"{'Scenario':<50} {'Baseline':>10} {'Current':>10} {'Change':>8}")
+    print("-" * 81)
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(f"{row['scenario']:<50} {row['baseline']:>10.3f} {row['current']:>10.3f} "
+              f"{row['change']:>+8.1%}{flag}")
+    regressions = sum(row["regression"] for row in rows)
+    print(f"\n{regressions} regression(s) beyond {args.threshold:.0%} in {args.metric}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+import os
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+from models.employee import Employee
+from data_access.database import DatabaseManager, EmployeeDAO, DepartmentDAO
+from controllers.employee_controller import EmployeeController
+from benchmarks.data_generator import FIRST_NAMES, LAST_NAMES, generate_employees
+
+BATCH_SIZE = 1000
+NAME_FRAGMENTS = [name[:4] for name in FIRST_NAMES + LAST_NAMES]
+
+class BenchmarkContext:
+    """Shared DAOs, controller and deterministic randomness for scenarios."""
+
+    def __init__(self, db_manager: DatabaseManager, rows: int, departments: int, seed: int):
+        self.db_manager = db_manager
+        self.rows = rows
+        self.departments = departments
+        self.seed = seed
+        self.rng = random.Random(seed + 1)
+        self.employee_dao = EmployeeDAO(db_manager)
+        self.department_dao = DepartmentDAO(db_manager)
+        self.controller = EmployeeController(db_manager)
+        self.created_ids: List[int] = []
+        self.mcp_server = None
+
+    def random_id(self) -> int:
+        return self.rng.randint(1, self.rows)
+
+    def random_department(self) -> int:
+        return self.rng.randint(1, self.departments)
+
+    def random_fragment(self) -> str:
+        return self.rng.choice(NAME_FRAGMENTS)
+
+    def random_employee(self, employee_id: Optional[int] = None) -> Employee:
+        name, department_id, salary, hire_date = next(generate_employees(1, self.departments, self.rng.random()))
+        return Employee(id=employee_id, name=name, department_id=department_id,
+                        salary=salary, hire_date=hire_date)
+
+    def load_mcp_server(self):
+        """Import the MCP server against this database; None if `mcp` is unavailable.
+
+        Its result cache is disabled, since repeated statements would
+        otherwise time cache hits rather than the queries.
+        """
+        if self.mcp_server is None:
+            os.environ["SQLITE_DB_PATH"] = os.path.abspath(self.db_manager.db_path)
+            os.environ["SQLITE_RESULT_CACHE_BYTES"] = "0"
+            try:
+                import sqlite_mcp_server
+            except ImportError:
+                return None
+            self.mcp_server = sqlite_mcp_server
+        return self.mcp_server
+
+@dataclass
+class Scenario:
+    """One timed operation. Heavy scenarios touch whole tables and run fewer iterations.
+
+    Write scenarios go through the FTS and changelog triggers, so their
+    timings include trigger maintenance, as production writes do.
+    """
+    name: str
+    run: Callable[[BenchmarkContext], Any]
+    heavy: bool = False
+    available: Callable[[BenchmarkContext], bool] = lambda ctx: True
+
+def _create(ctx: BenchmarkContext):
+    ctx.created_ids.append(ctx.employee_dao.create(ctx.random_employee()))
+
+def _delete(ctx: BenchmarkContext):
+    ctx.employee_dao.delete(ctx.created_ids.pop() if ctx.created_ids else ctx.random_id())
+
+def _create_many(ctx: BenchmarkContext):
+    ctx.employee_dao.create_many(ctx.random_employee() for _ in range(BATCH_SIZE))
+
+def _delete_many(ctx: BenchmarkContext):
+    start = ctx.rows + 1 + ctx.rng.randrange(BATCH_SIZE * 10)
+    ctx.employee_dao.delete_many(range(start, start + BATCH_SIZE))
+
+def _update_many(ctx: BenchmarkContext):
+    ctx.employee_dao.update_many(ctx.random_employee(ctx.random_id()) for _ in range(BATCH_SIZE))
+
+def _upsert_many(ctx: BenchmarkContext):
+    ctx.employee_dao.upsert_many(ctx.random_employee(ctx.random_id() if i % 2 else None)
+                                 for i in range(BATCH_SIZE))
+
+def _first_page_cursor(ctx: BenchmarkContext):
+    page = ctx.controller.get_employee_page(page_size=50)
+    return ctx.controller.get_employee_page(page.next_cursor, page_size=50)
+
+def _mcp_available(ctx: BenchmarkContext) -> bool:
+    return ctx.load_mcp_server() is not None
+
+SCENARIOS: List[Scenario] = [
+    # EmployeeDAO
+    Scenario("EmployeeDAO.read", lambda ctx: ctx.employee_dao.read(ctx.random_id())),
+    Scenario("EmployeeDAO.read_all", lambda ctx: ctx.employee_dao.read_all(), heavy=True),
+    Scenario("EmployeeDAO.read_page", lambda ctx: ctx.employee_dao.read_page(page_size=100)),
+    Scenario("EmployeeDAO.iter_all", lambda ctx: sum(1 for _ in ctx.employee_dao.iter_all()), heavy=True),
+    Scenario("EmployeeDAO.search_by_name", lambda ctx: ctx.employee_dao.search_by_name(ctx.random_fragment()), heavy=True),
+    Scenario("EmployeeDAO.iter_search_by_name",
+             lambda ctx: next(iter(ctx.employee_dao.iter_search_by_name(ctx.random_fragment(), 50)), None)),
+    Scenario("EmployeeDAO.search_by_name_with_department",
+             lambda ctx: ctx.employee_dao.search_by_name_with_department(ctx.random_fragment()), heavy=True),
+    Scenario("EmployeeDAO.search_ranked", lambda ctx: ctx.employee_dao.search_ranked(ctx.random_fragment())),
+    Scenario("EmployeeDAO.read_with_department", lambda ctx: ctx.employee_dao.read_with_department(ctx.random_id())),
+    Scenario("EmployeeDAO.read_page_with_department",
+             lambda ctx: ctx.employee_dao.read_page_with_department(page_size=100, department_id=ctx.random_department())),
+    Scenario("EmployeeDAO.read_all_with_department",
+             lambda ctx: ctx.employee_dao.read_all_with_department(ctx.random_department()), heavy=True),
+    Scenario("EmployeeDAO.read_batch", lambda ctx: ctx.employee_dao.read_batch(), heavy=True),
+    Scenario("EmployeeDAO.iter_batches", lambda ctx: sum(len(b) for b in ctx.employee_dao.iter_batches()), heavy=True),
+    Scenario("EmployeeDAO.update", lambda ctx: ctx.employee_dao.update(ctx.random_employee(ctx.random_id()))),
+    Scenario("EmployeeDAO.create", _create),
+    Scenario("EmployeeDAO.delete", _delete),
+    Scenario("EmployeeDAO.create_many", _create_many),
+    Scenario("EmployeeDAO.update_many", _update_many),
+    Scenario("EmployeeDAO.upsert_many", _upsert_many),
+    Scenario("EmployeeDAO.delete_many", _delete_many),
+    # DepartmentDAO
+    Scenario("DepartmentDAO.read", lambda ctx: ctx.department_dao.read(ctx.random_department())),
+    Scenario("DepartmentDAO.read_all", lambda ctx: ctx.department_dao.read_all()),
+    Scenario("DepartmentDAO.existing_ids",
+             lambda ctx: ctx.department_dao.existing_ids(range(1, ctx.departments + 1))),
+    # EmployeeController
+    Scenario("EmployeeController.create_employee",
+             lambda ctx: ctx.controller.create_employee("Bench Mark", ctx.random_department(), 50000.0, "2024-01-01")),
+    Scenario("EmployeeController.get_employee", lambda ctx: ctx.controller.get_employee(ctx.random_id())),
+    Scenario("EmployeeController.get_all_employees", lambda ctx: ctx.controller.get_all_employees(), heavy=True),
+    Scenario("EmployeeController.get_employee_page", _first_page_cursor),
+    Scenario("EmployeeController.get_employee_with_department",
+             lambda ctx: ctx.controller.get_employee_with_department(ctx.random_id())),
+    Scenario("EmployeeController.update_employee",
+             lambda ctx: ctx.controller.update_employee(ctx.random_id(), "Bench Mark", ctx.random_department(),
+                                                        60000.0, "2024-01-01")),
+    Scenario("EmployeeController.search_employees",
+             lambda ctx: ctx.controller.search_employees(ctx.random_fragment()), heavy=True),
+    Scenario("EmployeeController.search_employees_ranked",
+             lambda ctx: ctx.controller.search_employees_ranked(ctx.random_fragment())),
+    Scenario("EmployeeController.get_all_departments", lambda ctx: ctx.controller.get_all_departments()),
+    Scenario("EmployeeController.get_department", lambda ctx: ctx.controller.get_department(ctx.random_department())),
+    Scenario("EmployeeController.create_employees",
+             lambda ctx: ctx.controller.create_employees(ctx.random_employee() for _ in range(BATCH_SIZE))),
+    # MCP server
+    Scenario("mcp.execute_query.point",
+             lambda ctx: ctx.mcp_server.execute_query(f"SELECT * FROM employees WHERE id = {ctx.random_id()}"),
+             available=_mcp_available),
+    Scenario("mcp.execute_query.aggregate",
+             lambda ctx: ctx.mcp_server.execute_query(
+                 "SELECT department_id, COUNT(*), AVG(salary) FROM employees GROUP BY department_id"),
+             available=_mcp_available),
+    Scenario("mcp.execute_query.page",
+             lambda ctx: ctx.mcp_server.execute_query(
+                 f"SELECT * FROM employees WHERE name LIKE '{ctx.random_fragment()}%'", max_rows=100),
+             available=_mcp_available),
+]
+
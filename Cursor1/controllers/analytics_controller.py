@@ -0,0 +1,43 @@
+from typing import List, Optional, Sequence
+from models.analytics import DepartmentPayroll, HireCohort, SalaryBucket
+from data_access.database import DatabaseManager
+from data_access.analytics import PayrollAnalyticsDAO, DEFAULT_PERCENTILES
+
+class AnalyticsController:
+    """Controller for payroll reporting."""
+
+    def __init__(self, db_manager: Optional[DatabaseManager] = None):
+        self.db_manager = db_manager or DatabaseManager()
+        self.analytics_dao = PayrollAnalyticsDAO(self.db_manager)
+
+    def get_department_payroll(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> List[DepartmentPayroll]:
+        """Get salary statistics for every department."""
+        try:
+            return self.analytics_dao.department_payroll(percentiles)
+        except Exception as e:
+            print(f"Error computing department payroll: {e}")
+            return []
+
+    def get_overall_payroll(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Optional[DepartmentPayroll]:
+        """Get salary statistics across the whole company."""
+        try:
+            return self.analytics_dao.overall_payroll(percentiles)
+        except Exception as e:
+            print(f"Error computing payroll summary: {e}")
+            return None
+
+    def get_hire_cohorts(self, granularity: str = "year") -> List[HireCohort]:
+        """Get headcount and salary totals by hire year or month."""
+        try:
+            return self.analytics_dao.hire_cohorts(granularity)
+        except Exception as e:
+            print(f"Error computing hire cohorts: {e}")
+            return []
+
+    def get_salary_histogram(self, bins: int = 10, department_id: Optional[int] = None) -> List[SalaryBucket]:
+        """Get a salary histogram, optionally for one department."""
+        try:
+            return self.analytics_dao.salary_histogram(bins, department_id)
+        except Exception as e:
+            print(f"Error computing salary histogram: {e}")
+            return []
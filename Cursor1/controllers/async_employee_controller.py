@@ -0,0 +1,101 @@
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+from models.employee import Employee, Department, EmployeeWithDepartment
+from models.employee_batch import EmployeeBatch
+from data_access.database import DatabaseManager, EmployeeCursor, DEFAULT_DB_PATH, DEFAULT_PAGE_SIZE
+from data_access.async_database import AsyncDatabaseExecutor
+from data_access.concurrency import ConcurrencyMode
+from controllers.employee_controller import EmployeeController, BatchResult, EmployeePage
+
+class AsyncEmployeeController:
+    """Async counterpart of EmployeeController for use inside event loops.
+
+    Every operation runs the synchronous controller logic on a bounded
+    worker pool. Pass a ConcurrencyMode to switch the file to WAL so reads
+    also proceed in parallel with a write; like everywhere else this is
+    opt-in, because the journal mode is stored in the database file.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, max_workers: int = 4,
+                 concurrency: Optional[ConcurrencyMode] = None):
+        self.executor = AsyncDatabaseExecutor(
+            DatabaseManager(db_path, pool_size=max_workers, concurrency=concurrency),
+            max_workers=max_workers)
+        self.controller = EmployeeController(self.executor.db_manager)
+
+    async def __aenter__(self) -> "AsyncEmployeeController":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    async def create_employee(self, name: str, department_id: int, salary: float, hire_date: str) -> bool:
+        return await self.executor.run(self.controller.create_employee, name, department_id, salary, hire_date)
+
+    async def get_employee(self, employee_id: int) -> Optional[Employee]:
+        return await self.executor.run(self.controller.get_employee, employee_id)
+
+    async def get_all_employees(self) -> List[Employee]:
+        return await self.executor.run(self.controller.get_all_employees)
+
+    async def get_employee_page(self, cursor: Optional[EmployeeCursor] = None,
+                                page_size: int = DEFAULT_PAGE_SIZE,
+                                name_pattern: Optional[str] = None) -> EmployeePage:
+        return await self.executor.run(self.controller.get_employee_page, cursor, page_size, name_pattern)
+
+    async def iter_employees(self, page_size: int = DEFAULT_PAGE_SIZE) -> AsyncIterator[Employee]:
+        """Stream all employees ordered by name in bounded memory."""
+        page = await self.get_employee_page(page_size=page_size)
+        while True:
+            for employee in page.employees:
+                yield employee
+            if not page.has_more:
+                return
+            page = await self.get_employee_page(page.next_cursor, page_size)
+
+    async def get_employee_with_department(self, employee_id: int) -> Optional[EmployeeWithDepartment]:
+        return await self.executor.run(self.controller.get_employee_with_department, employee_id)
+
+    async def get_employees_with_department(self, department_id: Optional[int] = None) -> List[EmployeeWithDepartment]:
+        return await self.executor.run(self.controller.get_employees_with_department, department_id)
+
+    async def get_employee_batch(self, department_id: Optional[int] = None) -> EmployeeBatch:
+        return await self.executor.run(self.controller.get_employee_batch, department_id)
+
+    async def update_employee(self, employee_id: int, name: str, department_id: int,
+                              salary: float, hire_date: str) -> bool:
+        return await self.executor.run(self.controller.update_employee, employee_id, name,
+                                       department_id, salary, hire_date)
+
+    async def delete_employee(self, employee_id: int) -> bool:
+        return await self.executor.run(self.controller.delete_employee, employee_id)
+
+    async def create_employees(self, employees: Iterable[Employee]) -> BatchResult:
+        return await self.executor.run(self.controller.create_employees, list(employees))
+
+    async def update_employees(self, employees: Iterable[Employee]) -> BatchResult:
+        return await self.executor.run(self.controller.update_employees, list(employees))
+
+    async def upsert_employees(self, employees: Iterable[Employee]) -> BatchResult:
+        return await self.executor.run(self.controller.upsert_employees, list(employees))
+
+    async def delete_employees(self, employee_ids: Iterable[int]) -> BatchResult:
+        return await self.executor.run(self.controller.delete_employees, list(employee_ids))
+
+    async def search_employees(self, name_pattern: str) -> List[Employee]:
+        return await self.executor.run(self.controller.search_employees, name_pattern)
+
+    async def search_employees_ranked(self, term: str, limit: int = 20) -> List[Employee]:
+        return await self.executor.run(self.controller.search_employees_ranked, term, limit)
+
+    async def get_all_departments(self) -> List[Department]:
+        return await self.executor.run(self.controller.get_all_departments)
+
+    async def get_department(self, department_id: int) -> Optional[Department]:
+        return await self.executor.run(self.controller.get_department, department_id)
+
+    def department_cache_stats(self) -> Dict[str, Any]:
+        return self.controller.department_cache_stats()
+
+    def close(self):
+        """Wait for in-flight calls and close all worker connections."""
+        self.executor.shutdown()
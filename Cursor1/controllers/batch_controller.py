@@ -0,0 +1,212 @@
+import csv
+import json
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, asdict
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+from models.employee import Employee
+from data_access.database import DEFAULT_CHUNK_SIZE
+from controllers.employee_controller import EmployeeController
+
+BATCH_OPERATIONS = ("add", "update", "delete", "search")
+
+CSV_FIELDS = ["op", "id", "name", "department_id", "salary", "hire_date"]
+
+@dataclass
+class BatchCommand:
+    """One parsed line of a batch script; `error` is set when it failed to parse."""
+    line: int
+    op: str = ""
+    employee_id: Optional[int] = None
+    name: Optional[str] = None
+    department_id: Optional[int] = None
+    salary: Optional[float] = None
+    hire_date: Optional[str] = None
+    error: Optional[str] = None
+
+    def to_employee(self) -> Employee:
+        return Employee(id=self.employee_id, name=self.name, department_id=self.department_id,
+                        salary=self.salary, hire_date=self.hire_date)
+
+    def merge_into(self, employee: Employee) -> Employee:
+        """The given row with every field this command sets replaced."""
+        return Employee(id=employee.id,
+                        name=employee.name if self.name is None else self.name,
+                        department_id=employee.department_id if self.department_id is None else self.department_id,
+                        salary=employee.salary if self.salary is None else self.salary,
+                        hire_date=employee.hire_date if self.hire_date is None else self.hire_date)
+
+def _optional(value: Any, convert) -> Any:
+    return None if value is None or value == "" else convert(value)
+
+def parse_command(line: int, fields: Dict[str, Any]) -> BatchCommand:
+    """Validate one record from a JSONL or CSV script."""
+    command = BatchCommand(line=line, op=str(fields.get("op") or "").strip().lower())
+    try:
+        command.employee_id = _optional(fields.get("id"), int)
+        command.name = _optional(fields.get("name", fields.get("pattern")), str)
+        command.department_id = _optional(fields.get("department_id"), int)
+        command.salary = _optional(fields.get("salary"), float)
+        command.hire_date = _optional(fields.get("hire_date"), str)
+    except (TypeError, ValueError) as e:
+        command.error = f"invalid field: {e}"
+        return command
+    if command.op not in BATCH_OPERATIONS:
+        command.error = f"unknown op {command.op!r}"
+    elif command.op in ("update", "delete") and command.employee_id is None:
+        command.error = f"{command.op} requires id"
+    elif command.op == "add" and not (command.name and command.department_id is not None
+                                      and command.salary is not None):
+        command.error = "add requires name, department_id and salary"
+    elif command.op == "update" and all(value is None for value in (
+            command.name, command.department_id, command.salary, command.hire_date)):
+        command.error = "update requires at least one of name, department_id, salary and hire_date"
+    elif command.op == "search" and not command.name:
+        command.error = "search requires name"
+    return command
+
+def read_jsonl(stream: TextIO) -> Iterator[BatchCommand]:
+    """Parse one JSON object per line, skipping blank lines."""
+    for line_number, text in enumerate(stream, 1):
+        if not text.strip():
+            continue
+        try:
+            fields = json.loads(text)
+        except json.JSONDecodeError as e:
+            yield BatchCommand(line=line_number, error=f"invalid JSON: {e.msg}")
+            continue
+        if not isinstance(fields, dict):
+            yield BatchCommand(line=line_number, error="expected a JSON object")
+            continue
+        yield parse_command(line_number, fields)
+
+def read_csv(stream: TextIO) -> Iterator[BatchCommand]:
+    """Parse CSV rows with a header naming the CSV_FIELDS columns."""
+    reader = csv.DictReader(stream)
+    for fields in reader:
+        yield parse_command(reader.line_num, fields)
+
+class BatchController:
+    """Runs a stream of add/update/delete/search commands non-interactively.
+
+    Commands are taken `chunk_size` at a time. Department IDs are validated
+    and the rows being updated are loaded with one lookup per chunk, and
+    writes go through the controller's write-behind queue, so each chunk is
+    group-committed while every command still gets its own result. Updates
+    only change the fields they give. Searches wait for earlier writes.
+    """
+
+    def __init__(self, controller: EmployeeController, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if controller.write_queue is None:
+            raise ValueError("BatchController requires a controller with a write queue")
+        self.controller = controller
+        self.chunk_size = chunk_size
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._started: Optional[float] = None
+        self._elapsed = 0.0
+
+    def run(self, commands: Iterable[BatchCommand]) -> Iterator[Dict[str, Any]]:
+        """Apply `commands` in order, yielding one result dict per command."""
+        self._started = time.perf_counter()
+        commands = iter(commands)
+        try:
+            while True:
+                chunk = list(islice(commands, self.chunk_size))
+                if not chunk:
+                    return
+                yield from self._run_chunk(chunk)
+        finally:
+            self._elapsed += time.perf_counter() - self._started
+            self._started = None
+
+    def _run_chunk(self, chunk: List[BatchCommand]) -> Iterator[Dict[str, Any]]:
+        known = self.controller.existing_department_ids(
+            command.department_id for command in chunk if command.op in ("add", "update"))
+        # Each updated row as this chunk leaves it; None once deleted
+        current: Dict[int, Optional[Employee]] = dict(self.controller.get_employees(
+            command.employee_id for command in chunk if command.error is None and command.op == "update"))
+        queue = self.controller.write_queue
+        pending: List[Tuple[BatchCommand, Any]] = []
+        added = False
+        for command in chunk:
+            if command.error is not None:
+                pending.append((command, None))
+            elif (command.op in ("add", "update") and command.department_id is not None
+                  and command.department_id not in known):
+                command.error = f"department {command.department_id} does not exist"
+                pending.append((command, None))
+            elif command.op == "add":
+                pending.append((command, queue.create(command.to_employee())))
+                added = True
+            elif command.op == "update":
+                if command.employee_id not in current and added:
+                    # The row may come from an add queued earlier in this chunk
+                    queue.flush()
+                    yield from self._resolve(pending)
+                    pending = []
+                    added = False
+                    current.update(self.controller.get_employees([command.employee_id]))
+                existing = current.get(command.employee_id)
+                if existing is None:
+                    command.error = "employee not found"
+                    pending.append((command, None))
+                else:
+                    employee = command.merge_into(existing)
+                    current[command.employee_id] = employee
+                    pending.append((command, queue.update(employee)))
+            elif command.op == "delete":
+                current[command.employee_id] = None
+                pending.append((command, queue.delete(command.employee_id)))
+            else:
+                # Committing earlier writes first guarantees the search sees them
+                queue.flush()
+                yield from self._resolve(pending)
+                pending = [(command, self.controller.search_employees(command.name))]
+                added = False
+        queue.flush()
+        yield from self._resolve(pending)
+
+    def _resolve(self, pending: List[Tuple[BatchCommand, Any]]) -> Iterator[Dict[str, Any]]:
+        for command, outcome in pending:
+            result: Dict[str, Any] = {"line": command.line, "op": command.op}
+            if command.error is None and isinstance(outcome, Future):
+                try:
+                    value = outcome.result()
+                except Exception as e:
+                    command.error = str(e)
+                else:
+                    if command.op == "add":
+                        result["id"] = value
+                    elif not value:
+                        command.error = "employee not found"
+                    else:
+                        result["id"] = command.employee_id
+            elif command.error is None:
+                result["count"] = len(outcome)
+                result["employees"] = [asdict(employee) for employee in outcome]
+            result["ok"] = command.error is None
+            if command.error is not None:
+                result["error"] = command.error
+            self._count(command.op or "invalid", result["ok"])
+            yield result
+
+    def _count(self, op: str, ok: bool):
+        counts = self._counts.setdefault(op, {"ok": 0, "failed": 0})
+        counts["ok" if ok else "failed"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get per-operation counts, throughput and write-queue batching."""
+        elapsed = self._elapsed
+        if self._started is not None:
+            elapsed += time.perf_counter() - self._started
+        total = sum(c["ok"] + c["failed"] for c in self._counts.values())
+        return {
+            "commands": total,
+            "ok": sum(c["ok"] for c in self._counts.values()),
+            "failed": sum(c["failed"] for c in self._counts.values()),
+            "by_op": {op: dict(counts) for op, counts in self._counts.items()},
+            "elapsed_seconds": elapsed,
+            "commands_per_sec": total / elapsed if elapsed else None,
+            "write_queue": self.controller.write_queue_stats(),
+        }
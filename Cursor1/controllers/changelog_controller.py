@@ -0,0 +1,58 @@
+from typing import Any, Dict, Iterator, List, Optional
+from models.changelog import ChangeBatch, ChangeEntry
+from data_access.database import DatabaseManager, DEFAULT_PAGE_SIZE
+from data_access.changelog import ChangeLogDAO
+
+class ChangeLogController:
+    """Controller for incremental sync from the changelog."""
+
+    def __init__(self, db_manager: Optional[DatabaseManager] = None):
+        self.db_manager = db_manager or DatabaseManager()
+        self.changelog_dao = ChangeLogDAO(self.db_manager)
+
+    def get_changes(self, after_seq: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> ChangeBatch:
+        """Get the next batch of changes; pass its `last_seq` back to continue."""
+        try:
+            return self.changelog_dao.tail(after_seq, limit)
+        except Exception as e:
+            print(f"Error reading changes: {e}")
+            return ChangeBatch(last_seq=after_seq)
+
+    def iter_changes(self, after_seq: int = 0, batch_size: int = DEFAULT_PAGE_SIZE) -> Iterator[List[ChangeEntry]]:
+        """Stream batches of changes after `after_seq` until caught up."""
+        try:
+            yield from self.changelog_dao.iter_since(after_seq, batch_size)
+        except Exception as e:
+            print(f"Error reading changes: {e}")
+
+    def get_latest_seq(self) -> int:
+        """Get the sequence number of the newest change."""
+        try:
+            return self.changelog_dao.latest_seq()
+        except Exception as e:
+            print(f"Error reading changelog: {e}")
+            return 0
+
+    def compact_changelog(self, through_seq: Optional[int] = None) -> int:
+        """Drop superseded entries up to `through_seq` (default: all) and return how many."""
+        try:
+            return self.changelog_dao.compact(through_seq)
+        except Exception as e:
+            print(f"Error compacting changelog: {e}")
+            return 0
+
+    def purge_changelog(self, through_seq: int) -> int:
+        """Drop all entries up to `through_seq` and return how many."""
+        try:
+            return self.changelog_dao.purge(through_seq)
+        except Exception as e:
+            print(f"Error purging changelog: {e}")
+            return 0
+
+    def changelog_stats(self) -> Dict[str, Any]:
+        """Get entry count, retained range and purge watermark."""
+        try:
+            return self.changelog_dao.stats()
+        except Exception as e:
+            print(f"Error reading changelog: {e}")
+            return {}
@@ -1,14 +1,134 @@
-from typing import List, Optional
-from models.employee import Employee, Department
-from data_access.database import EmployeeDAO, DepartmentDAO, DatabaseManager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from models.employee import Employee, Department, EmployeeWithDepartment
+from models.employee_batch import EmployeeBatch
+from data_access.database import (EmployeeDAO, CachedDepartmentDAO, DatabaseManager,
+                                  EmployeeCursor, DEFAULT_CHUNK_SIZE, DEFAULT_PAGE_SIZE)
+from data_access.query import EmployeeQuery, QueryCursor
+from data_access.write_queue import WriteBehindQueue
+from data_access.util import chunks
+from data_access.sharding import ShardedDatabaseManager, ShardedEmployeeDAO
+
+@dataclass
+class BatchResult:
+    """Outcome of a bulk employee operation.
+    
+    Batches commit chunk by chunk, so after an error `written` still counts
+    the rows of the chunks that committed, and `requested` counts the input
+    read up to and including the failed chunk.
+    """
+    requested: int = 0
+    written: int = 0
+    rejected: List[Employee] = field(default_factory=list)
+    error: Optional[str] = None
+    
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+@dataclass
+class EmployeePage:
+    """One page of employees plus the cursor for the next page."""
+    employees: List[Employee]
+    next_cursor: Optional[QueryCursor] = None
+    
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+class EmployeePager:
+    """Page-at-a-time navigation over an EmployeeQuery, with department names.
+
+    Only the current page is held in memory. Pages reached by stepping
+    forward are read with keyset cursors, which are remembered so stepping
+    back is just as cheap; jumping to a page never visited uses an offset.
+    Sorting by a column toggles between ascending and descending and
+    returns to the first page.
+    """
+    
+    def __init__(self, controller: "EmployeeController", query: Optional[EmployeeQuery] = None,
+                 page_size: int = 20):
+        self.controller = controller
+        self.query = (query or EmployeeQuery()).page(None)
+        self.page_size = page_size
+        self.page_number = 1
+        self._reset()
+    
+    def _reset(self):
+        # Cursor each known page starts after; page 1 starts at the beginning
+        self._starts: Dict[int, Optional[QueryCursor]] = {1: None}
+        self._page: Optional[EmployeePage] = None
+        self._total: Optional[int] = None
+    
+    @property
+    def total(self) -> int:
+        """Number of matching employees, counted once per sort order."""
+        if self._total is None:
+            self._total = self.controller.count_employees(self.query)
+        return self._total
+    
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-self.total // self.page_size))
+    
+    def current(self) -> EmployeePage:
+        """The employees on the current page, fetched on first use."""
+        if self._page is None:
+            if self.page_number in self._starts:
+                query = self.query.page(self.page_size).starting_after(self._starts[self.page_number])
+            else:
+                query = self.query.page(self.page_size, (self.page_number - 1) * self.page_size)
+            self._page = self.controller.query_employees(query, with_department=True)
+            if self._page.next_cursor is not None:
+                self._starts[self.page_number + 1] = self._page.next_cursor
+        return self._page
+    
+    def jump(self, page_number: int) -> bool:
+        """Move to `page_number` (1-based); False if it is out of range."""
+        if not 1 <= page_number <= self.page_count:
+            return False
+        if page_number != self.page_number:
+            self.page_number = page_number
+            self._page = None
+        return True
+    
+    def next(self) -> bool:
+        if not self.current().has_more:
+            return False
+        return self.jump(self.page_number + 1)
+    
+    def previous(self) -> bool:
+        return self.jump(self.page_number - 1)
+    
+    def sort_by(self, sort_key: str):
+        """Sort by `sort_key`, or reverse the order if already sorted by it."""
+        descending = not self.query.descending if sort_key == self.query.sort_key else False
+        self.query = self.query.order_by(sort_key, descending)
+        self.page_number = 1
+        self._reset()
 
 class EmployeeController:
     """Controller for handling employee business logic."""
     
-    def __init__(self):
-        self.db_manager = DatabaseManager()
-        self.employee_dao = EmployeeDAO(self.db_manager)
-        self.department_dao = DepartmentDAO(self.db_manager)
+    def __init__(self, db_manager: Optional[DatabaseManager] = None,
+                 write_queue: Optional[WriteBehindQueue] = None):
+        self.db_manager = db_manager or DatabaseManager()
+        if isinstance(self.db_manager, ShardedDatabaseManager):
+            if write_queue is not None:
+                raise ValueError("write_queue is not supported with sharded storage")
+            self.employee_dao = ShardedEmployeeDAO(self.db_manager)
+        else:
+            self.employee_dao = EmployeeDAO(self.db_manager)
+        self.department_dao = CachedDepartmentDAO(self.db_manager)
+        # When set, single-row writes are group-committed by one writer thread
+        self.write_queue = write_queue
+    
+    @classmethod
+    def with_write_queue(cls, db_manager: Optional[DatabaseManager] = None, batch_size: int = 100,
+                         flush_interval: float = 0.005) -> "EmployeeController":
+        """Create a controller whose create/update/delete go through a write-behind queue."""
+        db_manager = db_manager or DatabaseManager()
+        return cls(db_manager, WriteBehindQueue(db_manager, batch_size, flush_interval))
     
     def create_employee(self, name: str, department_id: int, salary: float, hire_date: str) -> bool:
         """Create a new employee."""
@@ -24,7 +144,10 @@ class EmployeeController:
                 hire_date=hire_date
             )
             
-            employee_id = self.employee_dao.create(employee)
+            if self.write_queue is not None:
+                employee_id = self.write_queue.create(employee).result()
+            else:
+                employee_id = self.employee_dao.create(employee)
             return employee_id is not None
         except Exception as e:
             print(f"Error creating employee: {e}")
@@ -38,6 +161,14 @@ class EmployeeController:
             print(f"Error getting employee: {e}")
             return None
     
+    def get_employees(self, employee_ids: Iterable[int]) -> Dict[int, Employee]:
+        """Get the given employees keyed by ID, with one lookup."""
+        try:
+            return self.employee_dao.read_many(employee_ids)
+        except Exception as e:
+            print(f"Error getting employees: {e}")
+            return {}
+    
     def get_all_employees(self) -> List[Employee]:
         """Get all employees."""
         try:
@@ -46,6 +177,94 @@ class EmployeeController:
             print(f"Error getting employees: {e}")
             return []
     
+    def get_employee_page(self, cursor: Optional[EmployeeCursor] = None,
+                          page_size: int = DEFAULT_PAGE_SIZE,
+                          name_pattern: Optional[str] = None) -> EmployeePage:
+        """Get one page of employees ordered by name, starting after `cursor`."""
+        try:
+            # Fetch one extra row to learn whether another page exists
+            employees = self.employee_dao.read_page(cursor, page_size + 1, name_pattern)
+        except Exception as e:
+            print(f"Error getting employees: {e}")
+            return EmployeePage(employees=[])
+        if len(employees) <= page_size:
+            return EmployeePage(employees=employees)
+        employees = employees[:page_size]
+        last = employees[-1]
+        return EmployeePage(employees=employees, next_cursor=(last.name, last.id))
+    
+    def query_employees(self, query: EmployeeQuery, with_department: bool = False) -> EmployeePage:
+        """Get the employees matching a filter/sort/page query.
+        
+        When the query has a limit, `next_cursor` continues after the last
+        row; pass it to `query.starting_after` for the next page. With
+        `with_department` the rows are EmployeeWithDepartment from one join.
+        """
+        read = self.employee_dao.query_with_department if with_department else self.employee_dao.query
+        try:
+            if query.limit is None:
+                return EmployeePage(employees=read(query))
+            # Fetch one extra row to learn whether another page exists
+            employees = read(query.page(query.limit + 1, query.offset))
+        except Exception as e:
+            print(f"Error querying employees: {e}")
+            return EmployeePage(employees=[])
+        if len(employees) <= query.limit:
+            return EmployeePage(employees=employees)
+        employees = employees[:query.limit]
+        return EmployeePage(employees=employees, next_cursor=query.cursor_for(employees[-1]))
+    
+    def count_employees(self, query: EmployeeQuery) -> int:
+        """Count the employees matching a query's filters."""
+        try:
+            return self.employee_dao.count(query)
+        except Exception as e:
+            print(f"Error counting employees: {e}")
+            return 0
+    
+    def pager(self, query: Optional[EmployeeQuery] = None, page_size: int = 20) -> EmployeePager:
+        """Create a pager over the employees matching `query` (default: all, by name)."""
+        return EmployeePager(self, query, page_size)
+    
+    def iter_employees(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Employee]:
+        """Stream all employees ordered by name in bounded memory."""
+        try:
+            yield from self.employee_dao.iter_all(page_size)
+        except Exception as e:
+            print(f"Error getting employees: {e}")
+    
+    def get_employee_with_department(self, employee_id: int) -> Optional[EmployeeWithDepartment]:
+        """Get an employee by ID together with its department name."""
+        try:
+            return self.employee_dao.read_with_department(employee_id)
+        except Exception as e:
+            print(f"Error getting employee: {e}")
+            return None
+    
+    def get_employees_with_department(self, department_id: Optional[int] = None) -> List[EmployeeWithDepartment]:
+        """Get employees with department names, optionally for one department."""
+        try:
+            return self.employee_dao.read_all_with_department(department_id)
+        except Exception as e:
+            print(f"Error getting employees: {e}")
+            return []
+    
+    def iter_employees_with_department(self, department_id: Optional[int] = None,
+                                       page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[EmployeeWithDepartment]:
+        """Stream employees with department names in bounded memory."""
+        try:
+            yield from self.employee_dao.iter_with_department(department_id, page_size)
+        except Exception as e:
+            print(f"Error getting employees: {e}")
+    
+    def get_employee_batch(self, department_id: Optional[int] = None) -> EmployeeBatch:
+        """Get employees as a compact columnar batch for reporting."""
+        try:
+            return self.employee_dao.read_batch(department_id)
+        except Exception as e:
+            print(f"Error getting employees: {e}")
+            return EmployeeBatch()
+    
     def update_employee(self, employee_id: int, name: str, department_id: int, 
                        salary: float, hire_date: str) -> bool:
         """Update an existing employee."""
@@ -62,6 +281,8 @@ class EmployeeController:
                 hire_date=hire_date
             )
             
+            if self.write_queue is not None:
+                return self.write_queue.update(employee).result()
             return self.employee_dao.update(employee)
         except Exception as e:
             print(f"Error updating employee: {e}")
@@ -70,11 +291,62 @@ class EmployeeController:
     def delete_employee(self, employee_id: int) -> bool:
         """Delete an employee."""
         try:
+            if self.write_queue is not None:
+                return self.write_queue.delete(employee_id).result()
             return self.employee_dao.delete(employee_id)
         except Exception as e:
             print(f"Error deleting employee: {e}")
             return False
     
+    def _split_by_department(self, employees: List[Employee]) -> Tuple[List[Employee], List[Employee]]:
+        """Partition employees into (valid, rejected) with one department lookup."""
+        known = self.department_dao.existing_ids(emp.department_id for emp in employees)
+        valid = [emp for emp in employees if emp.department_id in known]
+        rejected = [emp for emp in employees if emp.department_id not in known]
+        return valid, rejected
+    
+    def _run_batch(self, items: Iterable[Any], write: Callable[[List[Any], int], int],
+                   chunk_size: int, validate: bool = True) -> BatchResult:
+        """Apply `write` one chunk at a time, validating each chunk's departments.
+        
+        Each chunk is a single transaction (per shard with sharded storage),
+        so the input is consumed lazily and `written` stays accurate when a
+        later chunk fails. The first error stops the batch and is returned
+        in the result.
+        """
+        result = BatchResult()
+        try:
+            for chunk in chunks(items, chunk_size):
+                result.requested += len(chunk)
+                if validate:
+                    chunk, rejected = self._split_by_department(chunk)
+                    result.rejected.extend(rejected)
+                if chunk:
+                    result.written += write(chunk, chunk_size)
+        except Exception as e:
+            result.error = str(e)
+        return result
+    
+    def create_employees(self, employees: Iterable[Employee],
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> BatchResult:
+        """Create many employees in chunked transactions."""
+        return self._run_batch(employees, self.employee_dao.create_many, chunk_size)
+    
+    def update_employees(self, employees: Iterable[Employee],
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> BatchResult:
+        """Update many employees in chunked transactions."""
+        return self._run_batch(employees, self.employee_dao.update_many, chunk_size)
+    
+    def upsert_employees(self, employees: Iterable[Employee],
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> BatchResult:
+        """Insert or update many employees in chunked transactions."""
+        return self._run_batch(employees, self.employee_dao.upsert_many, chunk_size)
+    
+    def delete_employees(self, employee_ids: Iterable[int],
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> BatchResult:
+        """Delete many employees in chunked transactions."""
+        return self._run_batch(employee_ids, self.employee_dao.delete_many, chunk_size, validate=False)
+    
     def search_employees(self, name_pattern: str) -> List[Employee]:
         """Search employees by name pattern."""
         try:
@@ -83,6 +355,22 @@ class EmployeeController:
             print(f"Error searching employees: {e}")
             return []
     
+    def search_employees_with_department(self, name_pattern: str) -> List[EmployeeWithDepartment]:
+        """Search employees by name pattern, with department names from the same query."""
+        try:
+            return self.employee_dao.search_by_name_with_department(name_pattern)
+        except Exception as e:
+            print(f"Error searching employees: {e}")
+            return []
+    
+    def search_employees_ranked(self, term: str, limit: int = 20) -> List[Employee]:
+        """Search employee names for a substring, best matches first."""
+        try:
+            return self.employee_dao.search_ranked(term, limit)
+        except Exception as e:
+            print(f"Error searching employees: {e}")
+            return []
+    
     def get_all_departments(self) -> List[Department]:
         """Get all departments."""
         try:
@@ -98,3 +386,25 @@ class EmployeeController:
         except Exception as e:
             print(f"Error getting department: {e}")
             return None
+    
+    def existing_department_ids(self, department_ids: Iterable[int]) -> Set[int]:
+        """Get which of `department_ids` exist, with one cached lookup."""
+        try:
+            return self.department_dao.existing_ids(department_ids)
+        except Exception as e:
+            print(f"Error getting departments: {e}")
+            return set()
+    
+    def department_cache_stats(self) -> Dict[str, Any]:
+        """Get department cache hit/miss counters."""
+        return self.department_dao.cache_stats()
+    
+    def write_queue_stats(self) -> Optional[Dict[str, Any]]:
+        """Get write-behind queue counters, or None when writes are direct."""
+        return self.write_queue.stats() if self.write_queue is not None else None
+    
+    def close(self):
+        """Commit any queued writes, then release database resources."""
+        if self.write_queue is not None:
+            self.write_queue.close()
+        self.db_manager.close()
@@ -0,0 +1,129 @@
+from array import array
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, List, Optional, Sequence
+from models.analytics import DepartmentPayroll, HireCohort, SalaryBucket
+from data_access.database import DatabaseManager
+from data_access.instrumentation import instrument_dao
+
+DEFAULT_PERCENTILES = (0.25, 0.5, 0.75, 0.9)
+
+# Length of the hire_date prefix that identifies each cohort period
+COHORT_PREFIX_LENGTHS = {"year": 4, "month": 7}
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> Optional[float]:
+    """Linearly interpolated percentile of an already sorted sequence."""
+    if not sorted_values:
+        return None
+    position = fraction * (len(sorted_values) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    weight = position - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+@instrument_dao
+class PayrollAnalyticsDAO:
+    """Data Access Object for payroll reporting queries.
+
+    Counts, sums and bucketing run in SQL. Order statistics are computed from
+    salary columns that SQLite has already sorted, fetched into typed arrays.
+    """
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
+
+    def department_payroll(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> List[DepartmentPayroll]:
+        """Salary statistics per department, ordered by department name."""
+        with self.db_manager.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT d.id, d.name, COUNT(e.id), TOTAL(e.salary), AVG(e.salary),
+                       MIN(e.salary), MAX(e.salary)
+                FROM departments d
+                LEFT JOIN employees e ON e.department_id = d.id
+                GROUP BY d.id
+                ORDER BY d.name
+            """)
+            reports = [DepartmentPayroll(department_id=row[0], department_name=row[1],
+                                         headcount=row[2], total_salary=row[3], mean_salary=row[4],
+                                         min_salary=row[5], max_salary=row[6])
+                       for row in cursor.fetchall()]
+            cursor.execute("""
+                SELECT department_id, salary FROM employees
+                WHERE salary IS NOT NULL AND department_id IS NOT NULL
+                ORDER BY department_id, salary
+            """)
+            salaries_by_department: Dict[int, array] = {
+                department_id: array("d", map(itemgetter(1), rows))
+                for department_id, rows in groupby(cursor, key=itemgetter(0))
+            }
+        for report in reports:
+            self._fill_order_statistics(report, salaries_by_department.get(report.department_id, ()),
+                                        percentiles)
+        return reports
+
+    def overall_payroll(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> DepartmentPayroll:
+        """Salary statistics across all employees."""
+        with self.db_manager.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT COUNT(*), TOTAL(salary), AVG(salary), MIN(salary), MAX(salary)
+                FROM employees
+            """)
+            row = cursor.fetchone()
+            report = DepartmentPayroll(department_name="All Departments", headcount=row[0],
+                                       total_salary=row[1], mean_salary=row[2],
+                                       min_salary=row[3], max_salary=row[4])
+            cursor.execute("SELECT salary FROM employees WHERE salary IS NOT NULL ORDER BY salary")
+            salaries = array("d", map(itemgetter(0), cursor))
+        self._fill_order_statistics(report, salaries, percentiles)
+        return report
+
+    @staticmethod
+    def _fill_order_statistics(report: DepartmentPayroll, sorted_salaries: Sequence[float],
+                               percentiles: Sequence[float]):
+        report.median_salary = percentile(sorted_salaries, 0.5)
+        report.percentiles = {p: percentile(sorted_salaries, p) for p in percentiles} if sorted_salaries else {}
+
+    def hire_cohorts(self, granularity: str = "year") -> List[HireCohort]:
+        """Headcount and salary totals grouped by hire year or month."""
+        if granularity not in COHORT_PREFIX_LENGTHS:
+            raise ValueError(f"granularity must be one of {sorted(COHORT_PREFIX_LENGTHS)}")
+        length = COHORT_PREFIX_LENGTHS[granularity]
+        with self.db_manager.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT COALESCE(NULLIF(substr(hire_date, 1, ?), ''), 'Unknown') AS period,
+                       COUNT(*), TOTAL(salary), AVG(salary)
+                FROM employees
+                GROUP BY period
+                ORDER BY period
+            """, (length,))
+            return [HireCohort(period=row[0], headcount=row[1], total_salary=row[2], mean_salary=row[3])
+                    for row in cursor.fetchall()]
+
+    def salary_histogram(self, bins: int = 10, department_id: Optional[int] = None) -> List[SalaryBucket]:
+        """Count salaries in `bins` equal-width buckets between the min and max salary."""
+        if bins < 1:
+            raise ValueError("bins must be at least 1")
+        department_filter = "" if department_id is None else "AND department_id = ?"
+        params = () if department_id is None else (department_id,)
+        with self.db_manager.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT MIN(salary), MAX(salary) FROM employees
+                WHERE salary IS NOT NULL {department_filter}
+            """, params)
+            low, high = cursor.fetchone()
+            if low is None:
+                return []
+            width = (high - low) / bins or 1.0
+            cursor.execute(f"""
+                SELECT MIN(CAST((salary - ?) / ? AS INTEGER), ?) AS bucket, COUNT(*)
+                FROM employees
+                WHERE salary IS NOT NULL {department_filter}
+                GROUP BY bucket
+            """, (low, width, bins - 1, *params))
+            counts = dict(cursor.fetchall())
+        return [SalaryBucket(lower=low + i * width, upper=low + (i + 1) * width, count=counts.get(i, 0))
+                for i in range(bins)]
@@ -0,0 +1,134 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, List, Optional, Set
+from models.employee import Employee, Department, EmployeeWithDepartment
+from models.employee_batch import EmployeeBatch
+from data_access.database import (DatabaseManager, EmployeeDAO, DepartmentDAO, EmployeeCursor,
+                                  DEFAULT_CHUNK_SIZE, DEFAULT_PAGE_SIZE)
+
+class AsyncDatabaseExecutor:
+    """Bounded thread pool that runs blocking DAO calls off the event loop.
+
+    Each worker thread pins one pooled connection for its lifetime. Cancelling
+    an awaiting task interrupts the statement running on that worker.
+    """
+
+    def __init__(self, db_manager: DatabaseManager, max_workers: int = 4):
+        if db_manager.pool.max_size < max_workers:
+            raise ValueError("db_manager pool_size must be at least max_workers")
+        self.db_manager = db_manager
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="sqlite-async",
+                                            initializer=db_manager.pool.pin_thread)
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run `func(*args, **kwargs)` on a worker thread and await the result."""
+        loop = asyncio.get_running_loop()
+        state = {"conn": None, "done": False}
+        lock = threading.Lock()
+
+        def call():
+            with lock:
+                state["conn"] = self.db_manager.pool.pinned_connection()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with lock:
+                    state["done"] = True
+
+        try:
+            return await loop.run_in_executor(self._executor, call)
+        except asyncio.CancelledError:
+            # Queued calls are dropped by the executor; a running one is interrupted
+            with lock:
+                if state["conn"] is not None and not state["done"]:
+                    state["conn"].interrupt()
+            raise
+
+    def shutdown(self):
+        """Wait for running calls, then close the workers' connections."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self.db_manager.close()
+
+class AsyncEmployeeDAO:
+    """Async facade over EmployeeDAO."""
+
+    def __init__(self, executor: AsyncDatabaseExecutor):
+        self.executor = executor
+        self.dao = EmployeeDAO(executor.db_manager)
+
+    async def create(self, employee: Employee) -> int:
+        return await self.executor.run(self.dao.create, employee)
+
+    async def read(self, employee_id: int) -> Optional[Employee]:
+        return await self.executor.run(self.dao.read, employee_id)
+
+    async def read_all(self) -> List[Employee]:
+        return await self.executor.run(self.dao.read_all)
+
+    async def update(self, employee: Employee) -> bool:
+        return await self.executor.run(self.dao.update, employee)
+
+    async def delete(self, employee_id: int) -> bool:
+        return await self.executor.run(self.dao.delete, employee_id)
+
+    async def create_many(self, employees: List[Employee], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        return await self.executor.run(self.dao.create_many, list(employees), chunk_size)
+
+    async def update_many(self, employees: List[Employee], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        return await self.executor.run(self.dao.update_many, list(employees), chunk_size)
+
+    async def delete_many(self, employee_ids: List[int], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        return await self.executor.run(self.dao.delete_many, list(employee_ids), chunk_size)
+
+    async def upsert_many(self, employees: List[Employee], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        return await self.executor.run(self.dao.upsert_many, list(employees), chunk_size)
+
+    async def read_page(self, after: Optional[EmployeeCursor] = None,
+                        page_size: int = DEFAULT_PAGE_SIZE,
+                        name_pattern: Optional[str] = None) -> List[Employee]:
+        return await self.executor.run(self.dao.read_page, after, page_size, name_pattern)
+
+    async def iter_all(self, page_size: int = DEFAULT_PAGE_SIZE) -> AsyncIterator[Employee]:
+        """Stream all employees ordered by name, one page per worker call."""
+        after = None
+        while True:
+            page = await self.read_page(after, page_size)
+            for employee in page:
+                yield employee
+            if len(page) < page_size:
+                return
+            after = (page[-1].name, page[-1].id)
+
+    async def search_by_name(self, name_pattern: str) -> List[Employee]:
+        return await self.executor.run(self.dao.search_by_name, name_pattern)
+
+    async def search_ranked(self, term: str, limit: int = 20) -> List[Employee]:
+        return await self.executor.run(self.dao.search_ranked, term, limit)
+
+    async def read_with_department(self, employee_id: int) -> Optional[EmployeeWithDepartment]:
+        return await self.executor.run(self.dao.read_with_department, employee_id)
+
+    async def read_all_with_department(self, department_id: Optional[int] = None) -> List[EmployeeWithDepartment]:
+        return await self.executor.run(self.dao.read_all_with_department, department_id)
+
+    async def read_batch(self, department_id: Optional[int] = None) -> EmployeeBatch:
+        return await self.executor.run(self.dao.read_batch, department_id)
+
+class AsyncDepartmentDAO:
+    """Async facade over DepartmentDAO."""
+
+    def __init__(self, executor: AsyncDatabaseExecutor):
+        self.executor = executor
+        self.dao = DepartmentDAO(executor.db_manager)
+
+    async def read_all(self) -> List[Department]:
+        return await self.executor.run(self.dao.read_all)
+
+    async def read(self, department_id: int) -> Optional[Department]:
+        return await self.executor.run(self.dao.read, department_id)
+
+    async def existing_ids(self, department_ids: List[int]) -> Set[int]:
+        return await self.executor.run(self.dao.existing_ids, list(department_ids))
@@ -0,0 +1,108 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+class VersionedLRUCache:
+    """Thread-safe LRU cache with TTL expiry and version-based invalidation.
+
+    `version_source` is consulted on every lookup; when it reports a value
+    different from the one the entries were loaded under, the whole cache
+    is dropped so a stale entry is never served. Entries are evicted in LRU
+    order once `max_entries` or the optional `max_bytes` budget (measured
+    with `size_of`) is exceeded.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: Optional[float] = 300.0,
+                 version_source: Optional[Callable[[], Any]] = None,
+                 max_bytes: Optional[int] = None,
+                 size_of: Optional[Callable[[Any], int]] = None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes is not None and size_of is None:
+            raise ValueError("size_of is required when max_bytes is set")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.version_source = version_source
+        self.max_bytes = max_bytes
+        self.size_of = size_of
+        # key -> (value, loaded_at, size in bytes)
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._version: Any = None
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0,
+                       "uncacheable": 0}
+
+    def _check_version(self):
+        """Drop all entries if the underlying data changed (lock held)."""
+        if self.version_source is None:
+            return
+        version = self.version_source()
+        if version != self._version:
+            if self._entries:
+                self._stats["invalidations"] += 1
+            self._clear()
+            self._version = version
+
+    def _clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for `key`, calling `loader` on a miss."""
+        with self._lock:
+            self._check_version()
+            version = self._version
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, loaded_at, _ = entry
+                if self.ttl is None or time.monotonic() - loaded_at < self.ttl:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return value
+                self._remove(key)
+            self._stats["misses"] += 1
+
+        value = loader()
+        size = self.size_of(value) if self.size_of is not None else 0
+        with self._lock:
+            if self.max_bytes is not None and size > self.max_bytes:
+                self._stats["uncacheable"] += 1
+                return value
+            # Only keep the value if nothing changed while it was loading
+            if version == self._version:
+                self._remove(key)
+                self._entries[key] = (value, time.monotonic(), size)
+                self._bytes += size
+                while len(self._entries) > self.max_entries or (
+                        self.max_bytes is not None and self._bytes > self.max_bytes):
+                    _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                    self._bytes -= evicted_size
+                    self._stats["evictions"] += 1
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop one entry, or every entry when no key is given."""
+        with self._lock:
+            if key is None:
+                self._clear()
+            else:
+                self._remove(key)
+            self._stats["invalidations"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size in entries and bytes."""
+        with self._lock:
+            snapshot = dict(self._stats)
+            snapshot["size"] = len(self._entries)
+            snapshot["bytes"] = self._bytes
+            snapshot["max_bytes"] = self.max_bytes
+        lookups = snapshot["hits"] + snapshot["misses"]
+        snapshot["hit_rate"] = snapshot["hits"] / lookups if lookups else 0.0
+        return snapshot
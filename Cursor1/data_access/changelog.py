@@ -0,0 +1,116 @@
+import json
+from typing import Any, Dict, Iterator, List, Optional
+from models.changelog import ChangeBatch, ChangeEntry
+from data_access.database import DatabaseManager, DEFAULT_PAGE_SIZE
+from data_access.instrumentation import instrument_dao
+
+# Sequence numbers deleted per transaction by compaction and purging, so
+# other writers get the lock back between windows
+COMPACTION_WINDOW = 10000
+
+CHANGE_COLUMNS = "seq, table_name, row_id, operation, data, changed_at"
+
+def _entry(row) -> ChangeEntry:
+    return ChangeEntry(seq=row[0], table_name=row[1], row_id=row[2], operation=row[3],
+                       data=json.loads(row[4]) if row[4] is not None else None, changed_at=row[5])
+
+@instrument_dao
+class ChangeLogDAO:
+    """Data Access Object for the trigger-maintained changelog.
+
+    Triggers on `employees` and `departments` append one entry per changed
+    row with an increasing `seq`, so a consumer that remembers the last seq
+    it applied can sync by reading only the entries after it. Compaction
+    drops entries superseded by a newer one for the same row; purging drops
+    everything up to a seq and records it, so readers further behind know
+    to reload from the tables instead.
+    """
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db_manager = db_manager
+
+    def latest_seq(self) -> int:
+        """Sequence number of the newest change ever recorded (0 if none)."""
+        with self.db_manager.get_read_connection() as conn:
+            row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'changelog'").fetchone()
+            return row[0] if row else 0
+
+    def purged_through(self) -> int:
+        """Highest sequence number removed by `purge`."""
+        with self.db_manager.get_read_connection() as conn:
+            return conn.execute("SELECT purged_through FROM changelog_state WHERE id = 1").fetchone()[0]
+
+    def read_since(self, after_seq: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> List[ChangeEntry]:
+        """Up to `limit` changes with seq greater than `after_seq`, oldest first."""
+        with self.db_manager.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT {CHANGE_COLUMNS} FROM changelog WHERE seq > ? ORDER BY seq LIMIT ?",
+                           (after_seq, limit))
+            return [_entry(row) for row in cursor.fetchall()]
+
+    def tail(self, after_seq: int = 0, limit: int = DEFAULT_PAGE_SIZE) -> ChangeBatch:
+        """Read the next batch of changes after `after_seq`."""
+        # Fetch one extra entry to learn whether more are waiting
+        changes = self.read_since(after_seq, limit + 1)
+        # Checked after reading, so a purge racing the read is always reported
+        resync_required = after_seq < self.purged_through()
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+        return ChangeBatch(changes=changes, last_seq=changes[-1].seq if changes else after_seq,
+                           has_more=has_more, resync_required=resync_required)
+
+    def iter_since(self, after_seq: int = 0, batch_size: int = DEFAULT_PAGE_SIZE) -> Iterator[List[ChangeEntry]]:
+        """Yield batches of changes after `after_seq` until caught up."""
+        while True:
+            changes = self.read_since(after_seq, batch_size)
+            if not changes:
+                return
+            yield changes
+            if len(changes) < batch_size:
+                return
+            after_seq = changes[-1].seq
+
+    def _delete_windows(self, sql: str, through_seq: int) -> int:
+        """Run a `seq BETWEEN ? AND ?` delete over [oldest, through_seq] window by window."""
+        with self.db_manager.get_read_connection() as conn:
+            oldest = conn.execute("SELECT MIN(seq) FROM changelog").fetchone()[0]
+        if oldest is None:
+            return 0
+        deleted = 0
+        for low in range(oldest, through_seq + 1, COMPACTION_WINDOW):
+            high = min(low + COMPACTION_WINDOW - 1, through_seq)
+            deleted += self.db_manager.run_write(lambda conn: conn.execute(sql, (low, high)).rowcount)
+        return deleted
+
+    def compact(self, through_seq: Optional[int] = None) -> int:
+        """Drop entries up to `through_seq` that a newer entry for the same row supersedes.
+
+        Readers at any position still converge to the current rows; they
+        just skip intermediate versions. Returns the number of entries removed.
+        """
+        if through_seq is None:
+            through_seq = self.latest_seq()
+        return self._delete_windows("""
+            DELETE FROM changelog
+            WHERE seq BETWEEN ? AND ?
+              AND EXISTS (SELECT 1 FROM changelog newer
+                          WHERE newer.table_name = changelog.table_name
+                            AND newer.row_id = changelog.row_id
+                            AND newer.seq > changelog.seq)
+        """, through_seq)
+
+    def purge(self, through_seq: int) -> int:
+        """Delete every entry up to `through_seq`, e.g. once all consumers are past it."""
+        # Record the watermark first so readers never miss entries silently
+        self.db_manager.run_write(lambda conn: conn.execute(
+            "UPDATE changelog_state SET purged_through = MAX(purged_through, ?) WHERE id = 1",
+            (through_seq,)))
+        return self._delete_windows("DELETE FROM changelog WHERE seq BETWEEN ? AND ?", through_seq)
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, retained seq range and purge watermark."""
+        with self.db_manager.get_read_connection() as conn:
+            count, oldest, newest = conn.execute(
+                "SELECT COUNT(*), MIN(seq), MAX(seq) FROM changelog").fetchone()
+            purged = conn.execute("SELECT purged_through FROM changelog_state WHERE id = 1").fetchone()[0]
+        return {"entries": count, "oldest_seq": oldest, "newest_seq": newest, "purged_through": purged}
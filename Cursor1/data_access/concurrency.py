@@ -0,0 +1,105 @@
+import random
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+# Messages SQLite uses for SQLITE_BUSY and SQLITE_LOCKED
+LOCK_ERROR_MESSAGES = ("database is locked", "database table is locked", "database schema is locked")
+
+def is_lock_error(error: BaseException) -> bool:
+    """Whether an error means another connection held a lock, so a retry may succeed."""
+    return isinstance(error, sqlite3.OperationalError) and str(error).startswith(LOCK_ERROR_MESSAGES)
+
+@dataclass
+class ConcurrencyMode:
+    """Opt-in settings for several processes writing one database file.
+
+    WAL lets readers proceed while one writer commits. Write transactions
+    start with BEGIN IMMEDIATE, so they take the write lock up front and
+    wait up to `busy_timeout_ms` for it instead of failing when a deferred
+    read lock cannot be upgraded. A transaction that still finds the
+    database locked is retried up to `max_retries` times after a jittered
+    exponential backoff. A background thread runs a passive WAL checkpoint
+    every `checkpoint_interval` seconds (0 disables it), escalating to a
+    RESTART checkpoint when the WAL has grown past `wal_limit_pages`.
+    """
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    busy_timeout_ms: int = 5000
+    max_retries: int = 5
+    backoff_base: float = 0.005
+    backoff_max: float = 0.25
+    checkpoint_interval: float = 30.0
+    # WAL size in pages at which a committing connection checkpoints itself
+    autocheckpoint_pages: int = 1000
+    # Continuous readers can keep passive checkpoints from ever resetting the WAL
+    wal_limit_pages: int = 10000
+
+    def configure(self, conn: sqlite3.Connection) -> sqlite3.Connection:
+        """Apply the per-connection settings to a new connection."""
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        conn.execute(f"PRAGMA wal_autocheckpoint = {int(self.autocheckpoint_pages)}")
+        # Implicit transactions before INSERT/UPDATE/DELETE become BEGIN IMMEDIATE
+        conn.isolation_level = "IMMEDIATE"
+        return conn
+
+    def backoff(self, attempt: int) -> float:
+        """Seconds to wait before retry `attempt` (0-based): full jitter, capped."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+class Checkpointer:
+    """Background thread running WAL checkpoints on its own connection.
+
+    Passive checkpoints never wait for readers or writers. While readers
+    overlap continuously they can copy frames but never let the WAL start
+    over, so once it exceeds `wal_limit_pages` a RESTART checkpoint briefly
+    waits for the current readers to finish so the next writer rewinds it.
+    """
+
+    def __init__(self, db_path: str, interval: float, busy_timeout_ms: int = 5000,
+                 wal_limit_pages: int = 10000):
+        self.db_path = db_path
+        self.interval = interval
+        self.busy_timeout_ms = busy_timeout_ms
+        self.wal_limit_pages = wal_limit_pages
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._stats = {"runs": 0, "restarts": 0, "busy": 0, "errors": 0, "wal_frames": 0,
+                       "checkpointed_frames": 0}
+        self._thread = threading.Thread(target=self._run, name="wal-checkpointer", daemon=True)
+        self._thread.start()
+
+    def checkpoint(self, conn: sqlite3.Connection, mode: str = "PASSIVE") -> Dict[str, int]:
+        busy, wal_frames, checkpointed = conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        with self._lock:
+            self._stats["runs"] += 1
+            self._stats["restarts"] += mode == "RESTART"
+            self._stats["busy"] += busy
+            self._stats["wal_frames"] = wal_frames
+            self._stats["checkpointed_frames"] += max(checkpointed, 0)
+        return {"busy": busy, "wal_frames": wal_frames, "checkpointed_frames": checkpointed}
+
+    def _run(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        try:
+            conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+            while not self._stop.wait(self.interval):
+                try:
+                    result = self.checkpoint(conn)
+                    if result["wal_frames"] > self.wal_limit_pages:
+                        self.checkpoint(conn, "RESTART")
+                except sqlite3.Error:
+                    with self._lock:
+                        self._stats["errors"] += 1
+        finally:
+            conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats)
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop.set()
+        self._thread.join(timeout)
@@ -0,0 +1,224 @@
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+class PoolTimeoutError(sqlite3.OperationalError):
+    """Raised when no pooled connection becomes available in time."""
+
+class ConnectionPool:
+    """Bounded pool of long-lived SQLite connections.
+
+    Connections are checked out per thread: nested checkouts from the same
+    thread share one connection, and the outermost checkout owns the
+    transaction (commit on success, rollback on error).
+    """
+
+    def __init__(self, db_path: str, max_size: int = 5, timeout: float = 30.0,
+                 connect: Optional[Callable[[], sqlite3.Connection]] = None,
+                 on_acquire: Optional[Callable[[float], None]] = None):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.db_path = db_path
+        self.max_size = max_size
+        self.timeout = timeout
+        self._connect_factory = connect
+        # Called with the seconds each checkout spent waiting and connecting
+        self._on_acquire = on_acquire
+        # Checkout counters per live connection, keyed by id(conn)
+        self._checkouts: Dict[int, Dict[str, Any]] = {}
+        self._pinned: Set[sqlite3.Connection] = set()
+        self._idle: List[sqlite3.Connection] = []
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._local = threading.local()
+        self._stats = {"created": 0, "reused": 0, "discarded": 0, "waits": 0}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection that may be handed between threads."""
+        if self._connect_factory is not None:
+            conn = self._connect_factory()
+        else:
+            conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False)
+        with self._cond:
+            self._stats["created"] += 1
+            self._checkouts[id(conn)] = {"opened_at": time.time(), "checkouts": 1}
+        return conn
+
+    @staticmethod
+    def _is_healthy(conn: sqlite3.Connection) -> bool:
+        """Check that a pooled connection is still usable."""
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _discard(self, conn: sqlite3.Connection):
+        """Close a connection and free its slot in the pool."""
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._cond:
+            self._checkouts.pop(id(conn), None)
+            self._size -= 1
+            self._stats["discarded"] += 1
+            self._cond.notify()
+
+    def acquire(self, timeout: Optional[float] = None) -> sqlite3.Connection:
+        """Check out a connection, waiting up to `timeout` seconds for one."""
+        if self._on_acquire is None:
+            return self._acquire(timeout)
+        start = time.perf_counter()
+        try:
+            return self._acquire(timeout)
+        finally:
+            self._on_acquire(time.perf_counter() - start)
+
+    def _acquire(self, timeout: Optional[float]) -> sqlite3.Connection:
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        conn = None
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise sqlite3.ProgrammingError("Connection pool is closed")
+                if self._idle:
+                    conn = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+                remaining = deadline - time.monotonic()
+                self._stats["waits"] += 1
+                if remaining <= 0 or not self._cond.wait(remaining):
+                    raise PoolTimeoutError(
+                        f"Timed out waiting for a connection to {self.db_path}")
+
+        if conn is not None:
+            if self._is_healthy(conn):
+                with self._cond:
+                    self._stats["reused"] += 1
+                    self._checkouts[id(conn)]["checkouts"] += 1
+                return conn
+            # Keep the slot reserved and replace the broken connection in place
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+            with self._cond:
+                self._stats["discarded"] += 1
+                self._checkouts.pop(id(conn), None)
+        try:
+            return self._connect()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+    def release(self, conn: sqlite3.Connection):
+        """Return a connection to the pool, rolling back any open transaction."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            self._discard(conn)
+            return
+        with self._cond:
+            if not self._closed:
+                self._idle.append(conn)
+                self._cond.notify()
+                return
+        self._discard(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Check out this thread's connection for the duration of a block."""
+        held = getattr(self._local, "conn", None)
+        if held is not None and self._local.depth > 0:
+            self._local.depth += 1
+            try:
+                yield held
+            finally:
+                self._local.depth -= 1
+            return
+
+        pinned = held is not None
+        conn = held if pinned else self.acquire()
+        self._local.conn = conn
+        self._local.depth = 1
+        try:
+            yield conn
+            if conn.in_transaction:
+                conn.commit()
+        except BaseException:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        finally:
+            self._local.depth = 0
+            if not pinned:
+                self._local.conn = None
+                self.release(conn)
+
+    def pin_thread(self) -> sqlite3.Connection:
+        """Bind a connection to the calling thread until `unpin_thread`.
+
+        Every later checkout from this thread reuses it without going back to
+        the pool; intended for long-lived worker threads.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self.acquire()
+            self._local.conn = conn
+            self._local.depth = 0
+            with self._cond:
+                self._pinned.add(conn)
+        return conn
+
+    def pinned_connection(self) -> Optional[sqlite3.Connection]:
+        """Return the connection currently bound to the calling thread, if any."""
+        return getattr(self._local, "conn", None)
+
+    def unpin_thread(self):
+        """Return the calling thread's pinned connection to the pool."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or conn not in self._pinned:
+            return
+        self._local.conn = None
+        with self._cond:
+            self._pinned.discard(conn)
+        self.release(conn)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of pool usage counters."""
+        with self._cond:
+            snapshot = dict(self._stats)
+            snapshot.update(size=self._size, idle=len(self._idle),
+                            in_use=self._size - len(self._idle), max_size=self.max_size)
+        return snapshot
+
+    def connection_stats(self) -> List[Dict[str, Any]]:
+        """Return per-connection age and checkout counts for live connections."""
+        now = time.time()
+        with self._cond:
+            return [{"connection": index, "age_seconds": round(now - info["opened_at"], 3),
+                     "checkouts": info["checkouts"]}
+                    for index, info in enumerate(self._checkouts.values())]
+
+    def close(self):
+        """Close idle and pinned connections; checked-out ones are closed on release.
+
+        Threads holding pinned connections must have finished before closing.
+        """
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            pinned, self._pinned = list(self._pinned), set()
+            self._cond.notify_all()
+        for conn in idle + pinned:
+            self._discard(conn)
@@ -1,43 +1,256 @@
 import sqlite3
 import os
-from typing import List, Dict, Any, Optional
-from models.employee import Employee, Department
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Dict, Any, Callable, Optional, Iterable, Iterator, Set, Tuple, TypeVar
+from models.employee import Employee, Department, EmployeeWithDepartment
+from models.employee_batch import EmployeeBatch
+from data_access.connection_pool import ConnectionPool
+from data_access.replica import ReadReplica
+from data_access.query import EmployeeQuery
+from data_access.migrations import SCHEMA_VERSION, SchemaVersionError, migrate, schema_state
+from data_access.cache import VersionedLRUCache
+from data_access.concurrency import Checkpointer, ConcurrencyMode, is_lock_error
+from data_access.util import chunks
+from data_access.instrumentation import (QueryMetrics, InstrumentedConnection,
+                                         instrument_connection, instrument_dao)
+
+DEFAULT_DB_PATH = "employees (1).db"
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_PAGE_SIZE = 500
+
+EMPLOYEE_COLUMNS = "id, name, department_id, salary, hire_date"
+
+# Aliased so a compound query's ORDER BY can name them
+JOINED_EMPLOYEE_COLUMNS = ("e.id AS id, e.name AS name, e.department_id AS department_id, e.salary AS salary, "
+                           "e.hire_date AS hire_date, d.name AS department_name")
+
+JOINED_EMPLOYEE_SELECT = f"""
+    SELECT {JOINED_EMPLOYEE_COLUMNS}
+    FROM employees e
+    LEFT JOIN departments d ON d.id = e.department_id
+"""
+
+# Position in the (name, id) ordering used for keyset pagination
+EmployeeCursor = Tuple[str, int]
+
+# Trigram tokens need at least this many characters to use the FTS index
+MIN_TRIGRAM_LENGTH = 3
+
+T = TypeVar("T")
 
 class DatabaseManager:
     """Database manager for handling SQLite operations."""
     
-    def __init__(self, db_path: str = "employees (1).db"):
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, pool_size: int = 5,
+                 pool_timeout: float = 30.0, metrics: Optional[QueryMetrics] = None,
+                 read_replica: bool = False, max_staleness: float = 1.0,
+                 concurrency: Optional[ConcurrencyMode] = None):
         self.db_path = db_path
+        self.pool_timeout = pool_timeout
+        # When set, every statement, DAO call and pool checkout is measured
+        self.metrics = metrics
+        # When set, connections use WAL, a busy timeout and IMMEDIATE write transactions
+        self.concurrency = concurrency
+        self.pool = ConnectionPool(
+            db_path, max_size=pool_size, timeout=pool_timeout,
+            connect=self._connect if metrics is not None or concurrency is not None else None,
+            on_acquire=metrics.record_acquire_wait if metrics is not None else None)
+        self._version_conn: Optional[sqlite3.Connection] = None
+        self._version_lock = threading.Lock()
+        self._write_stats = {"transactions": 0, "retries": 0, "lock_failures": 0}
+        self._write_stats_lock = threading.Lock()
+        # Optional in-memory copy that serves DAO reads, at most `max_staleness` seconds old
+        self.replica: Optional[ReadReplica] = None
+        self.checkpointer: Optional[Checkpointer] = None
+        self.journal_mode = None
+        if concurrency is not None:
+            with self.get_connection() as conn:
+                # Persistent: stored in the file, so every process sees the same mode
+                self.journal_mode = conn.execute(
+                    f"PRAGMA journal_mode = {concurrency.journal_mode}").fetchone()[0]
         self.init_database()
+        if concurrency is not None and concurrency.checkpoint_interval > 0 and self.journal_mode == "wal":
+            self.checkpointer = Checkpointer(db_path, concurrency.checkpoint_interval,
+                                             concurrency.busy_timeout_ms, concurrency.wal_limit_pages)
+        if read_replica:
+            self.replica = ReadReplica(
+                db_path, self.data_version, max_staleness, pool_size, pool_timeout,
+                connect=self._connect_replica if metrics is not None else None)
     
     def init_database(self):
-        """Initialize database connection and create tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            # Create departments table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS departments (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL
-                )
-            """)
-            # Create employees table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS employees (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    department_id INTEGER,
-                    salary REAL,
-                    hire_date TEXT,
-                    FOREIGN KEY (department_id) REFERENCES departments(id)
-                )
-            """)
+        """Bring the schema up to date.
+        
+        When the database is already at SCHEMA_VERSION this is a single
+        query; otherwise the pending migrations are applied in order.
+        Timings are kept in `self.startup_timings`.
+        """
+        start = time.perf_counter()
+        with self.get_connection() as conn:
+            version, self.fts_enabled = schema_state(conn)
+            checked = time.perf_counter()
+            if version > SCHEMA_VERSION:
+                raise SchemaVersionError(
+                    f"{self.db_path} has schema version {version}, newer than {SCHEMA_VERSION}")
+            applied = []
+            if version < SCHEMA_VERSION:
+                applied = migrate(conn)
+                version, self.fts_enabled = schema_state(conn)
+        self.schema_version = version
+        self.startup_timings = {
+            "version_check_ms": (checked - start) * 1000,
+            "migrations": applied,
+            "total_ms": (time.perf_counter() - start) * 1000,
+        }
+    
+    def rebuild_name_search(self):
+        """Rebuild the trigram name index from the employees table."""
+        with self.get_connection() as conn:
+            conn.execute("INSERT INTO employees_fts (employees_fts) VALUES ('rebuild')")
             conn.commit()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a pooled connection, instrumented and configured for concurrency as enabled."""
+        if self.metrics is not None:
+            conn = sqlite3.connect(self.db_path, timeout=self.pool_timeout,
+                                   check_same_thread=False, factory=InstrumentedConnection)
+            instrument_connection(conn, self.metrics)
+        else:
+            conn = sqlite3.connect(self.db_path, timeout=self.pool_timeout, check_same_thread=False)
+        if self.concurrency is not None:
+            self.concurrency.configure(conn)
+        return conn
+    
+    def _connect_replica(self, uri: str) -> sqlite3.Connection:
+        """Open an instrumented connection to the in-memory replica."""
+        conn = sqlite3.connect(uri, uri=True, timeout=self.pool_timeout,
+                               check_same_thread=False, factory=InstrumentedConnection)
+        return instrument_connection(conn, self.metrics)
+    
+    def metrics_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Get query, DAO-method and pool-wait metrics, or None if not instrumented."""
+        return self.metrics.snapshot() if self.metrics is not None else None
+    
     def get_connection(self):
-        """Get database connection."""
-        return sqlite3.connect(self.db_path)
+        """Check out a pooled connection for use in a `with` block.
+
+        The block commits on success and rolls back on error; the connection
+        is returned to the pool afterwards rather than closed.
+        """
+        if self.replica is None:
+            return self.pool.connection()
+        return self._tracked_connection()
+    
+    @contextmanager
+    def _tracked_connection(self):
+        """Pooled checkout that marks the replica stale once its changes are committed."""
+        with self.pool.connection() as conn:
+            before = conn.total_changes
+            yield conn
+            changed = conn.total_changes != before
+        if changed:
+            self.replica.mark_stale()
+    
+    def get_read_connection(self):
+        """Check out a connection for reads, served by the replica when enabled.
+        
+        Changes committed through this manager are visible to the next read;
+        commits by other processes within `max_staleness` seconds.
+        """
+        if self.replica is None:
+            return self.pool.connection()
+        return self.replica.connection()
+    
+    def run_write(self, work: Callable[[sqlite3.Connection], T]) -> T:
+        """Run `work(conn)` and commit it as one transaction; return its result.
+        
+        In concurrency mode a transaction that fails because another process
+        holds the lock is rolled back and run again after a jittered backoff,
+        up to `max_retries` times. Inside a transaction the caller already
+        opened, `work` runs once, errors propagate and committing is left to
+        the caller's checkout.
+        """
+        attempt = 0
+        while True:
+            with self.get_connection() as conn:
+                outer_transaction = conn.in_transaction
+                try:
+                    result = work(conn)
+                    if not outer_transaction:
+                        conn.commit()
+                except sqlite3.OperationalError as e:
+                    if outer_transaction or self.concurrency is None or not is_lock_error(e):
+                        raise
+                    conn.rollback()
+                    if attempt >= self.concurrency.max_retries:
+                        with self._write_stats_lock:
+                            self._write_stats["lock_failures"] += 1
+                        raise
+                else:
+                    if not outer_transaction:
+                        with self._write_stats_lock:
+                            self._write_stats["transactions"] += 1
+                    return result
+            with self._write_stats_lock:
+                self._write_stats["retries"] += 1
+            time.sleep(self.concurrency.backoff(attempt))
+            attempt += 1
+    
+    def run_department_write(self, work: Callable[[sqlite3.Connection], T]) -> T:
+        """Run a write to the departments table as `run_write` does.
+        
+        Sharded managers also copy the departments to every shard afterwards.
+        """
+        return self.run_write(work)
+    
+    def checkpoint(self, mode: str = "PASSIVE") -> Dict[str, int]:
+        """Run a WAL checkpoint now; TRUNCATE also shrinks the WAL file to zero."""
+        with self.get_connection() as conn:
+            busy, wal_frames, checkpointed = conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        return {"busy": busy, "wal_frames": wal_frames, "checkpointed_frames": checkpointed}
+    
+    def concurrency_stats(self) -> Dict[str, Any]:
+        """Get the journal mode, write transaction/retry counters and checkpoint totals."""
+        with self._write_stats_lock:
+            stats = dict(self._write_stats)
+        stats["journal_mode"] = self.journal_mode
+        if self.checkpointer is not None:
+            stats["checkpoints"] = self.checkpointer.stats()
+        return stats
+    
+    def replica_stats(self) -> Optional[Dict[str, Any]]:
+        """Get replica refresh counters, or None when reads go to disk."""
+        return self.replica.stats() if self.replica is not None else None
+    
+    def data_version(self) -> int:
+        """Return a counter that changes whenever any other connection commits.
+        
+        Uses a dedicated connection that never writes, so commits made through
+        the pool (or by other processes) are all observed.
+        """
+        with self._version_lock:
+            if self._version_conn is None:
+                self._version_conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            return self._version_conn.execute("PRAGMA data_version").fetchone()[0]
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool usage statistics."""
+        return self.pool.stats()
+    
+    def close(self):
+        """Close all pooled connections."""
+        if self.checkpointer is not None:
+            self.checkpointer.stop()
+        if self.replica is not None:
+            self.replica.close()
+        self.pool.close()
+        with self._version_lock:
+            if self._version_conn is not None:
+                self._version_conn.close()
+                self._version_conn = None
 
+@instrument_dao
 class EmployeeDAO:
     """Data Access Object for Employee operations."""
     
@@ -46,18 +259,18 @@ class EmployeeDAO:
     
     def create(self, employee: Employee) -> int:
         """Create a new employee and return the ID."""
-        with self.db_manager.get_connection() as conn:
+        def insert(conn):
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO employees (name, department_id, salary, hire_date)
                 VALUES (?, ?, ?, ?)
             """, (employee.name, employee.department_id, employee.salary, employee.hire_date))
-            conn.commit()
             return cursor.lastrowid
+        return self.db_manager.run_write(insert)
     
     def read(self, employee_id: int) -> Optional[Employee]:
         """Read an employee by ID."""
-        with self.db_manager.get_connection() as conn:
+        with self.db_manager.get_read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM employees WHERE id = ?", (employee_id,))
             row = cursor.fetchone()
@@ -66,9 +279,23 @@ class EmployeeDAO:
                               salary=row[3], hire_date=row[4])
             return None
     
+    def read_many(self, employee_ids: Iterable[int]) -> Dict[int, Employee]:
+        """Read the given employees, keyed by ID; missing IDs are left out."""
+        wanted = sorted({employee_id for employee_id in employee_ids if employee_id is not None})
+        found = {}
+        with self.db_manager.get_read_connection() as conn:
+            cursor = conn.cursor()
+            for chunk in chunks(wanted, 500):
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor.execute(f"SELECT {EMPLOYEE_COLUMNS} FROM employees WHERE id IN ({placeholders})", chunk)
+                for row in cursor.fetchall():
+                    found[row[0]] = Employee(id=row[0], name=row[1], department_id=row[2],
+                                             salary=row[3], hire_date=row[4])
+        return found
+    
     def read_all(self) -> List[Employee]:
         """Read all employees."""
-        with self.db_manager.get_connection() as conn:
+        with self.db_manager.get_read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM employees ORDER BY name")
             rows = cursor.fetchall()
@@ -77,7 +304,7 @@ class EmployeeDAO:
     
     def update(self, employee: Employee) -> bool:
         """Update an existing employee."""
-        with self.db_manager.get_connection() as conn:
+        def update(conn):
             cursor = conn.cursor()
             cursor.execute("""
                 UPDATE employees 
@@ -85,36 +312,353 @@ class EmployeeDAO:
                 WHERE id = ?
             """, (employee.name, employee.department_id, employee.salary, 
                   employee.hire_date, employee.id))
-            conn.commit()
             return cursor.rowcount > 0
+        return self.db_manager.run_write(update)
     
     def delete(self, employee_id: int) -> bool:
         """Delete an employee by ID."""
-        with self.db_manager.get_connection() as conn:
+        def delete(conn):
             cursor = conn.cursor()
             cursor.execute("DELETE FROM employees WHERE id = ?", (employee_id,))
-            conn.commit()
             return cursor.rowcount > 0
+        return self.db_manager.run_write(delete)
+    
+    def _write_chunks(self, sql: str, rows: Iterable[tuple], chunk_size: int) -> int:
+        """executemany `sql` in one transaction per chunk and return the total row count."""
+        written = 0
+        for chunk in chunks(rows, chunk_size):
+            written += self.db_manager.run_write(lambda conn: conn.executemany(sql, chunk).rowcount)
+        return written
+    
+    def create_many(self, employees: Iterable[Employee],
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Insert employees in chunked transactions and return the row count."""
+        return self._write_chunks("""
+            INSERT INTO employees (name, department_id, salary, hire_date)
+            VALUES (?, ?, ?, ?)
+        """, ((e.name, e.department_id, e.salary, e.hire_date) for e in employees), chunk_size)
+    
+    def update_many(self, employees: Iterable[Employee],
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Update employees in chunked transactions and return the row count."""
+        return self._write_chunks("""
+            UPDATE employees
+            SET name = ?, department_id = ?, salary = ?, hire_date = ?
+            WHERE id = ?
+        """, ((e.name, e.department_id, e.salary, e.hire_date, e.id) for e in employees), chunk_size)
+    
+    def delete_many(self, employee_ids: Iterable[int],
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Delete employees by ID in chunked transactions and return the row count."""
+        return self._write_chunks("DELETE FROM employees WHERE id = ?",
+                                  ((employee_id,) for employee_id in employee_ids), chunk_size)
+    
+    def upsert_many(self, employees: Iterable[Employee],
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Insert or update employees by ID in chunked transactions.
+        
+        Employees without an ID are always inserted.
+        """
+        return self._write_chunks("""
+            INSERT INTO employees (id, name, department_id, salary, hire_date)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                name = excluded.name,
+                department_id = excluded.department_id,
+                salary = excluded.salary,
+                hire_date = excluded.hire_date
+        """, ((e.id, e.name, e.department_id, e.salary, e.hire_date) for e in employees), chunk_size)
+    
+    def _name_filter(self, alias: str = "") -> str:
+        """SQL condition matching `name LIKE ?`, served by the trigram index if present.
+        
+        `alias` qualifies the employee columns, e.g. "e." in joined queries.
+        """
+        if self.db_manager.fts_enabled:
+            return f"{alias}id IN (SELECT rowid FROM employees_fts WHERE name LIKE ?)"
+        return f"{alias}name LIKE ?"
+    
+    def read_page(self, after: Optional[EmployeeCursor] = None,
+                  page_size: int = DEFAULT_PAGE_SIZE,
+                  name_pattern: Optional[str] = None) -> List[Employee]:
+        """Read one page of employees ordered by (name, id).
+        
+        `after` is the (name, id) of the last employee on the previous page;
+        pass None to start from the beginning.
+        """
+        conditions, params = [], []
+        if name_pattern is not None:
+            conditions.append(self._name_filter())
+            params.append(f"%{name_pattern}%")
+        if after is not None:
+            conditions.append("(name, id) > (?, ?)")
+            params.extend(after)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self.db_manager.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {EMPLOYEE_COLUMNS} FROM employees {where}
+                ORDER BY name, id LIMIT ?
+            """, (*params, page_size))
+            return [Employee(id=row[0], name=row[1], department_id=row[2],
+                             salary=row[3], hire_date=row[4])
+                    for row in cursor.fetchmany(page_size)]
+    
+    def iter_pages(self, page_size: int = DEFAULT_PAGE_SIZE,
+                   name_pattern: Optional[str] = None) -> Iterator[List[Employee]]:
+        """Yield successive pages of employees using keyset pagination.
+        
+        The connection is returned to the pool between pages, so callers may
+        consume pages slowly without holding database resources.
+        """
+        after = None
+        while True:
+            page = self.read_page(after, page_size, name_pattern)
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            after = (page[-1].name, page[-1].id)
+    
+    def iter_all(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Employee]:
+        """Stream all employees ordered by name in bounded memory."""
+        for page in self.iter_pages(page_size):
+            yield from page
+    
+    def iter_search_by_name(self, name_pattern: str,
+                            page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Employee]:
+        """Stream employees matching a name pattern in bounded memory."""
+        for page in self.iter_pages(page_size, name_pattern):
+            yield from page
+    
+    def query(self, query: EmployeeQuery) -> List[Employee]:
+        """Run a filter/sort/page query as one parameterized statement."""
+        sql, params = query.compile(EMPLOYEE_COLUMNS)
+        with self.db_manager.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            return [Employee(id=row[0], name=row[1], department_id=row[2],
+                             salary=row[3], hire_date=row[4]) for row in cursor.fetchall()]
+    
+    def query_with_department(self, query: EmployeeQuery) -> List[EmployeeWithDepartment]:
+        """Run a filter/sort/page query joined with department names in one statement."""
+        sql, params = query.compile(JOINED_EMPLOYEE_COLUMNS, with_department=True)
+        with self.db_manager.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            return [self._joined_row(row) for row in cursor.fetchall()]
+    
+    def count(self, query: EmployeeQuery) -> int:
+        """Number of employees matching `query`'s filters, ignoring its limit and offset."""
+        sql, params = query.page(None).starting_after(None).compile("COUNT(*)")
+        with self.db_manager.get_read_connection() as conn:
+            return conn.execute(sql, params).fetchone()[0]
+    
+    def iter_query(self, query: EmployeeQuery, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Employee]:
+        """Stream every match of `query` in bounded memory via keyset pages.
+        
+        The query's own limit caps the total; any offset is applied to the
+        first page only.
+        """
+        remaining = query.limit
+        page_query = query
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            page = self.query(page_query.page(size, page_query.offset))
+            yield from page
+            if len(page) < size:
+                return
+            if remaining is not None:
+                remaining -= len(page)
+            page_query = page_query.starting_after(query.cursor_for(page[-1]))
+    
+    @staticmethod
+    def _joined_row(row) -> EmployeeWithDepartment:
+        return EmployeeWithDepartment(id=row[0], name=row[1], department_id=row[2],
+                                      salary=row[3], hire_date=row[4], department_name=row[5])
+    
+    def read_with_department(self, employee_id: int) -> Optional[EmployeeWithDepartment]:
+        """Read an employee by ID together with its department name."""
+        with self.db_manager.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"{JOINED_EMPLOYEE_SELECT} WHERE e.id = ?", (employee_id,))
+            row = cursor.fetchone()
+            return self._joined_row(row) if row else None
+    
+    def read_page_with_department(self, after: Optional[EmployeeCursor] = None,
+                                  page_size: int = DEFAULT_PAGE_SIZE,
+                                  department_id: Optional[int] = None) -> List[EmployeeWithDepartment]:
+        """Read one page of employees with department names, ordered by (name, id)."""
+        conditions, params = [], []
+        if department_id is not None:
+            conditions.append("e.department_id = ?")
+            params.append(department_id)
+        if after is not None:
+            conditions.append("(e.name, e.id) > (?, ?)")
+            params.extend(after)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self.db_manager.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"{JOINED_EMPLOYEE_SELECT} {where} ORDER BY e.name, e.id LIMIT ?",
+                           (*params, page_size))
+            return [self._joined_row(row) for row in cursor.fetchmany(page_size)]
+    
+    def iter_with_department(self, department_id: Optional[int] = None,
+                             page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[EmployeeWithDepartment]:
+        """Stream employees with department names, optionally for one department."""
+        after = None
+        while True:
+            page = self.read_page_with_department(after, page_size, department_id)
+            yield from page
+            if len(page) < page_size:
+                return
+            after = (page[-1].name, page[-1].id)
+    
+    def read_all_with_department(self, department_id: Optional[int] = None) -> List[EmployeeWithDepartment]:
+        """Read employees joined with department names in a single query."""
+        with self.db_manager.get_read_connection() as conn:
+            cursor = conn.cursor()
+            if department_id is None:
+                cursor.execute(f"{JOINED_EMPLOYEE_SELECT} ORDER BY e.name")
+            else:
+                cursor.execute(f"{JOINED_EMPLOYEE_SELECT} WHERE e.department_id = ? ORDER BY e.name",
+                               (department_id,))
+            return [self._joined_row(row) for row in cursor.fetchall()]
+    
+    def read_batch(self, department_id: Optional[int] = None,
+                   fetch_size: int = DEFAULT_PAGE_SIZE) -> EmployeeBatch:
+        """Read employees (optionally one department) into a columnar batch, ordered by ID."""
+        batch = EmployeeBatch()
+        with self.db_manager.get_read_connection() as conn:
+            cursor = conn.cursor()
+            if department_id is None:
+                cursor.execute(f"SELECT {EMPLOYEE_COLUMNS} FROM employees ORDER BY id")
+            else:
+                cursor.execute(f"SELECT {EMPLOYEE_COLUMNS} FROM employees WHERE department_id = ? ORDER BY id",
+                               (department_id,))
+            while True:
+                rows = cursor.fetchmany(fetch_size)
+                if not rows:
+                    break
+                batch.extend_rows(rows)
+        return batch
+    
+    def iter_batches(self, batch_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[EmployeeBatch]:
+        """Yield columnar batches of employees using keyset pagination on ID."""
+        last_id = None
+        while True:
+            with self.db_manager.get_read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f"""
+                    SELECT {EMPLOYEE_COLUMNS} FROM employees
+                    WHERE id > ? ORDER BY id LIMIT ?
+                """, (-1 if last_id is None else last_id, batch_size))
+                batch = EmployeeBatch.from_rows(cursor.fetchmany(batch_size))
+            if not len(batch):
+                return
+            yield batch
+            if len(batch) < batch_size:
+                return
+            last_id = batch.ids[-1]
+    
+    def iter_rows(self, after_id: Optional[int] = None, department_id: Optional[int] = None,
+                  unassigned: bool = False, fetch_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Tuple]:
+        """Stream raw (id, name, department_id, salary, hire_date) rows in ID order.
+        
+        One statement is read with fetchmany, so the rows come from a single
+        consistent snapshot. `unassigned` selects employees without a department.
+        """
+        conditions, params = ["id > ?"], [-1 if after_id is None else after_id]
+        if unassigned:
+            conditions.append("department_id IS NULL")
+        elif department_id is not None:
+            conditions.append("department_id = ?")
+            params.append(department_id)
+        with self.db_manager.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT {EMPLOYEE_COLUMNS} FROM employees WHERE {' AND '.join(conditions)} ORDER BY id",
+                           params)
+            while True:
+                rows = cursor.fetchmany(fetch_size)
+                if not rows:
+                    return
+                yield from rows
+    
+    def department_partitions(self) -> List[Optional[int]]:
+        """Distinct department IDs that have employees; None stands for unassigned."""
+        with self.db_manager.get_read_connection() as conn:
+            rows = conn.execute("SELECT DISTINCT department_id FROM employees ORDER BY department_id").fetchall()
+            return [row[0] for row in rows]
     
     def search_by_name(self, name_pattern: str) -> List[Employee]:
         """Search employees by name pattern."""
-        with self.db_manager.get_connection() as conn:
+        with self.db_manager.get_read_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM employees WHERE name LIKE ? ORDER BY name", 
+            cursor.execute(f"SELECT {EMPLOYEE_COLUMNS} FROM employees WHERE {self._name_filter()} ORDER BY name",
                          (f"%{name_pattern}%",))
             rows = cursor.fetchall()
             return [Employee(id=row[0], name=row[1], department_id=row[2], 
                            salary=row[3], hire_date=row[4]) for row in rows]
 
+    def search_by_name_with_department(self, name_pattern: str) -> List[EmployeeWithDepartment]:
+        """Search employees by name pattern, joined with department names in one query."""
+        with self.db_manager.get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"{JOINED_EMPLOYEE_SELECT} WHERE {self._name_filter('e.')} ORDER BY e.name",
+                           (f"%{name_pattern}%",))
+            return [self._joined_row(row) for row in cursor.fetchall()]
+    
+    def search_ranked(self, term: str, limit: int = 20) -> List[Employee]:
+        """Search employee names for a substring, best matches first.
+        
+        Terms shorter than a trigram cannot use the index and fall back to a
+        name-ordered LIKE scan.
+        """
+        return [employee for _, employee in self.search_ranked_with_scores(term, limit)]
+    
+    def search_ranked_with_scores(self, term: str, limit: int = 20) -> List[Tuple[float, Employee]]:
+        """Like search_ranked, paired with each match's bm25 rank (lower is better; 0 for LIKE scans)."""
+        with self.db_manager.get_read_connection() as conn:
+            cursor = conn.cursor()
+            if self.db_manager.fts_enabled and len(term) >= MIN_TRIGRAM_LENGTH:
+                phrase = '"' + term.replace('"', '""') + '"'
+                cursor.execute("""
+                    SELECT e.id, e.name, e.department_id, e.salary, e.hire_date, employees_fts.rank
+                    FROM employees_fts
+                    JOIN employees e ON e.id = employees_fts.rowid
+                    WHERE employees_fts MATCH ?
+                    ORDER BY employees_fts.rank, e.name
+                    LIMIT ?
+                """, (phrase, limit))
+            else:
+                escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                cursor.execute(f"""
+                    SELECT {EMPLOYEE_COLUMNS}, 0.0 FROM employees
+                    WHERE name LIKE ? ESCAPE '\\' ORDER BY name LIMIT ?
+                """, (f"%{escaped}%", limit))
+            return [(row[5], Employee(id=row[0], name=row[1], department_id=row[2],
+                                      salary=row[3], hire_date=row[4])) for row in cursor.fetchall()]
+
+@instrument_dao
 class DepartmentDAO:
-    """Data Access Object for Department operations."""
+    """Data Access Object for Department operations.
+    
+    Writes go through `run_department_write`, which on a sharded manager
+    also copies the change to every shard.
+    """
     
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
     
+    def create(self, department: Department) -> int:
+        """Create a new department and return the ID."""
+        return self.db_manager.run_department_write(lambda conn: conn.execute(
+            "INSERT INTO departments (name) VALUES (?)", (department.name,)).lastrowid)
+    
     def read_all(self) -> List[Department]:
         """Read all departments."""
-        with self.db_manager.get_connection() as conn:
+        with self.db_manager.get_read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM departments ORDER BY name")
             rows = cursor.fetchall()
@@ -122,10 +666,73 @@ class DepartmentDAO:
     
     def read(self, department_id: int) -> Optional[Department]:
         """Read a department by ID."""
-        with self.db_manager.get_connection() as conn:
+        with self.db_manager.get_read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM departments WHERE id = ?", (department_id,))
             row = cursor.fetchone()
             if row:
                 return Department(id=row[0], name=row[1])
             return None
+    
+    def update(self, department: Department) -> bool:
+        """Rename an existing department."""
+        return self.db_manager.run_department_write(lambda conn: conn.execute(
+            "UPDATE departments SET name = ? WHERE id = ?", (department.name, department.id)).rowcount > 0)
+    
+    def delete(self, department_id: int) -> bool:
+        """Delete a department."""
+        return self.db_manager.run_department_write(lambda conn: conn.execute(
+            "DELETE FROM departments WHERE id = ?", (department_id,)).rowcount > 0)
+    
+    def existing_ids(self, department_ids: Iterable[int]) -> Set[int]:
+        """Return the subset of the given department IDs that exist."""
+        wanted = {dept_id for dept_id in department_ids if dept_id is not None}
+        found = set()
+        with self.db_manager.get_read_connection() as conn:
+            cursor = conn.cursor()
+            for chunk in chunks(sorted(wanted), 500):
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor.execute(f"SELECT id FROM departments WHERE id IN ({placeholders})", chunk)
+                found.update(row[0] for row in cursor.fetchall())
+        return found
+
+@instrument_dao
+class CachedDepartmentDAO(DepartmentDAO):
+    """DepartmentDAO that serves lookups from an in-process cache.
+    
+    Entries are dropped whenever `PRAGMA data_version` reports a commit from
+    any other connection, and otherwise expire by TTL and LRU order. Misses
+    are loaded from the database file rather than the read replica, so an
+    entry is never older than the version it is cached under.
+    """
+    
+    def __init__(self, db_manager: DatabaseManager, max_entries: int = 256,
+                 ttl: Optional[float] = 300.0):
+        super().__init__(db_manager)
+        self.cache = VersionedLRUCache(max_entries=max_entries, ttl=ttl,
+                                       version_source=db_manager.data_version)
+    
+    def _lookup(self) -> Dict[int, Department]:
+        """Get all departments keyed by ID, cached as one entry."""
+        return self.cache.get("by_id", self._load)
+    
+    def _load(self) -> Dict[int, Department]:
+        with self.db_manager.get_connection() as conn:
+            return {row[0]: Department(id=row[0], name=row[1])
+                    for row in conn.execute("SELECT id, name FROM departments")}
+    
+    def read_all(self) -> List[Department]:
+        """Read all departments."""
+        return sorted(self._lookup().values(), key=lambda dept: dept.name)
+    
+    def read(self, department_id: int) -> Optional[Department]:
+        """Read a department by ID."""
+        return self._lookup().get(department_id)
+    
+    def existing_ids(self, department_ids: Iterable[int]) -> Set[int]:
+        """Return the subset of the given department IDs that exist."""
+        return set(department_ids) & self._lookup().keys()
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss counters."""
+        return self.cache.stats()
@@ -0,0 +1,240 @@
+import bz2
+import csv
+import gzip
+import io
+import json
+import lzma
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+from models.employee_batch import EmployeeBatch
+from data_access.database import DatabaseManager, EmployeeDAO, DEFAULT_CHUNK_SIZE, DEFAULT_PAGE_SIZE
+
+EXPORT_FORMATS = ("csv", "jsonl", "columnar")
+
+EXPORT_FIELDS = ["id", "name", "department_id", "salary", "hire_date"]
+
+# First bytes of a columnar export; EmployeeBatch.to_bytes records follow
+COLUMNAR_MAGIC = b"EMPBATCH1\n"
+
+# Compression name -> (file extension, opener for a compressed stream over a file object)
+COMPRESSORS = {
+    "gzip": (".gz", lambda raw, mode: gzip.GzipFile(fileobj=raw, mode=mode)),
+    "bz2": (".bz2", lambda raw, mode: bz2.BZ2File(raw, mode)),
+    "xz": (".xz", lambda raw, mode: lzma.LZMAFile(raw, mode)),
+}
+
+DEFAULT_CHECKPOINT_ROWS = 50000
+
+def detect_compression(path: str) -> Optional[str]:
+    """Infer the compression from a file extension such as `.csv.gz`."""
+    for name, (extension, _) in COMPRESSORS.items():
+        if path.endswith(extension):
+            return name
+    return None
+
+def detect_format(path: str) -> str:
+    """Infer the export format from a file name, ignoring any compression suffix."""
+    compression = detect_compression(path)
+    if compression:
+        path = path[:-len(COMPRESSORS[compression][0])]
+    extension = os.path.splitext(path)[1].lstrip(".").lower()
+    return {"json": "jsonl", "bin": "columnar", "emp": "columnar"}.get(extension, extension)
+
+def progress_path(path: str) -> str:
+    """Sidecar file recording how far an export got."""
+    return path + ".progress.json"
+
+def _write_progress(path: str, progress: Dict[str, Any]):
+    """Replace the progress file atomically so a crash never leaves it half written."""
+    temp = progress_path(path) + ".tmp"
+    with open(temp, "w") as f:
+        json.dump(progress, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp, progress_path(path))
+
+def _read_progress(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(progress_path(path)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+class EmployeeExporter:
+    """Streams employees to CSV, JSONL or a chunked columnar file in bounded memory.
+
+    Rows are read in ID order with fetchmany and written in segments of
+    `checkpoint_rows`. After each segment the file is flushed and a progress
+    file records the last exported ID and the file length, so an interrupted
+    export can be resumed by truncating back to that length and continuing
+    after that ID. Compressed output closes one compressed member per
+    segment; gzip, bz2 and xz readers all accept the concatenation.
+    """
+
+    def __init__(self, db_manager: DatabaseManager, fetch_size: int = DEFAULT_PAGE_SIZE,
+                 batch_size: int = DEFAULT_CHUNK_SIZE, checkpoint_rows: int = DEFAULT_CHECKPOINT_ROWS):
+        self.employee_dao = EmployeeDAO(db_manager)
+        self.fetch_size = fetch_size
+        self.batch_size = batch_size
+        self.checkpoint_rows = checkpoint_rows
+
+    def export(self, path: str, format: Optional[str] = None, compression: Optional[str] = "auto",
+               department_id: Optional[int] = None, unassigned: bool = False,
+               resume: bool = False) -> Dict[str, Any]:
+        """Export employees (optionally one department) to `path` and return the progress record.
+
+        `format` and `compression` default to what the file name suggests.
+        With `resume`, an existing progress file for the same export is
+        continued instead of starting over.
+        """
+        format = format or detect_format(path)
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"unsupported export format {format!r}")
+        if compression == "auto":
+            compression = detect_compression(path)
+        if compression is not None and compression not in COMPRESSORS:
+            raise ValueError(f"unsupported compression {compression!r}")
+
+        settings = {"format": format, "compression": compression,
+                    "department_id": department_id, "unassigned": unassigned}
+        progress = _read_progress(path) if resume else None
+        if progress is not None and any(progress.get(key) != value for key, value in settings.items()):
+            raise ValueError(f"{progress_path(path)} belongs to a different export")
+        if progress is not None and progress.get("complete"):
+            return progress
+        if progress is None or not os.path.exists(path) or os.path.getsize(path) < progress["offset"]:
+            progress = dict(settings, last_id=None, rows=0, offset=0, complete=False)
+
+        started = time.perf_counter()
+        with open(path, "r+b" if progress["offset"] else "wb") as raw:
+            # Drop anything written after the last checkpoint
+            raw.truncate(progress["offset"])
+            raw.seek(progress["offset"])
+            rows = self.employee_dao.iter_rows(progress["last_id"], department_id, unassigned,
+                                               self.fetch_size)
+            first = progress["offset"] == 0
+            while True:
+                segment = self._write_segment(raw, rows, format, compression, first)
+                first = False
+                if segment is None:
+                    break
+                count, last_id = segment
+                raw.flush()
+                os.fsync(raw.fileno())
+                progress.update(last_id=last_id, rows=progress["rows"] + count, offset=raw.tell())
+                _write_progress(path, progress)
+            if progress["offset"] == 0:
+                # Empty result: still produce a well-formed file
+                self._write_segment(raw, iter(()), format, compression, True, allow_empty=True)
+                raw.flush()
+                progress["offset"] = raw.tell()
+        progress["complete"] = True
+        progress["elapsed_seconds"] = progress.get("elapsed_seconds", 0.0) + time.perf_counter() - started
+        _write_progress(path, progress)
+        return progress
+
+    def _write_segment(self, raw: BinaryIO, rows: Iterator[tuple], format: str,
+                       compression: Optional[str], first: bool, allow_empty: bool = False):
+        """Write up to checkpoint_rows rows; return (count, last_id) or None when exhausted."""
+        row = next(rows, None)
+        if row is None and not allow_empty:
+            return None
+        stream = COMPRESSORS[compression][1](raw, "wb") if compression else raw
+        count, last_id = 0, None
+        try:
+            if format == "columnar":
+                if first:
+                    stream.write(COLUMNAR_MAGIC)
+                batch = EmployeeBatch()
+                while row is not None:
+                    batch.append_row(row)
+                    count, last_id = count + 1, row[0]
+                    if len(batch) >= self.batch_size:
+                        stream.write(batch.to_bytes())
+                        batch = EmployeeBatch()
+                    if count >= self.checkpoint_rows:
+                        break
+                    row = next(rows, None)
+                if len(batch):
+                    stream.write(batch.to_bytes())
+            else:
+                text = io.TextIOWrapper(stream, encoding="utf-8", newline="", write_through=False)
+                if format == "csv":
+                    writer = csv.writer(text)
+                    if first:
+                        writer.writerow(EXPORT_FIELDS)
+                    write = writer.writerow
+                else:
+                    write = lambda values: text.write(json.dumps(dict(zip(EXPORT_FIELDS, values))) + "\n")
+                while row is not None:
+                    write(row)
+                    count, last_id = count + 1, row[0]
+                    if count >= self.checkpoint_rows:
+                        break
+                    row = next(rows, None)
+                text.flush()
+                # Keep the underlying stream open for the next segment
+                text.detach()
+        finally:
+            if stream is not raw:
+                stream.close()
+        return count, last_id
+
+def read_columnar(path: str) -> Iterator[EmployeeBatch]:
+    """Read back the batches of a (possibly compressed) columnar export."""
+    compression = detect_compression(path)
+    opener = {"gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}.get(compression, open)
+    with opener(path, "rb") as stream:
+        if stream.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+            raise ValueError(f"{path} is not a columnar employee export")
+        while True:
+            batch = EmployeeBatch.read_from(stream)
+            if batch is None:
+                return
+            yield batch
+
+def partition_path(directory: str, department_id: Optional[int], format: str,
+                   compression: Optional[str]) -> str:
+    """File name for one department partition of a partitioned export."""
+    extension = {"columnar": "bin"}.get(format, format)
+    suffix = COMPRESSORS[compression][0] if compression else ""
+    label = "unassigned" if department_id is None else str(department_id)
+    return os.path.join(directory, f"employees-department-{label}.{extension}{suffix}")
+
+def _export_partition(db_path: str, path: str, format: str, compression: Optional[str],
+                      department_id: Optional[int], resume: bool, checkpoint_rows: int) -> Dict[str, Any]:
+    """Worker-process entry point: export one department with its own connection."""
+    db_manager = DatabaseManager(db_path, pool_size=1)
+    try:
+        exporter = EmployeeExporter(db_manager, checkpoint_rows=checkpoint_rows)
+        result = exporter.export(path, format, compression, department_id,
+                                 unassigned=department_id is None, resume=resume)
+        return dict(result, path=path)
+    finally:
+        db_manager.close()
+
+def export_partitioned(db_path: str, directory: str, format: str = "csv",
+                       compression: Optional[str] = None, workers: Optional[int] = None,
+                       resume: bool = False,
+                       checkpoint_rows: int = DEFAULT_CHECKPOINT_ROWS) -> List[Dict[str, Any]]:
+    """Export each department to its own file, in parallel worker processes.
+
+    Every partition keeps its own progress file, so `resume` only redoes
+    the partitions that had not finished.
+    """
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"unsupported export format {format!r}")
+    os.makedirs(directory, exist_ok=True)
+    db_manager = DatabaseManager(db_path, pool_size=1)
+    try:
+        partitions = EmployeeDAO(db_manager).department_partitions()
+    finally:
+        db_manager.close()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_export_partition, db_path,
+                               partition_path(directory, department_id, format, compression),
+                               format, compression, department_id, resume, checkpoint_rows)
+                   for department_id in partitions]
+        return [future.result() for future in futures]
@@ -0,0 +1,289 @@
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote
+from data_access.instrumentation import EXPLAINABLE, normalize_sql
+
+# String and numeric literals, masked so statements differing only in values group together
+LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+# EXPLAIN QUERY PLAN line for a full table scan (no index at all)
+FULL_SCAN_PATTERN = re.compile(r"^\s*SCAN (\w+)\s*$")
+
+# Table references in FROM and JOIN clauses, with an optional alias
+TABLE_REF_PATTERN = re.compile(r"\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?", re.IGNORECASE)
+
+# Words that may follow a table name but are not aliases
+NOT_ALIASES = {"where", "join", "inner", "left", "right", "cross", "natural", "on", "using",
+               "group", "order", "limit", "having", "union", "except", "intersect", "window",
+               "indexed", "not", "full", "outer"}
+
+# Indexes built on the scratch copy are named with this prefix
+SCRATCH_INDEX_PREFIX = "advisor_candidate_"
+
+# Largest candidate index, counting the covering columns
+MAX_INDEX_COLUMNS = 6
+
+def workload_key(sql: str) -> str:
+    """Normalized SQL with literals replaced by `?`."""
+    return LITERAL_PATTERN.sub("?", normalize_sql(sql))
+
+def query_plan(connection: sqlite3.Connection, sql: str) -> List[str]:
+    """EXPLAIN QUERY PLAN detail lines, indented by depth; raises on invalid SQL."""
+    if not sql.lstrip().upper().startswith(EXPLAINABLE):
+        raise ValueError("Only SELECT, WITH, INSERT, UPDATE, DELETE and REPLACE statements have a query plan")
+    # Bypass statement instrumentation so plans are not counted as queries
+    rows = sqlite3.Connection.execute(connection, f"EXPLAIN QUERY PLAN {sql}").fetchall()
+    depth = {0: 0}
+    lines = []
+    for node_id, parent_id, _, detail in rows:
+        depth[node_id] = depth.get(parent_id, 0) + 1
+        lines.append("  " * (depth[node_id] - 1) + detail)
+    return lines
+
+def table_aliases(sql: str) -> Dict[str, str]:
+    """Map each table name and alias in FROM/JOIN clauses to its table."""
+    aliases = {}
+    for table, alias in TABLE_REF_PATTERN.findall(sql):
+        aliases[table] = table
+        if alias and alias.lower() not in NOT_ALIASES:
+            aliases[alias] = table
+    return aliases
+
+def full_scans(sql: str, plan: Sequence[str]) -> List[str]:
+    """Tables the plan reads with a full scan that uses no index."""
+    aliases = table_aliases(sql)
+    scanned = []
+    for line in plan:
+        match = FULL_SCAN_PATTERN.match(line)
+        if match:
+            table = aliases.get(match.group(1), match.group(1))
+            if table not in scanned:
+                scanned.append(table)
+    return scanned
+
+def _column_pattern(column: str, qualifiers: Sequence[str]) -> str:
+    prefixes = "|".join(re.escape(q) + r"\." for q in qualifiers)
+    return rf"(?<![\w.])(?:{prefixes})?{re.escape(column)}\b" if prefixes else rf"(?<![\w.]){re.escape(column)}\b"
+
+def candidate_indexes(sql: str, table: str, columns: Sequence[str]) -> List[Tuple[str, ...]]:
+    """Propose index column lists for a table scanned by `sql`.
+
+    Equality predicates come first, then either the first range predicate or
+    the ORDER BY columns; a covering variant appends every other column the
+    statement mentions. This is a heuristic: the advisor keeps only the
+    candidates that measurably speed the statement up.
+    """
+    text = LITERAL_PATTERN.sub("?", sql)
+    qualifiers = [name for name, target in table_aliases(text).items() if target == table]
+    order_match = re.search(r"\bORDER\s+BY\s+(.*?)(?:\bLIMIT\b|\bOFFSET\b|$)", text, re.IGNORECASE | re.DOTALL)
+    order_clause = order_match.group(1) if order_match else ""
+    where_text = text[:order_match.start()] if order_match else text
+
+    equality, ranges, order, mentioned = [], [], [], []
+    for column in columns:
+        pattern = _column_pattern(column, qualifiers)
+        if not re.search(pattern, text, re.IGNORECASE):
+            continue
+        mentioned.append(column)
+        if re.search(pattern + r"\s*(?:==?|\bIS\b(?!\s+NOT)|\bIN\b)", where_text, re.IGNORECASE):
+            equality.append(column)
+        elif re.search(pattern + r"\s*(?:<|>|\bBETWEEN\b|\bLIKE\b|\bGLOB\b)", where_text, re.IGNORECASE):
+            ranges.append(column)
+    if order_clause:
+        positions = []
+        for column in columns:
+            found = re.search(_column_pattern(column, qualifiers), order_clause, re.IGNORECASE)
+            if found:
+                positions.append((found.start(), column))
+        order = [column for _, column in sorted(positions)]
+
+    leads = []
+    if ranges:
+        leads.append(tuple(equality + ranges[:1]))
+    if order:
+        leads.append(tuple(equality + [column for column in order if column not in equality]))
+    if equality and not leads:
+        leads.append(tuple(equality))
+    candidates = []
+    for lead in leads:
+        if not lead:
+            continue
+        candidates.append(lead)
+        covering = lead + tuple(column for column in mentioned if column not in lead)
+        if covering != lead and len(covering) <= MAX_INDEX_COLUMNS:
+            candidates.append(covering)
+    return list(dict.fromkeys(candidates))
+
+class WorkloadRecorder:
+    """Thread-safe tally of executed statements, grouped by shape.
+
+    Each shape keeps its call count, total and worst latency and the most
+    recent concrete statement, which the index advisor replays. When full,
+    the shape with the least total time is dropped to make room.
+    """
+
+    def __init__(self, max_statements: int = 500):
+        self.max_statements = max_statements
+        self._statements: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, sql: str, elapsed_ms: float, rows: int = 0):
+        key = workload_key(sql)
+        with self._lock:
+            entry = self._statements.get(key)
+            if entry is None:
+                if len(self._statements) >= self.max_statements:
+                    coldest = min(self._statements, key=lambda k: self._statements[k]["total_ms"])
+                    del self._statements[coldest]
+                entry = self._statements[key] = {"shape": key, "count": 0, "total_ms": 0.0,
+                                                 "max_ms": 0.0, "rows": 0}
+            entry["sample_sql"] = sql
+            entry["count"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+            entry["rows"] += rows
+
+    def statements(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Recorded shapes, most total time first."""
+        with self._lock:
+            entries = [dict(entry) for entry in self._statements.values()]
+        entries.sort(key=lambda entry: entry["total_ms"], reverse=True)
+        for entry in entries:
+            entry["total_ms"] = round(entry["total_ms"], 3)
+            entry["max_ms"] = round(entry["max_ms"], 3)
+            entry["mean_ms"] = round(entry["total_ms"] / entry["count"], 3)
+        return entries[:limit] if limit else entries
+
+    def reset(self):
+        with self._lock:
+            self._statements.clear()
+
+class IndexAdvisor:
+    """Proposes indexes for a workload by trying them on a scratch copy.
+
+    The database is copied into memory with the backup API, so candidate
+    indexes are built and timed without touching the real file. For every
+    full-scan statement in the workload, candidates are created one at a
+    time and each affected statement is re-timed (best of `runs`).
+    Estimated benefit is the per-call saving times the recorded call count.
+    """
+
+    def __init__(self, db_path: str, runs: int = 3, timeout_ms: int = 5000,
+                 min_improvement: float = 0.2):
+        self.db_path = db_path
+        self.runs = runs
+        self.timeout_ms = timeout_ms
+        self.min_improvement = min_improvement
+
+    def _scratch_copy(self) -> sqlite3.Connection:
+        source = sqlite3.connect(f"file:{quote(self.db_path)}?mode=ro", uri=True)
+        scratch = sqlite3.connect(":memory:")
+        try:
+            source.backup(scratch)
+        finally:
+            source.close()
+        scratch.execute("PRAGMA query_only = ON")
+        return scratch
+
+    def _time(self, scratch: sqlite3.Connection, sql: str) -> Optional[float]:
+        """Best-of-runs wall time in ms for running `sql` to completion, or None on timeout."""
+        best = None
+        for _ in range(self.runs):
+            deadline = time.monotonic() + self.timeout_ms / 1000
+            scratch.set_progress_handler(lambda: time.monotonic() > deadline, 10000)
+            started = time.perf_counter()
+            try:
+                cursor = scratch.execute(sql)
+                while cursor.fetchmany(1000):
+                    pass
+            except sqlite3.OperationalError as e:
+                if str(e) == "interrupted":
+                    return None
+                raise
+            finally:
+                scratch.set_progress_handler(None, 0)
+            elapsed = (time.perf_counter() - started) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    @staticmethod
+    def _ddl(scratch: sqlite3.Connection, sql: str):
+        scratch.execute("PRAGMA query_only = OFF")
+        try:
+            scratch.execute(sql)
+        finally:
+            scratch.execute("PRAGMA query_only = ON")
+
+    def advise(self, workload: Sequence[Dict[str, Any]], max_statements: int = 10) -> Dict[str, Any]:
+        """Return proposed indexes and the statements each one speeds up.
+
+        `workload` entries need `sample_sql` and `count`, as produced by
+        WorkloadRecorder.statements().
+        """
+        started = time.perf_counter()
+        scratch = self._scratch_copy()
+        try:
+            statements, candidates, skipped = [], {}, []
+            for entry in workload[:max_statements]:
+                sql = entry["sample_sql"]
+                try:
+                    plan = query_plan(scratch, sql)
+                    scanned = full_scans(sql, plan)
+                    baseline = self._time(scratch, sql) if scanned else None
+                except (sqlite3.Error, ValueError) as e:
+                    skipped.append({"shape": entry.get("shape", sql), "reason": str(e)})
+                    continue
+                if not scanned:
+                    continue
+                statement = {"shape": entry.get("shape", sql), "sql": sql, "count": entry.get("count", 1),
+                             "plan": plan, "full_scans": scanned, "baseline_ms": baseline}
+                statements.append(statement)
+                for table in scanned:
+                    columns = [row[1] for row in scratch.execute(f"PRAGMA table_info({table})")]
+                    for index_columns in candidate_indexes(sql, table, columns):
+                        candidates.setdefault((table, index_columns), [])
+
+            proposals = []
+            base_pages = scratch.execute("PRAGMA page_count").fetchone()[0]
+            page_size = scratch.execute("PRAGMA page_size").fetchone()[0]
+            for number, (table, columns) in enumerate(candidates):
+                name = f"{SCRATCH_INDEX_PREFIX}{number}"
+                self._ddl(scratch, f"CREATE INDEX {name} ON {table} ({', '.join(columns)})")
+                try:
+                    size_bytes = (scratch.execute("PRAGMA page_count").fetchone()[0] - base_pages) * page_size
+                    helped, saving = [], 0.0
+                    for statement in statements:
+                        if table not in statement["full_scans"] or statement["baseline_ms"] is None:
+                            continue
+                        plan = query_plan(scratch, statement["sql"])
+                        if not any(name in line for line in plan):
+                            continue
+                        after = self._time(scratch, statement["sql"])
+                        before = statement["baseline_ms"]
+                        if after is None or after > before * (1 - self.min_improvement):
+                            continue
+                        saving += (before - after) * statement["count"]
+                        helped.append({"shape": statement["shape"], "before_ms": round(before, 3),
+                                       "after_ms": round(after, 3), "count": statement["count"],
+                                       "plan": [line.replace(name, "<proposed>") for line in plan]})
+                finally:
+                    self._ddl(scratch, f"DROP INDEX {name}")
+                if helped:
+                    index_name = f"idx_{table}_{'_'.join(columns)}"
+                    proposals.append({"table": table, "columns": list(columns),
+                                      "ddl": f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({', '.join(columns)})",
+                                      "estimated_saving_ms": round(saving, 3), "size_bytes": size_bytes,
+                                      "statements": helped})
+            proposals.sort(key=lambda proposal: proposal["estimated_saving_ms"], reverse=True)
+            return {"proposals": proposals,
+                    "full_scan_statements": [{key: statement[key] for key in
+                                              ("shape", "count", "full_scans", "baseline_ms", "plan")}
+                                             for statement in statements],
+                    "skipped": skipped,
+                    "candidates_tried": len(candidates),
+                    "elapsed_ms": round((time.perf_counter() - started) * 1000, 3)}
+        finally:
+            scratch.close()
@@ -0,0 +1,391 @@
+import functools
+import inspect
+import json
+import logging
+import sqlite3
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+slow_query_logger = logging.getLogger("data_access.slow_query")
+
+# Upper bounds (milliseconds) of the latency histogram buckets
+LATENCY_BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Statements that EXPLAIN QUERY PLAN can describe
+EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "REPLACE")
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace outside quoted text and drop a trailing semicolon."""
+    parts = []
+    quote_char = None
+    pending_space = False
+    for char in sql.strip().rstrip(";").strip():
+        if quote_char:
+            parts.append(char)
+            if char == quote_char:
+                quote_char = None
+        elif char.isspace():
+            pending_space = True
+        else:
+            if pending_space:
+                parts.append(" ")
+                pending_space = False
+            parts.append(char)
+            if char in "'\"`":
+                quote_char = char
+            elif char == "[":
+                quote_char = "]"
+    return "".join(parts)
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with count, sum, min and max."""
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms: Optional[float] = None
+        self.max_ms: Optional[float] = None
+
+    def record(self, seconds: float):
+        ms = seconds * 1000
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.min_ms = ms if self.min_ms is None else min(self.min_ms, ms)
+        self.max_ms = ms if self.max_ms is None else max(self.max_ms, ms)
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        """Upper bound of the bucket holding the given quantile."""
+        if not self.count:
+            return None
+        target = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return LATENCY_BUCKETS_MS[index] if index < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else None,
+            "min_ms": self.min_ms,
+            "max_ms": self.max_ms,
+            "p50_ms": self.quantile(0.5),
+            "p90_ms": self.quantile(0.9),
+            "p99_ms": self.quantile(0.99),
+            "buckets": dict([(f"le_{bound}", count) for bound, count in zip(LATENCY_BUCKETS_MS, self.counts)]
+                            + [("le_inf", self.counts[-1])]),
+        }
+
+class QueryMetrics:
+    """Thread-safe registry of statement, DAO-method and pool-wait metrics.
+
+    Statements slower than `slow_query_ms` are logged to the
+    `data_access.slow_query` logger together with their query plan.
+    """
+
+    def __init__(self, slow_query_ms: Optional[float] = 100.0, max_statements: int = 500,
+                 max_slow_queries: int = 50, trace_statements: bool = True):
+        self.slow_query_ms = slow_query_ms
+        # Counting every statement SQLite runs (trigger bodies included) costs a
+        # Python call each; turn off for bulk loads
+        self.trace_statements = trace_statements
+        self.max_statements = max_statements
+        self._lock = threading.Lock()
+        self._max_slow_queries = max_slow_queries
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._statements: Dict[str, Dict[str, Any]] = {}
+            self._methods: Dict[str, Dict[str, Any]] = {}
+            self._acquire_wait = LatencyHistogram()
+            self._traced: Dict[str, int] = {}
+            self._slow_queries = deque(maxlen=self._max_slow_queries)
+
+    @staticmethod
+    def _entry(table: Dict[str, Dict[str, Any]], key: str) -> Dict[str, Any]:
+        entry = table.get(key)
+        if entry is None:
+            entry = table[key] = {"latency": LatencyHistogram(), "rows": 0, "errors": 0}
+        return entry
+
+    def record_statement(self, sql: str, seconds: float, rows: int, error: bool = False,
+                         connection: Optional[sqlite3.Connection] = None,
+                         parameters: Optional[Sequence] = None):
+        key = normalize_sql(sql)
+        with self._lock:
+            if key not in self._statements and len(self._statements) >= self.max_statements:
+                key = "<other>"
+            entry = self._entry(self._statements, key)
+            entry["latency"].record(seconds)
+            entry["rows"] += max(rows, 0)
+            entry["errors"] += error
+        if self.slow_query_ms is not None and seconds * 1000 >= self.slow_query_ms:
+            self._log_slow_query(sql, seconds, rows, connection, parameters)
+
+    def record_method(self, name: str, seconds: float, rows: int = 0, error: bool = False):
+        with self._lock:
+            entry = self._entry(self._methods, name)
+            entry["latency"].record(seconds)
+            entry["rows"] += rows
+            entry["errors"] += error
+
+    def record_acquire_wait(self, seconds: float):
+        with self._lock:
+            self._acquire_wait.record(seconds)
+
+    def record_traced(self, sql: str):
+        """Count a statement reported by SQLite's trace callback, by verb."""
+        verb = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else "<empty>"
+        with self._lock:
+            self._traced[verb] = self._traced.get(verb, 0) + 1
+
+    def _log_slow_query(self, sql: str, seconds: float, rows: int,
+                        connection: Optional[sqlite3.Connection], parameters: Optional[Sequence]):
+        plan = explain_query_plan(connection, sql, parameters) if connection is not None else []
+        record = {"sql": normalize_sql(sql), "ms": round(seconds * 1000, 3), "rows": rows, "plan": plan,
+                  "at": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        with self._lock:
+            self._slow_queries.append(record)
+        slow_query_logger.warning("Slow query (%.1f ms, %d rows): %s\n%s", record["ms"], rows, record["sql"],
+                                  "\n".join(plan) or "(no plan)")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return all metrics as plain, JSON-serializable data."""
+        def export(table):
+            return {key: {"rows": entry["rows"], "errors": entry["errors"],
+                          "latency": entry["latency"].snapshot()}
+                    for key, entry in table.items()}
+        with self._lock:
+            return {
+                "statements": export(self._statements),
+                "methods": export(self._methods),
+                "acquire_wait": self._acquire_wait.snapshot(),
+                "traced_statements": dict(self._traced),
+                "slow_query_ms": self.slow_query_ms,
+                "slow_queries": list(self._slow_queries),
+            }
+
+    def export_json(self, path: str):
+        """Write a snapshot to `path` as JSON."""
+        with open(path, "w") as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+# Registry shared by DatabaseManager instances and the MCP server
+METRICS = QueryMetrics()
+
+def explain_query_plan(connection: sqlite3.Connection, sql: str,
+                       parameters: Optional[Sequence] = None) -> List[str]:
+    """Return EXPLAIN QUERY PLAN output as indented lines, or [] if unavailable."""
+    if not sql.lstrip().upper().startswith(EXPLAINABLE):
+        return []
+    try:
+        rows = sqlite3.Connection.execute(connection, f"EXPLAIN QUERY PLAN {sql}",
+                                          parameters or ()).fetchall()
+    except sqlite3.Error:
+        return []
+    depth = {0: 0}
+    lines = []
+    for node_id, parent_id, _, detail in rows:
+        depth[node_id] = depth.get(parent_id, 0) + 1
+        lines.append("  " * (depth[node_id] - 1) + detail)
+    return lines
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Cursor that times each statement from execute until its rows are consumed."""
+
+    def _begin(self, sql: str, parameters: Sequence, elapsed: float, error: bool = False):
+        self._sql = sql
+        self._parameters = parameters
+        self._elapsed = elapsed
+        self._rows = 0
+        self._error = error
+        if error:
+            self._flush()
+
+    def _flush(self, explain: bool = True):
+        sql = getattr(self, "_sql", None)
+        if sql is None:
+            return
+        self._sql = None
+        rows = self._rows if self.description is not None or self._error else self.rowcount
+        self.connection.metrics.record_statement(sql, self._elapsed, rows, self._error,
+                                                 self.connection if explain else None,
+                                                 self._parameters)
+
+    def _timed(self, method: Callable, *args):
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            if getattr(self, "_sql", None) is not None:
+                self._elapsed += time.perf_counter() - start
+
+    def execute(self, sql, parameters=()):
+        self._flush()
+        start = time.perf_counter()
+        try:
+            super().execute(sql, parameters)
+        except Exception:
+            self._begin(sql, parameters, time.perf_counter() - start, error=True)
+            raise
+        self._begin(sql, parameters, time.perf_counter() - start)
+        if self.description is None:
+            self._flush()
+        return self
+
+    def executemany(self, sql, seq_of_parameters):
+        self._flush()
+        start = time.perf_counter()
+        try:
+            super().executemany(sql, seq_of_parameters)
+        except Exception:
+            self._begin(sql, None, time.perf_counter() - start, error=True)
+            raise
+        self._begin(sql, None, time.perf_counter() - start)
+        self._flush()
+        return self
+
+    def fetchone(self):
+        row = self._timed(super().fetchone)
+        if row is None:
+            self._flush()
+        elif getattr(self, "_sql", None) is not None:
+            self._rows += 1
+        return row
+
+    def fetchmany(self, size=None):
+        size = self.arraysize if size is None else size
+        rows = self._timed(super().fetchmany, size)
+        if getattr(self, "_sql", None) is not None:
+            self._rows += len(rows)
+            if len(rows) < size:
+                self._flush()
+        return rows
+
+    def fetchall(self):
+        rows = self._timed(super().fetchall)
+        if getattr(self, "_sql", None) is not None:
+            self._rows += len(rows)
+            self._flush()
+        return rows
+
+    def __next__(self):
+        try:
+            row = self._timed(super().__next__)
+        except StopIteration:
+            self._flush()
+            raise
+        if getattr(self, "_sql", None) is not None:
+            self._rows += 1
+        return row
+
+    def close(self):
+        self._flush()
+        super().close()
+
+    def __del__(self):
+        # Partially consumed cursors (e.g. paged fetchmany) report when dropped
+        try:
+            self._flush(explain=False)
+        except (sqlite3.Error, AttributeError):
+            pass
+
+class InstrumentedConnection(sqlite3.Connection):
+    """Connection whose cursors (including `execute` shortcuts) are instrumented."""
+
+    metrics: QueryMetrics = METRICS
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or InstrumentedCursor)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+def instrument_connection(conn: InstrumentedConnection, metrics: QueryMetrics) -> InstrumentedConnection:
+    """Attach `metrics` to a connection and, if enabled, trace every statement SQLite runs."""
+    conn.metrics = metrics
+    if metrics.trace_statements:
+        conn.set_trace_callback(metrics.record_traced)
+    return conn
+
+def _result_rows(result: Any) -> int:
+    """Rows a DAO call returned: the size of a collection, else 1 for any value."""
+    if hasattr(result, "__len__"):
+        return len(result)
+    return int(result is not None)
+
+def instrument_dao(cls):
+    """Class decorator recording latency of every public DAO method.
+
+    Metrics go to `self.db_manager.metrics`; when that is None the original
+    method runs with no extra work beyond an attribute lookup.
+    """
+    for name, method in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(method):
+            continue
+        label = f"{cls.__name__}.{name}"
+        if inspect.isgeneratorfunction(method):
+            setattr(cls, name, _instrument_generator(method, label))
+        else:
+            setattr(cls, name, _instrument_method(method, label))
+    return cls
+
+def _instrument_method(method: Callable, label: str) -> Callable:
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        metrics = self.db_manager.metrics
+        if metrics is None:
+            return method(self, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            result = method(self, *args, **kwargs)
+        except Exception:
+            metrics.record_method(label, time.perf_counter() - start, error=True)
+            raise
+        metrics.record_method(label, time.perf_counter() - start, _result_rows(result))
+        return result
+    return wrapper
+
+def _instrument_generator(method: Callable, label: str) -> Callable:
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        metrics = self.db_manager.metrics
+        if metrics is None:
+            yield from method(self, *args, **kwargs)
+            return
+        # Only time spent producing items counts, not time the consumer holds them
+        generator = method(self, *args, **kwargs)
+        elapsed = 0.0
+        items = 0
+        error = False
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(generator)
+                except StopIteration:
+                    elapsed += time.perf_counter() - start
+                    return
+                except Exception:
+                    elapsed += time.perf_counter() - start
+                    error = True
+                    raise
+                elapsed += time.perf_counter() - start
+                items += 1
+                yield item
+        finally:
+            generator.close()
+            metrics.record_method(label, elapsed, items, error)
+    return wrapper
@@ -0,0 +1,222 @@
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Sequence
+
+logger = logging.getLogger("data_access.migrations")
+
+NAME_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE employees_fts USING fts5(
+        name, content='employees', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS employees_fts_ai AFTER INSERT ON employees BEGIN
+        INSERT INTO employees_fts (rowid, name) VALUES (new.id, new.name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS employees_fts_ad AFTER DELETE ON employees BEGIN
+        INSERT INTO employees_fts (employees_fts, rowid, name)
+        VALUES ('delete', old.id, old.name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS employees_fts_au AFTER UPDATE OF id, name ON employees BEGIN
+        INSERT INTO employees_fts (employees_fts, rowid, name)
+        VALUES ('delete', old.id, old.name);
+        INSERT INTO employees_fts (rowid, name) VALUES (new.id, new.name);
+    END
+    """,
+]
+
+# Schema version and whether the trigram search table exists, in one round trip
+SCHEMA_STATE_QUERY = """
+    SELECT (SELECT user_version FROM pragma_user_version),
+           EXISTS (SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'employees_fts')
+"""
+
+class SchemaVersionError(sqlite3.DatabaseError):
+    """Raised when the database schema is newer than this code understands."""
+
+@dataclass
+class Migration:
+    """One ordered schema change; `version` is the user_version it leaves behind."""
+    version: int
+    description: str
+    apply: Callable[[sqlite3.Connection], None]
+
+def column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
+    return any(row[1] == column for row in conn.execute(f"PRAGMA table_info({table})"))
+
+def add_column(conn: sqlite3.Connection, table: str, column: str, definition: str):
+    """ALTER TABLE ... ADD COLUMN, skipped when the column already exists."""
+    if not column_exists(conn, table, column):
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+def _create_tables(conn: sqlite3.Connection):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS departments (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS employees (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            department_id INTEGER,
+            salary REAL,
+            hire_date TEXT,
+            FOREIGN KEY (department_id) REFERENCES departments(id)
+        )
+    """)
+
+def _create_listing_indexes(conn: sqlite3.Connection):
+    # Supports ORDER BY name and keyset pagination on (name, id)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_employees_name_id ON employees (name, id)")
+    # Supports per-department listings in (name, id) order
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_employees_department_name_id
+        ON employees (department_id, name, id)
+    """)
+
+def _create_name_search(conn: sqlite3.Connection):
+    """Create and backfill the trigram name index.
+
+    Builds without FTS5 trigram support skip it; name searches then fall
+    back to LIKE scans.
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'employees_fts'").fetchone()
+    if exists:
+        return
+    conn.execute("SAVEPOINT name_search")
+    try:
+        for statement in NAME_SEARCH_DDL:
+            conn.execute(statement)
+        # Index rows written before the search table existed
+        conn.execute("INSERT INTO employees_fts (employees_fts) VALUES ('rebuild')")
+    except sqlite3.OperationalError as e:
+        conn.execute("ROLLBACK TO name_search")
+        logger.warning("Trigram name search unavailable, using LIKE scans: %s", e)
+    conn.execute("RELEASE name_search")
+
+def _create_query_indexes(conn: sqlite3.Connection):
+    # Salary and hire-date ranges and sorts, overall and within one department,
+    # for EmployeeQuery; `id` last so keyset pages stay in index order
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_employees_salary_id ON employees (salary, id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_employees_hire_date_id ON employees (hire_date, id)")
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_employees_department_salary_id
+        ON employees (department_id, salary, id)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_employees_department_hire_date_id
+        ON employees (department_id, hire_date, id)
+    """)
+
+CHANGELOG_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS changelog (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        table_name TEXT NOT NULL,
+        row_id INTEGER NOT NULL,
+        operation TEXT NOT NULL CHECK (operation IN ('insert', 'update', 'delete')),
+        data TEXT,
+        changed_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
+    )
+    """,
+    # Supports compaction, which keeps only the newest entry per row
+    "CREATE INDEX IF NOT EXISTS idx_changelog_row ON changelog (table_name, row_id, seq)",
+    # Highest sequence number removed by purging; readers behind it must resync
+    """
+    CREATE TABLE IF NOT EXISTS changelog_state (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        purged_through INTEGER NOT NULL
+    )
+    """,
+    "INSERT OR IGNORE INTO changelog_state (id, purged_through) VALUES (1, 0)",
+]
+
+# Row images as JSON; AUTOINCREMENT keeps sequence numbers increasing after purges
+CHANGELOG_TRIGGERS = {
+    "employees": "json_object('id', {row}.id, 'name', {row}.name, 'department_id', {row}.department_id, "
+                 "'salary', {row}.salary, 'hire_date', {row}.hire_date)",
+    "departments": "json_object('id', {row}.id, 'name', {row}.name)",
+}
+
+def _create_changelog(conn: sqlite3.Connection):
+    for statement in CHANGELOG_DDL:
+        conn.execute(statement)
+    for table, image in CHANGELOG_TRIGGERS.items():
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_changelog_ai AFTER INSERT ON {table} BEGIN
+                INSERT INTO changelog (table_name, row_id, operation, data)
+                VALUES ('{table}', new.id, 'insert', {image.format(row="new")});
+            END
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_changelog_au AFTER UPDATE ON {table} BEGIN
+                INSERT INTO changelog (table_name, row_id, operation)
+                SELECT '{table}', old.id, 'delete' WHERE old.id <> new.id;
+                INSERT INTO changelog (table_name, row_id, operation, data)
+                VALUES ('{table}', new.id, 'update', {image.format(row="new")});
+            END
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_changelog_ad AFTER DELETE ON {table} BEGIN
+                INSERT INTO changelog (table_name, row_id, operation)
+                VALUES ('{table}', old.id, 'delete');
+            END
+        """)
+
+# Append new migrations at the end; never edit or reorder applied ones
+MIGRATIONS: List[Migration] = [
+    Migration(1, "create departments and employees tables", _create_tables),
+    Migration(2, "add (name, id) and (department_id, name, id) indexes", _create_listing_indexes),
+    Migration(3, "add trigram name search index", _create_name_search),
+    Migration(4, "add salary and hire-date query indexes", _create_query_indexes),
+    Migration(5, "add trigger-maintained changelog for employees and departments", _create_changelog),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+def schema_state(conn: sqlite3.Connection):
+    """Return (user_version, name search table exists)."""
+    version, fts = conn.execute(SCHEMA_STATE_QUERY).fetchone()
+    return version, bool(fts)
+
+def migrate(conn: sqlite3.Connection, migrations: Sequence[Migration] = MIGRATIONS) -> List[Dict[str, Any]]:
+    """Apply pending migrations in order, each in its own IMMEDIATE transaction.
+
+    The version is re-read under the write lock, so concurrent processes
+    starting against the same file apply each migration exactly once.
+    Returns the version, description and duration of every migration applied.
+    """
+    applied = []
+    known = conn.execute("PRAGMA user_version").fetchone()[0]
+    for migration in migrations:
+        if migration.version <= known:
+            continue
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            current = conn.execute("PRAGMA user_version").fetchone()[0]
+            if current >= migration.version:
+                conn.rollback()
+                continue
+            start = time.perf_counter()
+            migration.apply(conn)
+            conn.execute(f"PRAGMA user_version = {int(migration.version)}")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        duration_ms = (time.perf_counter() - start) * 1000
+        logger.info("Applied migration %d (%s) in %.1f ms", migration.version,
+                    migration.description, duration_ms)
+        applied.append({"version": migration.version, "description": migration.description,
+                        "duration_ms": duration_ms})
+    return applied
@@ -0,0 +1,184 @@
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+from models.employee import Employee
+
+# Columns a query may be ordered by; `id` always breaks ties
+SORT_KEYS = ("name", "salary", "hire_date", "id")
+
+# Sort columns that may hold NULL; NULLs order before every value, as the indexes store them
+NULLABLE_SORT_KEYS = ("salary", "hire_date")
+
+# Position after the last row of a page: (sort column value, id)
+QueryCursor = Tuple[Any, int]
+
+def _prefix_upper_bound(prefix: str) -> str:
+    """Smallest string greater than every string starting with `prefix`."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+@dataclass(frozen=True)
+class EmployeeQuery:
+    """Composable employee filter, sort and page, compiled to one SQL statement.
+
+    Build with the chaining helpers, each of which returns a new query:
+
+        EmployeeQuery().where(department_id=2, min_salary=50000)
+                       .order_by("salary", descending=True).page(50)
+
+    Salary and hire-date bounds are inclusive. `name_prefix` is matched
+    case-sensitively as an index range. Use `after` with the cursor of the
+    previous page's last row (see `cursor_for`) for keyset pagination, or
+    `offset` for small jumps. Sorting never filters: employees without a
+    salary or hire date come first in ascending order and last in
+    descending order.
+    """
+    department_id: Optional[int] = None
+    min_salary: Optional[float] = None
+    max_salary: Optional[float] = None
+    hired_from: Optional[str] = None
+    hired_to: Optional[str] = None
+    name_prefix: Optional[str] = None
+    sort_key: str = "name"
+    descending: bool = False
+    limit: Optional[int] = None
+    offset: int = 0
+    after: Optional[QueryCursor] = None
+
+    def __post_init__(self):
+        if self.sort_key not in SORT_KEYS:
+            raise ValueError(f"sort_key must be one of {', '.join(SORT_KEYS)}")
+        if self.offset and self.after is not None:
+            raise ValueError("use either offset or after, not both")
+
+    def where(self, **filters) -> "EmployeeQuery":
+        return replace(self, **filters)
+
+    def order_by(self, sort_key: str, descending: bool = False) -> "EmployeeQuery":
+        return replace(self, sort_key=sort_key, descending=descending, after=None)
+
+    def page(self, limit: Optional[int], offset: int = 0) -> "EmployeeQuery":
+        return replace(self, limit=limit, offset=offset)
+
+    def starting_after(self, cursor: Optional[QueryCursor]) -> "EmployeeQuery":
+        return replace(self, after=cursor, offset=0)
+
+    def cursor_for(self, employee: Employee) -> QueryCursor:
+        """Keyset cursor that continues after `employee` in this query's order."""
+        return (getattr(employee, self.sort_key), employee.id)
+
+    def order_key(self, employee: Employee) -> Tuple:
+        """Python sort key matching the SQL order, with NULL before every value."""
+        value = getattr(employee, self.sort_key)
+        return (value is not None, value, employee.id)
+
+    def _after_null(self) -> bool:
+        return (self.after is not None and self.sort_key in NULLABLE_SORT_KEYS
+                and self.after[0] is None)
+
+    def shape(self) -> Tuple:
+        """Which clauses are present; queries with the same shape share compiled SQL."""
+        return (self.department_id is not None, self.min_salary is not None,
+                self.max_salary is not None, self.hired_from is not None,
+                self.hired_to is not None, bool(self.name_prefix), self.sort_key,
+                self.descending, self.limit is not None, bool(self.offset),
+                self.after is not None, self._after_null())
+
+    def compile(self, columns: str, with_department: bool = False) -> Tuple[str, List[Any]]:
+        """Return the SQL selecting `columns` and its parameters.
+
+        Employees are aliased `e`; `with_department` left-joins their
+        department as `d` so `columns` can include `d.name`.
+        """
+        params = self._filter_params()
+        if self.after is not None:
+            if self.sort_key == "id" or self._after_null():
+                params.append(self.after[1])
+            else:
+                params.extend(self.after)
+                if self.descending and self.sort_key in NULLABLE_SORT_KEYS:
+                    # The rows without a value follow in a second, unioned select
+                    params.extend(self._filter_params())
+        if self.limit is not None:
+            params.append(self.limit)
+        if self.offset:
+            params.append(self.offset)
+        return compile_shape(columns, self.shape(), with_department), params
+
+    def _filter_params(self) -> List[Any]:
+        params: List[Any] = []
+        if self.department_id is not None:
+            params.append(self.department_id)
+        if self.min_salary is not None:
+            params.append(self.min_salary)
+        if self.max_salary is not None:
+            params.append(self.max_salary)
+        if self.hired_from is not None:
+            params.append(self.hired_from)
+        if self.hired_to is not None:
+            params.append(self.hired_to)
+        if self.name_prefix:
+            params.extend((self.name_prefix, _prefix_upper_bound(self.name_prefix)))
+        return params
+
+@lru_cache(maxsize=256)
+def compile_shape(columns: str, shape: Tuple, with_department: bool = False) -> str:
+    """Build the SQL text for a query shape; parameters bind in EmployeeQuery.compile order."""
+    (department, min_salary, max_salary, hired_from, hired_to, prefix,
+     sort_key, descending, limit, offset, after, after_null) = shape
+    conditions = []
+    if department:
+        conditions.append("e.department_id = ?")
+    if min_salary:
+        conditions.append("e.salary >= ?")
+    if max_salary:
+        conditions.append("e.salary <= ?")
+    if hired_from:
+        conditions.append("e.hire_date >= ?")
+    if hired_to:
+        conditions.append("e.hire_date <= ?")
+    if prefix:
+        conditions.append("e.name >= ? AND e.name < ?")
+    nullable = sort_key in NULLABLE_SORT_KEYS
+    direction = "DESC" if descending else "ASC"
+    comparison = "<" if descending else ">"
+    key = f"e.{sort_key}"
+    # Rows with a value past the cursor, then the NULL rows. A union keeps
+    # both halves index range scans that SQLite merges in order; one OR'd
+    # predicate would walk the index from the top on every page.
+    compound = after and nullable and descending and not after_null
+    source = "employees e"
+    if with_department:
+        source += " LEFT JOIN departments d ON d.id = e.department_id"
+
+    def select(extra: List[str]) -> str:
+        where = conditions + extra
+        return f"SELECT {columns} FROM {source}" + (" WHERE " + " AND ".join(where) if where else "")
+
+    def order(prefix: str) -> str:
+        if sort_key == "id":
+            return f"{prefix}id {direction}"
+        nulls = f" NULLS {'LAST' if descending else 'FIRST'}" if nullable else ""
+        return f"{prefix}{sort_key} {direction}{nulls}, {prefix}id {direction}"
+
+    if not after:
+        sql = select([])
+    elif sort_key == "id":
+        sql = select([f"e.id {comparison} ?"])
+    elif after_null and descending:
+        # NULLs come last: only the remaining NULL rows are left
+        sql = select([f"{key} IS NULL AND e.id < ?"])
+    elif after_null:
+        # NULLs come first: the remaining NULL rows, then every row with a value
+        sql = select([f"({key} IS NULL AND e.id > ? OR {key} IS NOT NULL)"])
+    elif compound:
+        sql = (select([f"({key}, e.id) < (?, ?)"]) + " UNION ALL "
+               + select([f"{key} IS NULL"]))
+    else:
+        sql = select([f"({key}, e.id) {comparison} (?, ?)"])
+    # A compound ORDER BY names result columns, so `columns` must include both
+    sql += f" ORDER BY {order('' if compound else 'e.')}"
+    if limit:
+        sql += " LIMIT ?"
+    if offset:
+        sql += " LIMIT -1 OFFSET ?" if not limit else " OFFSET ?"
+    return sql
@@ -0,0 +1,151 @@
+import itertools
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+from data_access.connection_pool import ConnectionPool
+
+_replica_ids = itertools.count(1)
+
+class _Generation:
+    """One in-memory copy of the database and the pool that reads from it."""
+
+    def __init__(self, uri: str, anchor: sqlite3.Connection, pool: ConnectionPool,
+                 version: Any, loaded_at: float):
+        self.uri = uri
+        # Keeps the shared in-memory database alive between checkouts
+        self.anchor = anchor
+        self.pool = pool
+        self.version = version
+        self.loaded_at = loaded_at
+
+    def close(self):
+        # Readers still holding connections keep the memory database alive until release
+        self.pool.close()
+        self.anchor.close()
+
+class ReadReplica:
+    """Shared in-memory copy of an on-disk database, refreshed with the backup API.
+
+    Reads check out connections to the current copy. At most once every
+    `max_staleness` seconds a checkout compares `version_source()` with the
+    version the copy was loaded at, and reloads on change; `mark_stale()`
+    forces a reload on the next checkout. A reload builds a new copy while
+    readers keep using the old one, then swaps it in.
+    """
+
+    def __init__(self, db_path: str, version_source: Callable[[], Any], max_staleness: float = 1.0,
+                 pool_size: int = 5, pool_timeout: float = 30.0,
+                 connect: Optional[Callable[[str], sqlite3.Connection]] = None):
+        self.db_path = db_path
+        self.version_source = version_source
+        self.max_staleness = max_staleness
+        self.pool_size = pool_size
+        self.pool_timeout = pool_timeout
+        self._connect_factory = connect
+        self._name = f"employees_replica_{id(self)}_{next(_replica_ids)}"
+        self._generation_ids = itertools.count(1)
+        self._generation: Optional[_Generation] = None
+        self._checked_at = 0.0
+        self._stale = True
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.RLock()
+        self._closed = False
+        self._stats = {"refreshes": 0, "checks": 0, "refresh_seconds": 0.0}
+        self.refresh()
+
+    def _connect(self, uri: str) -> sqlite3.Connection:
+        if self._connect_factory is not None:
+            conn = self._connect_factory(uri)
+        else:
+            conn = sqlite3.connect(uri, uri=True, timeout=self.pool_timeout, check_same_thread=False)
+        conn.execute("PRAGMA query_only = ON")
+        # The copy never changes once loaded, so skip shared-cache table locks
+        conn.execute("PRAGMA read_uncommitted = ON")
+        return conn
+
+    def refresh(self):
+        """Copy the on-disk database into a new in-memory generation and swap it in."""
+        with self._refresh_lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Read replica is closed")
+            start = time.perf_counter()
+            # Read the version first: a commit during the copy triggers another refresh
+            version = self.version_source()
+            uri = f"file:{self._name}_{next(self._generation_ids)}?mode=memory&cache=shared"
+            anchor = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            try:
+                source = sqlite3.connect(self.db_path, timeout=self.pool_timeout)
+                try:
+                    source.backup(anchor)
+                finally:
+                    source.close()
+            except Exception:
+                anchor.close()
+                raise
+            pool = ConnectionPool(uri, max_size=self.pool_size, timeout=self.pool_timeout,
+                                  connect=lambda: self._connect(uri))
+            generation = _Generation(uri, anchor, pool, version, time.time())
+            with self._lock:
+                previous, self._generation = self._generation, generation
+                self._stale = False
+                self._checked_at = time.monotonic()
+                self._stats["refreshes"] += 1
+                self._stats["refresh_seconds"] += time.perf_counter() - start
+            if previous is not None:
+                previous.close()
+
+    def mark_stale(self):
+        """Force a reload before the next read, e.g. after a local commit."""
+        with self._lock:
+            self._stale = True
+
+    def _ensure_fresh(self):
+        with self._lock:
+            if self._generation is None:
+                return
+            stale = self._stale
+            due = time.monotonic() - self._checked_at >= self.max_staleness
+            if due and not stale:
+                self._checked_at = time.monotonic()
+                self._stats["checks"] += 1
+                version = self.version_source()
+                stale = version != self._generation.version
+        if stale:
+            with self._refresh_lock:
+                # Another thread may have reloaded while we waited
+                with self._lock:
+                    stale = self._stale or self.version_source() != self._generation.version
+                if stale:
+                    self.refresh()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Check out a read-only connection to a copy no older than `max_staleness`."""
+        self._ensure_fresh()
+        with self._lock:
+            generation = self._generation
+        if generation is None:
+            raise sqlite3.ProgrammingError("Read replica is closed")
+        with generation.pool.connection() as conn:
+            yield conn
+
+    def stats(self) -> Dict[str, Any]:
+        """Get refresh counters and the age of the current copy."""
+        with self._lock:
+            stats = dict(self._stats)
+            generation = self._generation
+        if generation is not None:
+            stats.update(age_seconds=round(time.time() - generation.loaded_at, 3),
+                         pool=generation.pool.stats())
+        return stats
+
+    def close(self):
+        """Drop the in-memory copy once its readers are done."""
+        with self._refresh_lock:
+            self._closed = True
+            with self._lock:
+                generation, self._generation = self._generation, None
+        if generation is not None:
+            generation.close()
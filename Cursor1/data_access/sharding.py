@@ -0,0 +1,448 @@
+import heapq
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from models.employee import Employee, EmployeeWithDepartment
+from models.employee_batch import EmployeeBatch
+from data_access.database import (DatabaseManager, EmployeeDAO, EmployeeCursor,
+                                  DEFAULT_CHUNK_SIZE, DEFAULT_PAGE_SIZE)
+from data_access.query import EmployeeQuery
+from data_access.util import chunks
+from data_access.concurrency import ConcurrencyMode
+from data_access.instrumentation import QueryMetrics, instrument_dao
+
+def _name_key(employee: Employee) -> Tuple[str, int]:
+    return (employee.name, employee.id)
+
+class ShardedDatabaseManager:
+    """Employees partitioned across several SQLite files by department.
+
+    Department `d` lives in shard `d % len(shard_paths)`; employees without a
+    department live in shard 0. Shard 0 is also the primary for departments,
+    which are copied to every shard so joins stay local; writes through
+    DepartmentDAO are copied as they commit. The manager exposes
+    the DatabaseManager connection API for shard 0, so DepartmentDAO and
+    CachedDepartmentDAO work against it unchanged.
+    """
+
+    def __init__(self, shard_paths: Sequence[str], pool_size: int = 5, pool_timeout: float = 30.0,
+                 metrics: Optional[QueryMetrics] = None, max_workers: Optional[int] = None,
+                 concurrency: Optional[ConcurrencyMode] = None):
+        if not shard_paths:
+            raise ValueError("at least one shard is required")
+        self.metrics = metrics
+        self.shards = [DatabaseManager(path, pool_size=pool_size, pool_timeout=pool_timeout,
+                                       metrics=metrics, concurrency=concurrency) for path in shard_paths]
+        self.primary = self.shards[0]
+        self.db_path = self.primary.db_path
+        self.fts_enabled = self.primary.fts_enabled
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or len(self.shards),
+                                           thread_name_prefix="sqlite-shard")
+        self.replicate_departments()
+        self.reserve_existing_ids()
+
+    def shard_for(self, department_id: Optional[int]) -> int:
+        """Index of the shard that owns employees of `department_id`."""
+        return 0 if department_id is None else department_id % len(self.shards)
+
+    def scatter(self, func: Callable[[int, DatabaseManager], Any]) -> List[Any]:
+        """Run `func(index, shard)` on every shard in parallel; results in shard order."""
+        if len(self.shards) == 1:
+            return [func(0, self.primary)]
+        return list(self.executor.map(func, range(len(self.shards)), self.shards))
+
+    def replicate_departments(self):
+        """Bring the other shards' departments in line with the primary's.
+        
+        Only differences are written, so an unchanged set costs one read per
+        shard and adds nothing to the changelog.
+        """
+        with self.primary.get_read_connection() as conn:
+            departments = dict(conn.execute("SELECT id, name FROM departments").fetchall())
+        for shard in self.shards[1:]:
+            with shard.get_read_connection() as conn:
+                current = dict(conn.execute("SELECT id, name FROM departments").fetchall())
+            changed = [(department_id, name) for department_id, name in departments.items()
+                       if current.get(department_id) != name]
+            removed = [(department_id,) for department_id in current if department_id not in departments]
+            if not changed and not removed:
+                continue
+
+            def sync(conn: sqlite3.Connection):
+                conn.executemany("DELETE FROM departments WHERE id = ?", removed)
+                conn.executemany("""
+                    INSERT INTO departments (id, name) VALUES (?, ?)
+                    ON CONFLICT(id) DO UPDATE SET name = excluded.name
+                """, changed)
+
+            shard.run_write(sync)
+
+    def reserve_existing_ids(self):
+        """Move every shard's ID high-water mark past the largest existing ID.
+        
+        Shards assign IDs from their own residue class above their own
+        AUTOINCREMENT sequence. A database opened as a shard may already hold
+        IDs from every class (a single-file database becoming shard 0), which
+        the other shards would otherwise assign again.
+        """
+        def high_water(index: int, shard: DatabaseManager) -> int:
+            with shard.get_read_connection() as conn:
+                return conn.execute("""
+                    SELECT MAX(COALESCE((SELECT MAX(id) FROM employees), 0),
+                               COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'employees'), 0))
+                """).fetchone()[0]
+
+        marks = self.scatter(high_water)
+        highest = max(marks)
+        for shard, mark in zip(self.shards, marks):
+            if mark < highest:
+                shard.run_write(lambda conn: _set_employee_sequence(conn, highest))
+
+    def get_connection(self):
+        return self.primary.get_connection()
+
+    def get_read_connection(self):
+        return self.primary.get_read_connection()
+
+    def run_write(self, work: Callable[[sqlite3.Connection], Any]) -> Any:
+        return self.primary.run_write(work)
+
+    def run_department_write(self, work: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Write departments on the primary, then copy the change to every other shard."""
+        result = self.primary.run_write(work)
+        self.replicate_departments()
+        return result
+
+    def data_version(self) -> int:
+        return self.primary.data_version()
+
+    def metrics_snapshot(self) -> Optional[Dict[str, Any]]:
+        return self.metrics.snapshot() if self.metrics is not None else None
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Connection pool statistics per shard."""
+        return {shard.db_path: shard.pool_stats() for shard in self.shards}
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        for shard in self.shards:
+            shard.close()
+
+def _set_employee_sequence(conn: sqlite3.Connection, high: int):
+    """Raise the employees AUTOINCREMENT sequence to at least `high`."""
+    updated = conn.execute("UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = 'employees'",
+                           (high,)).rowcount
+    if not updated:
+        conn.execute("INSERT INTO sqlite_sequence (name, seq) VALUES ('employees', ?)", (high,))
+
+@instrument_dao
+class ShardedEmployeeDAO:
+    """EmployeeDAO over a ShardedDatabaseManager.
+
+    Writes go to the shard owning the employee's department. Reads that
+    span departments are scattered to all shards in parallel and the
+    per-shard results, already ordered, are combined with a k-way merge.
+
+    IDs stay globally unique: shard `s` of `n` only assigns IDs with
+    `id % n == s`, above its AUTOINCREMENT high-water mark, and opening the
+    shards raises every mark past the largest ID already stored. An employee
+    moved to a department on another shard keeps its ID, so lookups by ID
+    try the shard the ID was assigned by first and then the others.
+    Moves are not atomic across shard files.
+    """
+
+    def __init__(self, db_manager: ShardedDatabaseManager):
+        self.db_manager = db_manager
+        self.shard_daos = [EmployeeDAO(shard) for shard in db_manager.shards]
+
+    def _home(self, employee_id: int) -> int:
+        return employee_id % len(self.shard_daos)
+
+    def _probe_order(self, employee_id: int) -> List[int]:
+        home = self._home(employee_id)
+        return [home] + [index for index in range(len(self.shard_daos)) if index != home]
+
+    def _reserve(self, employee_ids: Iterable[int]):
+        """Raise each ID's home shard high-water mark so it never assigns these IDs itself."""
+        highest: Dict[int, int] = {}
+        for employee_id in employee_ids:
+            home = self._home(employee_id)
+            highest[home] = max(highest.get(home, employee_id), employee_id)
+        for home, high in highest.items():
+            self.db_manager.shards[home].run_write(lambda conn: _set_employee_sequence(conn, high))
+
+    def _insert(self, shard_index: int, employees: List[Employee], keep_ids: bool = False) -> List[int]:
+        """Insert into one shard, assigning IDs from that shard's residue class.
+
+        With `keep_ids`, employees that already have an ID keep it.
+        """
+        count = len(self.db_manager.shards)
+        if keep_ids:
+            self._reserve(e.id for e in employees if e.id is not None and self._home(e.id) != shard_index)
+
+        def insert(conn: sqlite3.Connection) -> List[int]:
+            # Take the write lock before reading the sequence the new IDs derive from
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'employees'").fetchone()
+            next_id = ((row[0] if row else 0) // count + 1) * count + shard_index
+            ids = []
+            for employee in employees:
+                if keep_ids and employee.id is not None:
+                    ids.append(employee.id)
+                else:
+                    ids.append(next_id)
+                    next_id += count
+            conn.executemany("""
+                INSERT INTO employees (id, name, department_id, salary, hire_date)
+                VALUES (?, ?, ?, ?, ?)
+            """, [(employee_id, e.name, e.department_id, e.salary, e.hire_date)
+                  for employee_id, e in zip(ids, employees)])
+            return ids
+
+        return self.db_manager.shards[shard_index].run_write(insert)
+
+    def _locate(self, employee_ids: Iterable[int]) -> Dict[int, int]:
+        """Map each existing employee ID to the shard holding it."""
+        ids = list(employee_ids)
+
+        def find(index: int, shard: DatabaseManager) -> List[int]:
+            found = []
+            with shard.get_read_connection() as conn:
+                for chunk in chunks(ids, DEFAULT_CHUNK_SIZE):
+                    placeholders = ",".join("?" * len(chunk))
+                    found.extend(row[0] for row in conn.execute(
+                        f"SELECT id FROM employees WHERE id IN ({placeholders})", chunk))
+            return found
+
+        located = {}
+        for index, found in enumerate(self.db_manager.scatter(find)):
+            for employee_id in found:
+                located[employee_id] = index
+        return located
+
+    def _group_by_shard(self, employees: Iterable[Employee]) -> Dict[int, List[Employee]]:
+        groups: Dict[int, List[Employee]] = {}
+        for employee in employees:
+            groups.setdefault(self.db_manager.shard_for(employee.department_id), []).append(employee)
+        return groups
+
+    def _parallel(self, groups: Dict[int, Any], func: Callable[[int, Any], int]) -> int:
+        """Apply `func(shard_index, items)` to each group in parallel and sum the counts."""
+        futures = [self.db_manager.executor.submit(func, index, items) for index, items in groups.items()]
+        return sum(future.result() for future in futures)
+
+    def create(self, employee: Employee) -> int:
+        """Create a new employee in its department's shard and return the ID."""
+        return self._insert(self.db_manager.shard_for(employee.department_id), [employee])[0]
+
+    def read(self, employee_id: int) -> Optional[Employee]:
+        for index in self._probe_order(employee_id):
+            employee = self.shard_daos[index].read(employee_id)
+            if employee is not None:
+                return employee
+        return None
+
+    def read_many(self, employee_ids: Iterable[int]) -> Dict[int, Employee]:
+        """Read the given employees from every shard, keyed by ID."""
+        ids = list(employee_ids)
+        found: Dict[int, Employee] = {}
+        for employees in self.db_manager.scatter(lambda index, shard: self.shard_daos[index].read_many(ids)):
+            found.update(employees)
+        return found
+
+    def read_all(self) -> List[Employee]:
+        """Read all employees ordered by name, merged from every shard."""
+        results = self.db_manager.scatter(lambda index, shard: self.shard_daos[index].read_all())
+        return list(heapq.merge(*results, key=lambda employee: employee.name))
+
+    def update(self, employee: Employee) -> bool:
+        """Update an employee, moving it when its new department lives on another shard."""
+        target = self.db_manager.shard_for(employee.department_id)
+        current = self._locate([employee.id]).get(employee.id)
+        if current is None:
+            return False
+        if current == target:
+            return self.shard_daos[target].update(employee)
+        self._insert(target, [employee], keep_ids=True)
+        self.shard_daos[current].delete(employee.id)
+        return True
+
+    def delete(self, employee_id: int) -> bool:
+        return any(self.db_manager.scatter(
+            lambda index, shard: self.shard_daos[index].delete(employee_id)))
+
+    def create_many(self, employees: Iterable[Employee],
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Insert employees, writing to each shard in parallel."""
+        groups = self._group_by_shard(employees)
+        return self._parallel(groups, lambda index, group: sum(
+            len(self._insert(index, chunk)) for chunk in chunks(group, chunk_size)))
+
+    def update_many(self, employees: Iterable[Employee],
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Update employees in parallel per shard; department moves are applied one by one."""
+        employees = list(employees)
+        located = self._locate(employee.id for employee in employees)
+        in_place: Dict[int, List[Employee]] = {}
+        moved = []
+        for employee in employees:
+            current = located.get(employee.id)
+            if current is None:
+                continue
+            if current == self.db_manager.shard_for(employee.department_id):
+                in_place.setdefault(current, []).append(employee)
+            else:
+                moved.append(employee)
+        updated = self._parallel(in_place, lambda index, group: self.shard_daos[index].update_many(
+            group, chunk_size))
+        return updated + sum(self.update(employee) for employee in moved)
+
+    def delete_many(self, employee_ids: Iterable[int],
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        employee_ids = list(employee_ids)
+        return sum(self.db_manager.scatter(
+            lambda index, shard: self.shard_daos[index].delete_many(employee_ids, chunk_size)))
+
+    def upsert_many(self, employees: Iterable[Employee],
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Update employees whose ID exists on any shard and insert the rest."""
+        employees = list(employees)
+        located = self._locate(employee.id for employee in employees if employee.id is not None)
+        existing = [employee for employee in employees if employee.id in located]
+        new = [employee for employee in employees if employee.id not in located]
+        inserted = self._parallel(self._group_by_shard(new), lambda index, group: sum(
+            len(self._insert(index, chunk, keep_ids=True)) for chunk in chunks(group, chunk_size)))
+        return inserted + self.update_many(existing, chunk_size)
+
+    def _merged_pages(self, read: Callable[[EmployeeDAO], List[Employee]], page_size: int) -> List[Employee]:
+        """Read one page from each shard and keep the first `page_size` in (name, id) order."""
+        pages = self.db_manager.scatter(lambda index, shard: read(self.shard_daos[index]))
+        return list(islice(heapq.merge(*pages, key=_name_key), page_size))
+
+    def read_page(self, after: Optional[EmployeeCursor] = None,
+                  page_size: int = DEFAULT_PAGE_SIZE,
+                  name_pattern: Optional[str] = None) -> List[Employee]:
+        """Read one page ordered by (name, id) across all shards."""
+        return self._merged_pages(lambda dao: dao.read_page(after, page_size, name_pattern), page_size)
+
+    def iter_pages(self, page_size: int = DEFAULT_PAGE_SIZE,
+                   name_pattern: Optional[str] = None) -> Iterator[List[Employee]]:
+        after = None
+        while True:
+            page = self.read_page(after, page_size, name_pattern)
+            if not page:
+                return
+            yield page
+            if len(page) < page_size:
+                return
+            after = _name_key(page[-1])
+
+    def iter_all(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Employee]:
+        for page in self.iter_pages(page_size):
+            yield from page
+
+    def iter_search_by_name(self, name_pattern: str,
+                            page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Employee]:
+        for page in self.iter_pages(page_size, name_pattern):
+            yield from page
+
+    def search_by_name(self, name_pattern: str) -> List[Employee]:
+        """Search every shard in parallel and merge the matches by name."""
+        results = self.db_manager.scatter(
+            lambda index, shard: self.shard_daos[index].search_by_name(name_pattern))
+        return list(heapq.merge(*results, key=_name_key))
+
+    def search_by_name_with_department(self, name_pattern: str) -> List[EmployeeWithDepartment]:
+        results = self.db_manager.scatter(
+            lambda index, shard: self.shard_daos[index].search_by_name_with_department(name_pattern))
+        return list(heapq.merge(*results, key=_name_key))
+
+    def search_ranked(self, term: str, limit: int = 20) -> List[Employee]:
+        """Best matches across shards by bm25 rank; each shard ranks with its own statistics."""
+        results = self.db_manager.scatter(
+            lambda index, shard: self.shard_daos[index].search_ranked_with_scores(term, limit))
+        merged = heapq.merge(*results, key=lambda scored: (scored[0], scored[1].name))
+        return [employee for _, employee in islice(merged, limit)]
+
+    def query(self, query: EmployeeQuery) -> List[Employee]:
+        """Run a query on the department's shard, or on every shard and merge in query order."""
+        return self._query(query, EmployeeDAO.query)
+
+    def query_with_department(self, query: EmployeeQuery) -> List[EmployeeWithDepartment]:
+        return self._query(query, EmployeeDAO.query_with_department)
+
+    def _query(self, query: EmployeeQuery, read: Callable[..., List[Employee]]) -> List[Employee]:
+        if query.department_id is not None:
+            shard = self.db_manager.shard_for(query.department_id)
+            return read(self.shard_daos[shard], query)
+        # Each shard returns its first offset + limit rows; the offset applies to the merge
+        per_shard = query.page(None if query.limit is None else query.offset + query.limit)
+        results = self.db_manager.scatter(lambda index, shard: read(self.shard_daos[index], per_shard))
+        merged = heapq.merge(*results, key=query.order_key, reverse=query.descending)
+        stop = None if query.limit is None else query.offset + query.limit
+        return list(islice(merged, query.offset, stop))
+
+    def count(self, query: EmployeeQuery) -> int:
+        if query.department_id is not None:
+            return self.shard_daos[self.db_manager.shard_for(query.department_id)].count(query)
+        return sum(self.db_manager.scatter(lambda index, shard: self.shard_daos[index].count(query)))
+
+    def iter_query(self, query: EmployeeQuery, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Employee]:
+        remaining = query.limit
+        page_query = query
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            page = self.query(page_query.page(size, page_query.offset))
+            yield from page
+            if len(page) < size:
+                return
+            if remaining is not None:
+                remaining -= len(page)
+            page_query = page_query.starting_after(query.cursor_for(page[-1]))
+
+    def read_with_department(self, employee_id: int) -> Optional[EmployeeWithDepartment]:
+        for index in self._probe_order(employee_id):
+            employee = self.shard_daos[index].read_with_department(employee_id)
+            if employee is not None:
+                return employee
+        return None
+
+    def read_page_with_department(self, after: Optional[EmployeeCursor] = None,
+                                  page_size: int = DEFAULT_PAGE_SIZE,
+                                  department_id: Optional[int] = None) -> List[EmployeeWithDepartment]:
+        """One page of joined rows; a single department is read from its shard only."""
+        if department_id is not None:
+            shard = self.db_manager.shard_for(department_id)
+            return self.shard_daos[shard].read_page_with_department(after, page_size, department_id)
+        return self._merged_pages(lambda dao: dao.read_page_with_department(after, page_size), page_size)
+
+    def iter_with_department(self, department_id: Optional[int] = None,
+                             page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[EmployeeWithDepartment]:
+        after = None
+        while True:
+            page = self.read_page_with_department(after, page_size, department_id)
+            yield from page
+            if len(page) < page_size:
+                return
+            after = _name_key(page[-1])
+
+    def read_all_with_department(self, department_id: Optional[int] = None) -> List[EmployeeWithDepartment]:
+        if department_id is not None:
+            shard = self.db_manager.shard_for(department_id)
+            return self.shard_daos[shard].read_all_with_department(department_id)
+        results = self.db_manager.scatter(
+            lambda index, shard: self.shard_daos[index].read_all_with_department())
+        return list(heapq.merge(*results, key=lambda employee: employee.name))
+
+    def read_batch(self, department_id: Optional[int] = None,
+                   fetch_size: int = DEFAULT_PAGE_SIZE) -> EmployeeBatch:
+        """Columnar batch ordered by ID, from one shard or merged from all."""
+        if department_id is not None:
+            shard = self.db_manager.shard_for(department_id)
+            return self.shard_daos[shard].read_batch(department_id, fetch_size)
+        batches = self.db_manager.scatter(
+            lambda index, shard: self.shard_daos[index].read_batch(None, fetch_size))
+        rows = heapq.merge(*(map(batch.row, range(len(batch))) for batch in batches),
+                           key=lambda row: row[0])
+        return EmployeeBatch.from_rows(rows)
@@ -0,0 +1,11 @@
+from itertools import islice
+from typing import Any, Iterable, Iterator, List
+
+def chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of at most `size` items, consuming `items` lazily."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
@@ -0,0 +1,195 @@
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from models.employee import Employee
+from data_access.database import DatabaseManager
+
+# A queued mutation: called with the writer's connection inside the group transaction
+WriteOperation = Callable[[sqlite3.Connection], Any]
+
+# Marks a flush() barrier in the queue
+_FLUSH = object()
+
+class WriteQueueClosedError(RuntimeError):
+    """Raised when submitting to a queue that has been closed."""
+
+def _insert_employee(employee: Employee) -> WriteOperation:
+    def apply(conn: sqlite3.Connection) -> int:
+        return conn.execute("""
+            INSERT INTO employees (name, department_id, salary, hire_date)
+            VALUES (?, ?, ?, ?)
+        """, (employee.name, employee.department_id, employee.salary, employee.hire_date)).lastrowid
+    return apply
+
+def _update_employee(employee: Employee) -> WriteOperation:
+    def apply(conn: sqlite3.Connection) -> bool:
+        return conn.execute("""
+            UPDATE employees
+            SET name = ?, department_id = ?, salary = ?, hire_date = ?
+            WHERE id = ?
+        """, (employee.name, employee.department_id, employee.salary,
+              employee.hire_date, employee.id)).rowcount > 0
+    return apply
+
+def _delete_employee(employee_id: int) -> WriteOperation:
+    def apply(conn: sqlite3.Connection) -> bool:
+        return conn.execute("DELETE FROM employees WHERE id = ?", (employee_id,)).rowcount > 0
+    return apply
+
+class WriteBehindQueue:
+    """Single writer thread that group-commits queued mutations.
+
+    Callers enqueue operations and get a Future back. The writer takes up to
+    `batch_size` operations, waiting at most `flush_interval` seconds for a
+    batch to fill, and applies them in one IMMEDIATE transaction. Each
+    operation runs under its own savepoint, so a failing one is rolled back
+    and reported on its future without affecting the rest of the batch.
+    Batches commit through `run_write`, so in concurrency mode a locked
+    database is retried with backoff. Futures resolve only after the
+    transaction has committed.
+    """
+
+    def __init__(self, db_manager: DatabaseManager, batch_size: int = 100,
+                 flush_interval: float = 0.005, max_pending: int = 10000):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Tuple[Any, Future]]" = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {"submitted": 0, "applied": 0, "failed": 0, "batches": 0,
+                       "batch_errors": 0, "commit_seconds": 0.0}
+        self._thread = threading.Thread(target=self._run, name="sqlite-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, operation: WriteOperation) -> Future:
+        """Queue `operation(conn)`; the future carries its return value."""
+        future: Future = Future()
+        with self._close_lock:
+            if self._closed:
+                raise WriteQueueClosedError("write queue is closed")
+            self._queue.put((operation, future))
+        with self._stats_lock:
+            self._stats["submitted"] += 1
+        return future
+
+    def create(self, employee: Employee) -> Future:
+        """Queue an insert; the future resolves to the new employee ID."""
+        return self.submit(_insert_employee(employee))
+
+    def update(self, employee: Employee) -> Future:
+        """Queue an update; the future resolves to whether a row changed."""
+        return self.submit(_update_employee(employee))
+
+    def delete(self, employee_id: int) -> Future:
+        """Queue a delete; the future resolves to whether a row was removed."""
+        return self.submit(_delete_employee(employee_id))
+
+    def flush(self, timeout: Optional[float] = None):
+        """Commit everything queued so far without waiting for the interval, and block until done."""
+        barrier: Future = Future()
+        with self._close_lock:
+            if self._closed:
+                self._thread.join(timeout)
+                return
+            self._queue.put((_FLUSH, barrier))
+        barrier.result(timeout)
+
+    def close(self, timeout: Optional[float] = None):
+        """Stop accepting writes, commit everything pending and stop the writer."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put((None, None))
+        self._thread.join(timeout)
+
+    def pending(self) -> int:
+        """Approximate number of queued operations not yet applied."""
+        return self._queue.qsize()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get submitted/applied/failed counters and batch statistics."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["pending"] = self.pending()
+        stats["avg_batch_size"] = (stats["applied"] + stats["failed"]) / stats["batches"] if stats["batches"] else 0.0
+        return stats
+
+    def _next_batch(self) -> Tuple[List[Tuple[Any, Future]], bool]:
+        """Block for one item, then gather more until full or the interval passes.
+
+        Returns the batch and whether the close sentinel was reached.
+        """
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        # A flush barrier or the close sentinel ends the batch early
+        while batch[-1][0] not in (None, _FLUSH) and len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(item)
+        stop = batch[-1][0] is None
+        return (batch[:-1] if stop else batch), stop
+
+    def _run(self):
+        while True:
+            batch, stop = self._next_batch()
+            self._apply(batch)
+            if stop:
+                return
+
+    def _apply(self, batch: List[Tuple[Any, Future]]):
+        """Apply one batch in a single transaction, then resolve its futures."""
+        barriers = [future for operation, future in batch if operation is _FLUSH]
+        work = [(operation, future) for operation, future in batch
+                if operation is not _FLUSH and future.set_running_or_notify_cancel()]
+        outcomes: List[Tuple[Future, bool, Any]] = []
+        if work:
+            start = time.perf_counter()
+
+            def apply(conn: sqlite3.Connection):
+                # Starts over when run_write retries a batch that found the database locked
+                outcomes.clear()
+                conn.execute("BEGIN IMMEDIATE")
+                for operation, future in work:
+                    conn.execute("SAVEPOINT write_queue_op")
+                    try:
+                        outcomes.append((future, True, operation(conn)))
+                    except Exception as e:
+                        conn.execute("ROLLBACK TO write_queue_op")
+                        outcomes.append((future, False, e))
+                    conn.execute("RELEASE write_queue_op")
+
+            try:
+                self.db_manager.run_write(apply)
+            except Exception as e:
+                # Nothing from this batch was committed
+                with self._stats_lock:
+                    self._stats["batches"] += 1
+                    self._stats["batch_errors"] += 1
+                    self._stats["failed"] += len(work)
+                for operation, future in work:
+                    future.set_exception(e)
+                outcomes = []
+            else:
+                with self._stats_lock:
+                    self._stats["batches"] += 1
+                    self._stats["commit_seconds"] += time.perf_counter() - start
+                    for future, ok, value in outcomes:
+                        self._stats["applied" if ok else "failed"] += 1
+        for future, ok, value in outcomes:
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+        for barrier in barriers:
+            barrier.set_result(None)
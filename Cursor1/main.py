@@ -2,17 +2,36 @@
 """
 Employee Management System - Main Application
 A complete MVC application for managing employee data with CRUD operations.
+
+    python main.py                                     # interactive menu
+    python main.py --batch changes.jsonl --output results.jsonl
+    python main.py --batch - --format csv < changes.csv
+    python main.py --export employees.csv.gz [--resume]
+    python main.py --export-dir exports/ --format columnar --workers 4
 """
 
+import argparse
+import json
+import sys
+from typing import List, Optional
+
 from controllers.employee_controller import EmployeeController
+from controllers.analytics_controller import AnalyticsController
+from controllers.batch_controller import BatchController, read_csv, read_jsonl
+from data_access.concurrency import ConcurrencyMode
+from data_access.database import DatabaseManager, DEFAULT_CHUNK_SIZE, DEFAULT_DB_PATH
+from data_access.export import EmployeeExporter, export_partitioned, COMPRESSORS, EXPORT_FORMATS
 from views.employee_view import EmployeeView
 
 class EmployeeManagementApp:
     """Main application class that coordinates the MVC components."""
     
-    def __init__(self):
-        self.controller = EmployeeController()
+    def __init__(self, db_manager: Optional[DatabaseManager] = None, page_size: int = 20):
+        self.controller = EmployeeController(db_manager)
+        self.analytics = AnalyticsController(self.controller.db_manager)
         self.view = EmployeeView()
+        # Employees per screen in the paged listing
+        self.page_size = page_size
     
     def run(self):
         """Run the main application loop."""
@@ -35,14 +54,36 @@ class EmployeeManagementApp:
             elif choice == 6:
                 self.view_departments()
             elif choice == 7:
+                self.view_payroll_reports()
+            elif choice == 8:
                 print("\nThank you for using the Employee Management System!")
                 break
     
     def view_all_employees(self):
-        """View all employees."""
-        employees = self.controller.get_all_employees()
-        departments = self.controller.get_all_departments()
-        self.view.display_employees(employees, departments)
+        """Page through all employees, one screen at a time."""
+        pager = self.controller.pager(page_size=self.page_size)
+        while True:
+            page = pager.current()
+            self.view.display_employee_page(page.employees, pager.page_number, pager.page_count,
+                                            pager.total, pager.query.sort_key, pager.query.descending)
+            command, argument = self.view.get_pager_command(paging=pager.page_count > 1)
+            if command == "quit":
+                return
+            if command == "next":
+                moved = pager.next()
+            elif command == "prev":
+                moved = pager.previous()
+            elif command == "first":
+                moved = pager.jump(1)
+            elif command == "last":
+                moved = pager.jump(pager.page_count)
+            elif command == "jump":
+                moved = pager.jump(argument)
+            else:
+                pager.sort_by(argument)
+                moved = True
+            if not moved:
+                self.view.display_error_message("No such page.")
     
     def add_employee(self):
         """Add a new employee."""
@@ -70,15 +111,15 @@ class EmployeeManagementApp:
     def update_employee(self):
         """Update an existing employee."""
         employee_id = self.view.get_employee_id("update")
-        employee = self.controller.get_employee(employee_id)
+        employee = self.controller.get_employee_with_department(employee_id)
         
         if not employee:
             self.view.display_error_message("Employee not found.")
             return
         
-        departments = self.controller.get_all_departments()
-        self.view.display_employee_details(employee, departments)
+        self.view.display_employee_details(employee)
         
+        departments = self.controller.get_all_departments()
         update_data = self.view.get_update_input(employee, departments)
         
         success = self.controller.update_employee(
@@ -97,14 +138,13 @@ class EmployeeManagementApp:
     def delete_employee(self):
         """Delete an employee."""
         employee_id = self.view.get_employee_id("delete")
-        employee = self.controller.get_employee(employee_id)
+        employee = self.controller.get_employee_with_department(employee_id)
         
         if not employee:
             self.view.display_error_message("Employee not found.")
             return
         
-        departments = self.controller.get_all_departments()
-        self.view.display_employee_details(employee, departments)
+        self.view.display_employee_details(employee)
         
         if self.view.confirm_action("delete", employee.name):
             success = self.controller.delete_employee(employee_id)
@@ -122,12 +162,11 @@ class EmployeeManagementApp:
             self.view.display_error_message("Search term cannot be empty.")
             return
         
-        employees = self.controller.search_employees(search_term)
-        departments = self.controller.get_all_departments()
+        employees = self.controller.search_employees_with_department(search_term)
         
         if employees:
             print(f"\nFound {len(employees)} employee(s) matching '{search_term}':")
-            self.view.display_employees(employees, departments)
+            self.view.display_employees(employees)
         else:
             print(f"\nNo employees found matching '{search_term}'.")
     
@@ -135,17 +174,128 @@ class EmployeeManagementApp:
         """View all departments."""
         departments = self.controller.get_all_departments()
         self.view.display_departments(departments)
+    
+    def view_payroll_reports(self):
+        """View payroll statistics, hire cohorts and salary distribution."""
+        self.view.display_payroll_report(
+            self.analytics.get_overall_payroll(),
+            self.analytics.get_department_payroll(),
+            self.analytics.get_hire_cohorts(),
+            self.analytics.get_salary_histogram()
+        )
+
+def run_batch(args: argparse.Namespace) -> int:
+    """Apply a JSONL/CSV command script and write one JSON result per line.
+    
+    Returns 1 if any command failed, otherwise 0.
+    """
+    db_manager = DatabaseManager(args.db, concurrency=concurrency_mode(args))
+    controller = EmployeeController.with_write_queue(db_manager, batch_size=args.chunk_size,
+                                                     flush_interval=0.05)
+    batch = BatchController(controller, args.chunk_size)
+    source = sys.stdin if args.batch == "-" else open(args.batch, newline="")
+    output = sys.stdout if args.output in (None, "-") else open(args.output, "w")
+    try:
+        csv_input = args.format == "csv" or (args.format is None and args.batch.lower().endswith(".csv"))
+        commands = read_csv(source) if csv_input else read_jsonl(source)
+        for result in batch.run(commands):
+            output.write(json.dumps(result) + "\n")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+        controller.close()
+    stats = json.dumps(batch.stats(), indent=2)
+    if args.stats:
+        with open(args.stats, "w") as f:
+            f.write(stats + "\n")
+    else:
+        print(stats, file=sys.stderr)
+    return 1 if batch.stats()["failed"] else 0
+
+def run_export(args: argparse.Namespace) -> int:
+    """Stream employees to a file, or one file per department in parallel."""
+    db_manager = DatabaseManager(args.db, concurrency=concurrency_mode(args))
+    try:
+        if args.export_dir:
+            results = export_partitioned(db_manager.db_path, args.export_dir, args.format or "csv",
+                                         args.compression, args.workers, args.resume)
+        else:
+            results = [dict(EmployeeExporter(db_manager).export(
+                args.export, args.format, args.compression or "auto", args.department,
+                resume=args.resume), path=args.export)]
+    finally:
+        db_manager.close()
+    for result in results:
+        print(f"{result['path']}: {result['rows']} rows", file=sys.stderr)
+    return 0
+
+def concurrency_mode(args: argparse.Namespace) -> Optional[ConcurrencyMode]:
+    """WAL/busy-timeout settings when --concurrent was given."""
+    if not args.concurrent:
+        return None
+    return ConcurrencyMode(busy_timeout_ms=int(args.busy_timeout * 1000))
 
-def main():
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Employee Management System")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="database file (default: %(default)s)")
+    parser.add_argument("--read-replica", action="store_true",
+                        help="serve reads from an in-memory copy of the database")
+    parser.add_argument("--max-staleness", type=float, default=1.0,
+                        help="seconds a replica read may lag other processes' commits")
+    parser.add_argument("--concurrent", action="store_true",
+                        help="use WAL, a busy timeout and lock retries so several processes can write")
+    parser.add_argument("--busy-timeout", type=float, default=5.0,
+                        help="seconds a --concurrent write waits for the lock before retrying")
+    parser.add_argument("--page-size", type=int, default=20,
+                        help="employees per screen when listing (default: %(default)s)")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="run add/update/delete/search commands from FILE ('-' for stdin)")
+    parser.add_argument("--format", choices=EXPORT_FORMATS,
+                        help="batch input (jsonl/csv) or export format (default: from the file extension)")
+    parser.add_argument("--output", help="batch results as JSONL (default: stdout)")
+    parser.add_argument("--stats", help="write batch throughput stats as JSON (default: stderr)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="commands per group-committed transaction")
+    parser.add_argument("--export", metavar="FILE", help="stream all employees to FILE")
+    parser.add_argument("--export-dir", metavar="DIR",
+                        help="export one file per department into DIR using worker processes")
+    parser.add_argument("--compression", choices=sorted(COMPRESSORS),
+                        help="compress the export (default: from the file extension)")
+    parser.add_argument("--department", type=int, help="export only this department")
+    parser.add_argument("--workers", type=int, help="worker processes for --export-dir")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue an interrupted export after its last exported ID")
+    args = parser.parse_args(argv)
+    if args.batch and args.format == "columnar":
+        parser.error("batch input must be jsonl or csv")
+    return args
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main entry point of the application."""
+    args = parse_args(argv)
+    if args.batch:
+        return run_batch(args)
+    if args.export or args.export_dir:
+        return run_export(args)
+    
+    app = None
     try:
-        app = EmployeeManagementApp()
+        app = EmployeeManagementApp(DatabaseManager(args.db, read_replica=args.read_replica,
+                                                    max_staleness=args.max_staleness,
+                                                    concurrency=concurrency_mode(args)),
+                                    page_size=args.page_size)
         app.run()
     except KeyboardInterrupt:
         print("\n\nApplication interrupted by user.")
     except Exception as e:
         print(f"\nAn unexpected error occurred: {e}")
         print("Please check your database connection and try again.")
+    finally:
+        if app is not None:
+            app.controller.close()
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,30 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+@dataclass
+class DepartmentPayroll:
+    """Salary statistics for one department (or the whole company)."""
+    department_id: Optional[int] = None
+    department_name: str = ""
+    headcount: int = 0
+    total_salary: float = 0.0
+    mean_salary: Optional[float] = None
+    min_salary: Optional[float] = None
+    max_salary: Optional[float] = None
+    median_salary: Optional[float] = None
+    percentiles: Dict[float, float] = field(default_factory=dict)
+
+@dataclass
+class HireCohort:
+    """Headcount and salary totals for employees hired in one period."""
+    period: str = ""
+    headcount: int = 0
+    total_salary: float = 0.0
+    mean_salary: Optional[float] = None
+
+@dataclass
+class SalaryBucket:
+    """One salary histogram bucket covering [lower, upper)."""
+    lower: float = 0.0
+    upper: float = 0.0
+    count: int = 0
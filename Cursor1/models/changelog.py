@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+@dataclass
+class ChangeEntry:
+    """One insert, update or delete recorded in the changelog."""
+    seq: int
+    table_name: str
+    row_id: int
+    operation: str
+    # Row image after the change; None for deletes
+    data: Optional[Dict[str, Any]] = None
+    changed_at: str = ""
+
+@dataclass
+class ChangeBatch:
+    """Changes after a sequence number, and where to continue from."""
+    changes: List[ChangeEntry] = field(default_factory=list)
+    last_seq: int = 0
+    has_more: bool = False
+    # The reader is behind purged entries and must reload everything first
+    resync_required: bool = False
@@ -22,3 +22,57 @@ class Department:
     
     def __str__(self):
         return f"Department(id={self.id}, name='{self.name}')"
+
+@dataclass
+class EmployeeWithDepartment(Employee):
+    """Employee joined with the name of its department."""
+    department_name: Optional[str] = None
+    
+    def __str__(self):
+        return f"EmployeeWithDepartment(id={self.id}, name='{self.name}', department='{self.department_name}', salary={self.salary}, hire_date='{self.hire_date}')"
+
+class SlottedEmployee:
+    """Memory-compact Employee without a per-instance __dict__."""
+    __slots__ = ("id", "name", "department_id", "salary", "hire_date")
+    
+    def __init__(self, id: Optional[int] = None, name: str = "",
+                 department_id: Optional[int] = None, salary: Optional[float] = None,
+                 hire_date: Optional[str] = None):
+        self.id = id
+        self.name = name
+        self.department_id = department_id
+        self.salary = salary
+        self.hire_date = hire_date
+    
+    def __eq__(self, other):
+        if not isinstance(other, (SlottedEmployee, Employee)):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in SlottedEmployee.__slots__)
+    
+    def __repr__(self):
+        return f"SlottedEmployee(id={self.id}, name='{self.name}', department_id={self.department_id}, salary={self.salary}, hire_date='{self.hire_date}')"
+    
+    def to_employee(self) -> Employee:
+        """Convert to a regular Employee dataclass."""
+        return Employee(id=self.id, name=self.name, department_id=self.department_id,
+                        salary=self.salary, hire_date=self.hire_date)
+
+class SlottedDepartment:
+    """Memory-compact Department without a per-instance __dict__."""
+    __slots__ = ("id", "name")
+    
+    def __init__(self, id: Optional[int] = None, name: str = ""):
+        self.id = id
+        self.name = name
+    
+    def __eq__(self, other):
+        if not isinstance(other, (SlottedDepartment, Department)):
+            return NotImplemented
+        return self.id == other.id and self.name == other.name
+    
+    def __repr__(self):
+        return f"SlottedDepartment(id={self.id}, name='{self.name}')"
+    
+    def to_department(self) -> Department:
+        """Convert to a regular Department dataclass."""
+        return Department(id=self.id, name=self.name)
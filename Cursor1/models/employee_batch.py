@@ -0,0 +1,163 @@
+import math
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Sequence, Tuple
+from models.employee import SlottedEmployee
+
+# Stored in integer columns in place of NULL
+INT_NULL = -(2 ** 63)
+
+# Serialized batch: row count and the byte length of each buffer, then the buffers
+_BUFFER_COUNT = 9
+_HEADER = struct.Struct(f"<{_BUFFER_COUNT + 1}Q")
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+def _from_little_endian(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+class StringColumn:
+    """Append-only column of optional strings packed into one UTF-8 buffer."""
+
+    def __init__(self):
+        self._data = bytearray()
+        self._offsets = array("q", [0])
+        self._nulls = bytearray()
+
+    def append(self, value: Optional[str]):
+        if value is not None:
+            self._data += value.encode("utf-8")
+        self._offsets.append(len(self._data))
+        self._nulls.append(value is None)
+
+    def __len__(self) -> int:
+        return len(self._nulls)
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        if index < 0:
+            index += len(self)
+        if self._nulls[index]:
+            return None
+        return self._data[self._offsets[index]:self._offsets[index + 1]].decode("utf-8")
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._data) + self._offsets.itemsize * len(self._offsets) + len(self._nulls)
+
+    def buffers(self) -> List[bytes]:
+        """Serialize as (data, offsets, nulls) byte strings."""
+        return [bytes(self._data), _little_endian(self._offsets), bytes(self._nulls)]
+
+    @classmethod
+    def from_buffers(cls, data: bytes, offsets: bytes, nulls: bytes) -> "StringColumn":
+        column = cls()
+        column._data = bytearray(data)
+        column._offsets = _from_little_endian("q", offsets)
+        column._nulls = bytearray(nulls)
+        return column
+
+class EmployeeBatch:
+    """Columnar container for many employees.
+
+    Integer and float fields live in typed `array` columns (NULL is stored
+    as INT_NULL or NaN) and strings in packed StringColumns. Row objects are
+    only built on demand via indexing or iteration.
+    """
+
+    def __init__(self):
+        self.ids = array("q")
+        self.department_ids = array("q")
+        self.salaries = array("d")
+        self.names = StringColumn()
+        self.hire_dates = StringColumn()
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence]) -> "EmployeeBatch":
+        """Build a batch from (id, name, department_id, salary, hire_date) rows."""
+        batch = cls()
+        batch.extend_rows(rows)
+        return batch
+
+    def append_row(self, row: Sequence):
+        """Append one (id, name, department_id, salary, hire_date) row."""
+        employee_id, name, department_id, salary, hire_date = row
+        self.ids.append(INT_NULL if employee_id is None else employee_id)
+        self.names.append(name)
+        self.department_ids.append(INT_NULL if department_id is None else department_id)
+        self.salaries.append(math.nan if salary is None else salary)
+        self.hire_dates.append(hire_date)
+
+    def extend_rows(self, rows: Iterable[Sequence]):
+        for row in rows:
+            self.append_row(row)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def row(self, index: int) -> Tuple:
+        """Return row `index` as a plain tuple."""
+        department_id = self.department_ids[index]
+        salary = self.salaries[index]
+        employee_id = self.ids[index]
+        return (None if employee_id == INT_NULL else employee_id,
+                self.names[index],
+                None if department_id == INT_NULL else department_id,
+                None if math.isnan(salary) else salary,
+                self.hire_dates[index])
+
+    def __getitem__(self, index: int) -> SlottedEmployee:
+        return SlottedEmployee(*self.row(index))
+
+    def __iter__(self) -> Iterator[SlottedEmployee]:
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the column buffers."""
+        return (self.ids.itemsize * len(self.ids)
+                + self.department_ids.itemsize * len(self.department_ids)
+                + self.salaries.itemsize * len(self.salaries)
+                + self.names.nbytes + self.hire_dates.nbytes)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the column buffers in a portable little-endian layout."""
+        buffers = [_little_endian(self.ids), _little_endian(self.department_ids),
+                   _little_endian(self.salaries)] + self.names.buffers() + self.hire_dates.buffers()
+        return _HEADER.pack(len(self), *(len(buffer) for buffer in buffers)) + b"".join(buffers)
+
+    @classmethod
+    def read_from(cls, stream: BinaryIO) -> Optional["EmployeeBatch"]:
+        """Read one batch written by to_bytes, or None at end of stream."""
+        header = stream.read(_HEADER.size)
+        if not header:
+            return None
+        if len(header) < _HEADER.size:
+            raise ValueError("truncated batch header")
+        lengths = _HEADER.unpack(header)[1:]
+        buffers = []
+        for length in lengths:
+            buffer = stream.read(length)
+            if len(buffer) < length:
+                raise ValueError("truncated batch data")
+            buffers.append(buffer)
+        batch = cls()
+        batch.ids = _from_little_endian("q", buffers[0])
+        batch.department_ids = _from_little_endian("q", buffers[1])
+        batch.salaries = _from_little_endian("d", buffers[2])
+        batch.names = StringColumn.from_buffers(*buffers[3:6])
+        batch.hire_dates = StringColumn.from_buffers(*buffers[6:9])
+        return batch
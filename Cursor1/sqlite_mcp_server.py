@@ -1,14 +1,269 @@
 from mcp.server.fastmcp import FastMCP
+import base64
+import hashlib
+import json
 import os
+import re
 import sqlite3
-from typing import List, Dict, Any
+import threading
+import time
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import quote
+
+from data_access.cache import VersionedLRUCache
+from data_access.connection_pool import ConnectionPool
+from data_access.instrumentation import (
+	METRICS, InstrumentedConnection, instrument_connection, normalize_sql
+)
+from data_access.index_advisor import IndexAdvisor, WorkloadRecorder, full_scans, query_plan
 
 
 app = FastMCP("sqlite")
 
+# Read-only connections kept open between tool calls
+POOL_SIZE = int(os.environ.get("SQLITE_POOL_SIZE", "4"))
+CACHED_STATEMENTS = 1024
+MMAP_SIZE = 256 * 1024 * 1024
+
+# Result limits; callers may ask for less but never more
+DEFAULT_MAX_ROWS = 500
+MAX_ROWS_LIMIT = 10000
+DEFAULT_MAX_BYTES = 1024 * 1024
+MAX_BYTES_LIMIT = 16 * 1024 * 1024
+DEFAULT_TIMEOUT_MS = 5000
+MAX_TIMEOUT_MS = 60000
+# SQLite VM instructions between wall-clock checks
+PROGRESS_INTERVAL = 10000
+FETCH_SIZE = 256
+
+# Statements at least this slow are logged with their query plan
+METRICS.slow_query_ms = float(os.environ.get("SQLITE_SLOW_QUERY_MS", "100"))
+
+# Result cache budget; set SQLITE_RESULT_CACHE_BYTES=0 to disable caching
+RESULT_CACHE_BYTES = int(os.environ.get("SQLITE_RESULT_CACHE_BYTES", str(32 * 1024 * 1024)))
+RESULT_CACHE_ENTRIES = 1024
+# Rough per-row bookkeeping cost added to the value bytes of a cached result
+ROW_OVERHEAD_BYTES = 64
+
+# Distinct statement shapes remembered for the index advisor; 0 disables recording
+WORKLOAD_STATEMENTS = int(os.environ.get("SQLITE_WORKLOAD_STATEMENTS", "500"))
+WORKLOAD = WorkloadRecorder(max_statements=max(WORKLOAD_STATEMENTS, 1))
+
+# Queries whose result can change without the database changing. Date and
+# time functions called without a time value (or strftime with only a
+# format) default to 'now'.
+NON_DETERMINISTIC = re.compile(
+	r"\b(random|randomblob|changes|total_changes|last_insert_rowid)\s*\("
+	r"|'now'|\bcurrent_(date|time|timestamp)\b"
+	r"|\b(date|time|datetime|julianday|unixepoch)\s*\(\s*\)"
+	r"|\bstrftime\s*\(\s*'[^']*'\s*\)",
+	re.IGNORECASE,
+)
+
+# A plain single-table SELECT, which can be paged by rowid instead of by offset
+KEYSET_QUERY = re.compile(
+	r"^\s*SELECT\s+(?P<columns>.+?)\s+FROM\s+(?P<table>[A-Za-z_]\w*)"
+	r"(?:\s+(?:AS\s+)?(?P<alias>(?!WHERE\b)[A-Za-z_]\w*))?"
+	r"(?:\s+WHERE\s+(?P<where>.+?))?\s*;?\s*$",
+	re.IGNORECASE | re.DOTALL,
+)
+# Clauses and functions whose rows are not one-per-table-row in rowid order
+NOT_KEYSET = re.compile(
+	r"\b(ORDER|GROUP|LIMIT|UNION|INTERSECT|EXCEPT|JOIN|DISTINCT|HAVING|WINDOW|OVER|WITH|"
+	r"count|sum|avg|min|max|total|group_concat|json_group_array|json_group_object)\b|--|/\*",
+	re.IGNORECASE,
+)
+
+# Continuation cursors embed `database_version()`, whose data_version part is
+# only comparable on this process's version connection
+_CURSOR_EPOCH = os.urandom(8).hex()
+
+_pool: Optional[ConnectionPool] = None
+_pool_identity: Optional[Tuple[str, int, int]] = None
+_version_connection: Optional[sqlite3.Connection] = None
+_pool_lock = threading.Lock()
+
+
+def _resolve_db_path() -> str:
+	db_path = os.environ.get("SQLITE_DB_PATH")
+	if not db_path:
+		raise RuntimeError(
+			"SQLITE_DB_PATH environment variable is not set; point it to your .db file"
+		)
+	return os.path.abspath(db_path)
+
+
+def _open_read_only(db_path: str) -> sqlite3.Connection:
+	# Enforce read-only connection using SQLite URI
+	uri = f"file:{quote(db_path)}?mode=ro"
+	connection = sqlite3.connect(
+		uri,
+		uri=True,
+		check_same_thread=False,
+		cached_statements=CACHED_STATEMENTS,
+		factory=InstrumentedConnection,
+	)
+	instrument_connection(connection, METRICS)
+	connection.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+	connection.row_factory = sqlite3.Row
+	return connection
+
+
+def get_pool() -> ConnectionPool:
+	"""
+	Return the read-only pool for the configured database.
+
+	The pool is rebuilt when `SQLITE_DB_PATH` changes or the file is replaced
+	(new inode). In-place writes by other processes need no reopen: SQLite
+	already detects them on the next read.
+	"""
+	global _pool, _pool_identity, _version_connection
+
+	db_path = _resolve_db_path()
+	stat = os.stat(db_path)
+	identity = (db_path, stat.st_dev, stat.st_ino)
+	with _pool_lock:
+		if _pool is None or identity != _pool_identity:
+			if _pool is not None:
+				_pool.close()
+			if _version_connection is not None:
+				_version_connection.close()
+				_version_connection = None
+			_pool = ConnectionPool(
+				db_path,
+				max_size=POOL_SIZE,
+				connect=lambda: _open_read_only(db_path),
+				on_acquire=METRICS.record_acquire_wait,
+			)
+			_pool_identity = identity
+		return _pool
+
+
+def database_version() -> Tuple[Any, ...]:
+	"""
+	Return a value that changes whenever the database content changes.
+
+	`PRAGMA data_version` on a connection that never writes changes with every
+	commit from any other connection or process; the file identity covers the
+	database being replaced.
+	"""
+	global _version_connection
+
+	get_pool()
+	with _pool_lock:
+		if _version_connection is None:
+			_version_connection = _open_read_only(_pool_identity[0])
+		version = _version_connection.execute("PRAGMA data_version").fetchone()[0]
+		return _pool_identity + (version,)
+
+
+def _result_size(result: Dict[str, Any]) -> int:
+	return result["approx_bytes"] + ROW_OVERHEAD_BYTES * result["row_count"]
+
+
+_result_cache = VersionedLRUCache(
+	max_entries=RESULT_CACHE_ENTRIES,
+	ttl=None,
+	version_source=database_version,
+	max_bytes=max(RESULT_CACHE_BYTES, 0),
+	size_of=_result_size,
+)
+
+
+def _sql_fingerprint(sql: str) -> str:
+	return hashlib.sha256(sql.strip().encode("utf-8")).hexdigest()[:16]
+
+
+def _encode_cursor(sql: str, version: Tuple[Any, ...], offset: int, after: Optional[int]) -> str:
+	payload = json.dumps({
+		"sql": _sql_fingerprint(sql),
+		"version": [_CURSOR_EPOCH, *version],
+		"offset": offset,
+		"after": after,
+	})
+	return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(token: str, sql: str, version: Tuple[Any, ...]) -> Tuple[int, Optional[int]]:
+	"""Return the (offset, after-rowid) a cursor continues from.
+
+	Raises ValueError if the cursor is malformed, belongs to another query,
+	or the database has changed since it was issued.
+	"""
+	try:
+		payload = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+		offset = int(payload["offset"])
+		after = None if payload["after"] is None else int(payload["after"])
+	except (ValueError, KeyError, TypeError):
+		raise ValueError("Invalid continuation cursor")
+	if payload.get("sql") != _sql_fingerprint(sql) or offset < 0:
+		raise ValueError("Continuation cursor does not belong to this query")
+	if payload.get("version") != [_CURSOR_EPOCH, *version]:
+		raise _stale_cursor()
+	return offset, after
+
+
+def _stale_cursor() -> ValueError:
+	return ValueError(
+		"Continuation cursor is stale: the database changed since it was issued; "
+		"run the query again without a cursor"
+	)
+
+
+@lru_cache(maxsize=256)
+def _keyset_sql(sql: str) -> Optional[Tuple[str, str, str]]:
+	"""
+	Rewrite a plain single-table SELECT to page by rowid.
+
+	Returns (table, first-page SQL, continuation SQL taking the last rowid),
+	each selecting the rowid as an extra first column, or None when the
+	query has ordering, grouping, joins, subqueries or aggregates of its own.
+	"""
+	match = KEYSET_QUERY.match(sql)
+	if match is None or NOT_KEYSET.search(sql) or len(re.findall(r"\bSELECT\b", sql, re.IGNORECASE)) > 1:
+		return None
+	table, alias, where = match.group("table"), match.group("alias"), match.group("where")
+	ref = alias or table
+	source = f"{table} AS {alias}" if alias else table
+	select = f"SELECT {ref}.rowid, {match.group('columns')} FROM {source}"
+	first = f"{select} WHERE ({where})" if where else select
+	after = f"{first} AND {ref}.rowid > ?" if where else f"{select} WHERE {ref}.rowid > ?"
+	order = f" ORDER BY {ref}.rowid"
+	return table, first + order, after + order
+
+
+def _is_rowid_table(connection: sqlite3.Connection, table: str) -> bool:
+	row = connection.execute(
+		"SELECT type, sql FROM sqlite_master WHERE name = ? COLLATE NOCASE", (table,)
+	).fetchone()
+	return row is not None and row[0] == "table" and "WITHOUT ROWID" not in (row[1] or "").upper()
+
+
+def _value_size(value: Any) -> int:
+	"""Approximate serialized size of one result value."""
+	if value is None:
+		return 4
+	if isinstance(value, (bytes, str)):
+		return len(value) + 2
+	return len(str(value))
+
+
+def _clamp(value: int, default: int, limit: int) -> int:
+	if value is None or value <= 0:
+		return default
+	return min(value, limit)
+
 
 @app.tool()
-def execute_query(sql: str) -> List[Dict[str, Any]]:
+def execute_query(
+	sql: str,
+	max_rows: int = DEFAULT_MAX_ROWS,
+	max_bytes: int = DEFAULT_MAX_BYTES,
+	timeout_ms: int = DEFAULT_TIMEOUT_MS,
+	cursor: Optional[str] = None,
+	columnar: bool = False,
+) -> Dict[str, Any]:
 
 	"""
 	Execute a read-only SQL query against the configured SQLite database.
@@ -16,25 +271,256 @@ def execute_query(sql: str) -> List[Dict[str, Any]]:
 	Set the environment variable `SQLITE_DB_PATH` to the absolute path of the
 	SQLite database file you want to query. This tool enforces read-only access
 	by opening the database using the URI mode=ro flag.
+
+	Results are bounded by `max_rows` and an approximate `max_bytes`. When a
+	result is cut short, `next_cursor` is set: call again with the same `sql`
+	and that `cursor` to fetch the next page. A plain single-table SELECT
+	(no ORDER BY, GROUP BY, joins, subqueries or aggregates) is returned in
+	rowid order and continues after the last rowid; other queries continue
+	by row offset. A cursor is rejected once the database has changed, so
+	pages never silently skip or repeat rows. Queries running longer than
+	`timeout_ms` are interrupted. With `columnar=True`, column names are
+	returned once in `columns` and values as one array per column in
+	`values`; otherwise `rows` holds one dict per row.
 	"""
 
-	db_path = os.environ.get("SQLITE_DB_PATH")
-	if not db_path:
-		raise RuntimeError(
-			"SQLITE_DB_PATH environment variable is not set; point it to your .db file"
-		)
+	started = time.monotonic()
+	try:
+		result = _execute_query(sql, max_rows, max_bytes, timeout_ms, cursor, columnar)
+	except Exception:
+		METRICS.record_method("mcp.execute_query", time.monotonic() - started, error=True)
+		raise
+	METRICS.record_method("mcp.execute_query", time.monotonic() - started, result["row_count"])
+	return result
 
-	# Enforce read-only connection using SQLite URI
-	uri = f"file:{db_path}?mode=ro"
-	connection = sqlite3.connect(uri, uri=True)
+
+def _execute_query(
+	sql: str,
+	max_rows: int,
+	max_bytes: int,
+	timeout_ms: int,
+	cursor: Optional[str],
+	columnar: bool,
+) -> Dict[str, Any]:
+	max_rows = _clamp(max_rows, DEFAULT_MAX_ROWS, MAX_ROWS_LIMIT)
+	max_bytes = _clamp(max_bytes, DEFAULT_MAX_BYTES, MAX_BYTES_LIMIT)
+	timeout_ms = _clamp(timeout_ms, DEFAULT_TIMEOUT_MS, MAX_TIMEOUT_MS)
+	version = database_version()
+	offset, after = _decode_cursor(cursor, sql, version) if cursor else (0, None)
+
+	executed = []
+
+	def run() -> Dict[str, Any]:
+		executed.append(True)
+		result = _run_query(sql, max_rows, max_bytes, timeout_ms, offset, after, columnar, version)
+		# A commit while the page was read may have shifted it
+		if cursor and database_version() != version:
+			raise _stale_cursor()
+		if WORKLOAD_STATEMENTS > 0:
+			WORKLOAD.record(sql, result["elapsed_ms"], result["row_count"])
+		return result
+
+	if RESULT_CACHE_BYTES <= 0 or NON_DETERMINISTIC.search(sql):
+		return run()
+
+	started = time.monotonic()
+	key = (normalize_sql(sql), max_rows, max_bytes, offset, after, columnar)
+	result = _result_cache.get(key, run)
+	if executed:
+		return result
+	# Served from cache: hand back a copy with this call's timing
+	return dict(result, cached=True, elapsed_ms=round((time.monotonic() - started) * 1000, 3))
+
+
+def _run_query(
+	sql: str,
+	max_rows: int,
+	max_bytes: int,
+	timeout_ms: int,
+	offset: int,
+	after: Optional[int],
+	columnar: bool,
+	version: Tuple[Any, ...],
+) -> Dict[str, Any]:
+	started = time.monotonic()
+	deadline = started + timeout_ms / 1000
+	with get_pool().connection() as connection:
+		# Offset cursors keep paging by offset; first pages try the rowid form
+		keyset = _keyset_sql(sql) if offset == 0 else None
+		if keyset is not None and not _is_rowid_table(connection, keyset[0]):
+			keyset = None
+		# A non-zero return aborts the running statement with "interrupted"
+		connection.set_progress_handler(lambda: time.monotonic() > deadline, PROGRESS_INTERVAL)
+		try:
+			db_cursor = connection.cursor()
+			try:
+				if keyset is None:
+					db_cursor.execute(sql)
+				elif after is None:
+					db_cursor.execute(keyset[1])
+				else:
+					db_cursor.execute(keyset[2], (after,))
+				skipped = 0
+				while skipped < offset:
+					chunk = db_cursor.fetchmany(min(FETCH_SIZE, offset - skipped))
+					if not chunk:
+						break
+					skipped += len(chunk)
+
+				rows: List[tuple] = []
+				size = 0
+				truncated = None
+				while truncated is None:
+					chunk = db_cursor.fetchmany(FETCH_SIZE)
+					if not chunk:
+						break
+					for row in chunk:
+						if len(rows) == max_rows:
+							truncated = "max_rows"
+							break
+						rowid, row = (row[0], row[1:]) if keyset is not None else (None, row)
+						row_size = sum(_value_size(value) for value in row)
+						if rows and size + row_size > max_bytes:
+							truncated = "max_bytes"
+							break
+						rows.append(tuple(row))
+						size += row_size
+						after = rowid
+			except sqlite3.OperationalError as e:
+				if str(e) == "interrupted":
+					raise TimeoutError(f"Query exceeded the {timeout_ms} ms time limit") from e
+				raise
+			columns = [column[0] for column in db_cursor.description or ()]
+			if keyset is not None:
+				columns = columns[1:]
+			db_cursor.close()
+		finally:
+			connection.set_progress_handler(None, 0)
+
+	result: Dict[str, Any] = {"columns": columns, "row_count": len(rows)}
+	if columnar:
+		result["values"] = [list(values) for values in zip(*rows)] if rows else [[] for _ in columns]
+	else:
+		result["rows"] = [dict(zip(columns, row)) for row in rows]
+	result["truncated"] = truncated
+	if truncated:
+		if keyset is not None:
+			result["next_cursor"] = _encode_cursor(sql, version, 0, after)
+		else:
+			result["next_cursor"] = _encode_cursor(sql, version, offset + len(rows), None)
+	else:
+		result["next_cursor"] = None
+	result["approx_bytes"] = size
+	result["cached"] = False
+	result["elapsed_ms"] = round((time.monotonic() - started) * 1000, 3)
+	return result
+
+
+@app.tool()
+def connection_stats() -> Dict[str, Any]:
+
+	"""
+	Report read-only connection pool usage: totals plus, for each open
+	connection, its age and how many queries have reused it.
+	"""
+
+	pool = get_pool()
+	return {
+		"database": pool.db_path,
+		"pool": pool.stats(),
+		"connections": pool.connection_stats(),
+	}
+
+
+@app.tool()
+def cache_stats() -> Dict[str, Any]:
+
+	"""
+	Report query result cache metrics: hits, misses, evictions, invalidations
+	caused by database changes, and current size against the byte cap.
+	"""
+
+	return _result_cache.stats()
+
+
+@app.tool()
+def query_metrics(reset: bool = False) -> Dict[str, Any]:
+
+	"""
+	Report per-statement and per-tool latency histograms, rows returned,
+	connection-acquire wait times and recent slow queries with their plans.
+	Pass `reset=True` to clear the counters after reading them.
+	"""
+
+	snapshot = METRICS.snapshot()
+	if reset:
+		METRICS.reset()
+	return snapshot
+
+
+@app.tool()
+def explain_query(sql: str) -> Dict[str, Any]:
+
+	"""
+	Return the `EXPLAIN QUERY PLAN` of a statement without running it.
+
+	`plan` holds the plan lines, indented by nesting depth. `full_scans`
+	lists tables read with a full table scan that uses no index, and
+	`temp_btree` is true when SQLite has to sort or deduplicate with a
+	temporary B-tree.
+	"""
+
+	with get_pool().connection() as connection:
+		plan = query_plan(connection, sql)
+	return {
+		"plan": plan,
+		"full_scans": full_scans(sql, plan),
+		"temp_btree": any("USE TEMP B-TREE" in line for line in plan),
+	}
+
+
+@app.tool()
+def query_workload(limit: int = 50, reset: bool = False) -> Dict[str, Any]:
+
+	"""
+	Report the statements executed through `execute_query`, grouped by shape
+	(literals replaced by `?`), with call counts and total, mean and worst
+	latency, most expensive first. Pass `reset=True` to clear the workload
+	after reading it.
+	"""
+
+	statements = WORKLOAD.statements(_clamp(limit, 50, WORKLOAD.max_statements))
+	if reset:
+		WORKLOAD.reset()
+	return {"recording": WORKLOAD_STATEMENTS > 0, "statements": statements}
+
+
+@app.tool()
+def advise_indexes(max_statements: int = 10, runs: int = 3) -> Dict[str, Any]:
+
+	"""
+	Propose indexes for the recorded workload.
+
+	The `max_statements` most expensive full-scan statements are replayed on a
+	scratch in-memory copy of the database. Candidate indexes (equality
+	columns, then a range or ORDER BY column, optionally covering) are built
+	there one at a time and kept only if they speed a statement up. Each
+	proposal carries its `CREATE INDEX` statement, its size on the copy, the
+	before/after timings (best of `runs`) and `estimated_saving_ms`, the
+	saving per call times the recorded call count. The real database is never
+	modified.
+	"""
+
+	get_pool()
+	advisor = IndexAdvisor(_pool_identity[0], runs=_clamp(runs, 3, 10), timeout_ms=DEFAULT_TIMEOUT_MS)
+	started = time.monotonic()
 	try:
-		connection.row_factory = sqlite3.Row
-		cursor = connection.cursor()
-		cursor.execute(sql)
-		rows = cursor.fetchall()
-		return [dict(row) for row in rows]
-	finally:
-		connection.close()
+		result = advisor.advise(WORKLOAD.statements(), _clamp(max_statements, 10, 50))
+	except Exception:
+		METRICS.record_method("mcp.advise_indexes", time.monotonic() - started, error=True)
+		raise
+	METRICS.record_method("mcp.advise_indexes", time.monotonic() - started, len(result["proposals"]))
+	return result
 
 
 if __name__ == "__main__":
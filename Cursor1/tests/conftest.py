@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pytest
+
+# Modules import each other from the project root (`from models.employee import ...`)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_access.database import DatabaseManager, EmployeeDAO
+from models.employee import Employee
+
+@pytest.fixture
+def db_manager(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "employees.db"))
+    yield manager
+    manager.close()
+
+@pytest.fixture
+def employee_dao(db_manager):
+    return EmployeeDAO(db_manager)
+
+@pytest.fixture
+def departments(db_manager):
+    """Two departments; returns their IDs."""
+    with db_manager.get_connection() as conn:
+        ids = [conn.execute("INSERT INTO departments (name) VALUES (?)", (name,)).lastrowid
+               for name in ("Engineering", "Sales")]
+        conn.commit()
+    return ids
+
+def make_employee(name: str, department_id: int, salary=None, hire_date=None) -> Employee:
+    return Employee(id=None, name=name, department_id=department_id, salary=salary, hire_date=hire_date)
@@ -0,0 +1,47 @@
+from controllers.employee_controller import EmployeeController
+from data_access.query import EmployeeQuery
+from tests.conftest import make_employee
+
+def test_partial_failure_reports_committed_chunks(db_manager, employee_dao, departments, capsys):
+    controller = EmployeeController(db_manager)
+    employees = [make_employee(f"E{i}", departments[0]) for i in range(5)]
+    employees[3].name = None  # NOT NULL violation in the second chunk
+    result = controller.create_employees(employees, chunk_size=2)
+    assert not result.succeeded
+    assert "NOT NULL" in result.error
+    assert result.written == 2
+    assert result.requested == 4
+    assert employee_dao.count(EmployeeQuery()) == 2
+    assert capsys.readouterr().out == ""
+
+def test_departments_are_validated_per_chunk(db_manager, employee_dao, departments):
+    controller = EmployeeController(db_manager)
+    unknown = max(departments) + 1
+    employees = [make_employee(f"E{i}", unknown if i % 3 == 0 else departments[i % 2]) for i in range(7)]
+    result = controller.create_employees(iter(employees), chunk_size=3)
+    assert result.succeeded
+    assert result.requested == 7
+    assert [e.name for e in result.rejected] == ["E0", "E3", "E6"]
+    assert result.written == 4 == employee_dao.count(EmployeeQuery())
+
+def test_input_is_consumed_lazily(db_manager, employee_dao, departments):
+    controller = EmployeeController(db_manager)
+    committed_before = []
+
+    def employees():
+        for i in range(6):
+            committed_before.append(employee_dao.count(EmployeeQuery()))
+            yield make_employee(f"E{i}", departments[0])
+
+    result = controller.create_employees(employees(), chunk_size=2)
+    assert result.succeeded and result.written == 6
+    # Each chunk is written before the next one is read
+    assert committed_before == [0, 0, 2, 2, 4, 4]
+
+def test_delete_reports_rows_removed(db_manager, employee_dao, departments):
+    controller = EmployeeController(db_manager)
+    controller.create_employees([make_employee(f"E{i}", departments[0]) for i in range(4)])
+    ids = [e.id for e in employee_dao.query(EmployeeQuery())]
+    result = controller.delete_employees(iter(ids[:3] + [999]), chunk_size=2)
+    assert result.succeeded
+    assert (result.requested, result.written) == (4, 3)
@@ -0,0 +1,57 @@
+import io
+from controllers.batch_controller import BatchController, read_csv, read_jsonl
+from controllers.employee_controller import EmployeeController
+from tests.conftest import make_employee
+
+def run_script(db_manager, script, chunk_size=10, csv_input=False):
+    controller = EmployeeController.with_write_queue(db_manager, batch_size=chunk_size)
+    try:
+        stream = io.StringIO(script)
+        commands = read_csv(stream) if csv_input else read_jsonl(stream)
+        return list(BatchController(controller, chunk_size).run(commands))
+    finally:
+        controller.write_queue.close()
+
+def test_update_changes_only_given_fields(db_manager, employee_dao, departments):
+    employee_id = employee_dao.create(make_employee("Ada", departments[0], 90000.0, "2020-01-01"))
+    results = run_script(db_manager, f'{{"op": "update", "id": {employee_id}, "salary": 99000}}\n')
+    assert results == [{"line": 1, "op": "update", "id": employee_id, "ok": True}]
+    employee = employee_dao.read(employee_id)
+    assert (employee.name, employee.department_id, employee.salary, employee.hire_date) == \
+        ("Ada", departments[0], 99000.0, "2020-01-01")
+
+def test_updates_in_one_chunk_merge_in_order(db_manager, employee_dao, departments):
+    employee_id = employee_dao.create(make_employee("Ada", departments[0], 90000.0, "2020-01-01"))
+    script = (f"op,id,name,department_id,salary,hire_date\n"
+              f"update,{employee_id},Ada L.,,,\n"
+              f"update,{employee_id},,{departments[1]},,\n")
+    results = run_script(db_manager, script, csv_input=True)
+    assert all(result["ok"] for result in results)
+    employee = employee_dao.read(employee_id)
+    assert (employee.name, employee.department_id, employee.salary) == ("Ada L.", departments[1], 90000.0)
+
+def test_add_without_hire_date(db_manager, employee_dao, departments):
+    results = run_script(db_manager, f'{{"op": "add", "name": "Bo", "department_id": {departments[0]}, '
+                                     f'"salary": 50000}}\n')
+    assert results[0]["ok"]
+    assert employee_dao.read(results[0]["id"]).hire_date is None
+
+def test_update_of_missing_or_deleted_row(db_manager, employee_dao, departments):
+    employee_id = employee_dao.create(make_employee("Ada", departments[0]))
+    script = (f'{{"op": "update", "id": {employee_id + 100}, "name": "X"}}\n'
+              f'{{"op": "delete", "id": {employee_id}}}\n'
+              f'{{"op": "update", "id": {employee_id}, "name": "X"}}\n'
+              f'{{"op": "update", "id": {employee_id}}}\n')
+    results = run_script(db_manager, script)
+    assert [result["ok"] for result in results] == [False, True, False, False]
+    assert results[0]["error"] == results[2]["error"] == "employee not found"
+    assert results[3]["error"].startswith("update requires at least one of")
+
+def test_update_of_row_added_in_same_chunk(db_manager, employee_dao, departments):
+    next_id = employee_dao.create(make_employee("Ada", departments[0])) + 1
+    script = (f'{{"op": "add", "name": "Bo", "department_id": {departments[0]}, "salary": 1}}\n'
+              f'{{"op": "update", "id": {next_id}, "salary": 2}}\n')
+    results = run_script(db_manager, script)
+    assert [result["ok"] for result in results] == [True, True]
+    assert results[0]["id"] == next_id
+    assert employee_dao.read(next_id).salary == 2.0
@@ -0,0 +1,44 @@
+from data_access.changelog import ChangeLogDAO
+from tests.conftest import make_employee
+
+def employee_changes(changelog, after_seq):
+    return [(c.operation, c.row_id, c.data) for c in changelog.read_since(after_seq)
+            if c.table_name == "employees"]
+
+def test_triggers_record_row_images(db_manager, employee_dao, departments):
+    changelog = ChangeLogDAO(db_manager)
+    start = changelog.latest_seq()
+    employee = make_employee("Ada", departments[0], 90000.0, "2020-01-01")
+    employee.id = employee_dao.create(employee)
+    employee.salary = 95000.0
+    employee_dao.update(employee)
+    employee_dao.delete(employee.id)
+    image = {"id": employee.id, "name": "Ada", "department_id": departments[0], "hire_date": "2020-01-01"}
+    assert employee_changes(changelog, start) == [
+        ("insert", employee.id, dict(image, salary=90000.0)),
+        ("update", employee.id, dict(image, salary=95000.0)),
+        ("delete", employee.id, None),
+    ]
+
+def test_id_change_records_delete_of_old_id(db_manager, employee_dao, departments):
+    changelog = ChangeLogDAO(db_manager)
+    employee_id = employee_dao.create(make_employee("Ada", departments[0]))
+    start = changelog.latest_seq()
+    with db_manager.get_connection() as conn:
+        conn.execute("UPDATE employees SET id = ? WHERE id = ?", (employee_id + 100, employee_id))
+        conn.commit()
+    changes = employee_changes(changelog, start)
+    assert [(operation, row_id) for operation, row_id, _ in changes] == \
+        [("delete", employee_id), ("update", employee_id + 100)]
+    assert changes[1][2]["id"] == employee_id + 100
+
+def test_department_changes_are_recorded(db_manager, departments):
+    changelog = ChangeLogDAO(db_manager)
+    start = changelog.latest_seq()
+    with db_manager.get_connection() as conn:
+        conn.execute("UPDATE departments SET name = 'Platform' WHERE id = ?", (departments[0],))
+        conn.commit()
+    [change] = changelog.read_since(start)
+    assert (change.table_name, change.operation, change.data) == \
+        ("departments", "update", {"id": departments[0], "name": "Platform"})
+    assert changelog.latest_seq() == change.seq
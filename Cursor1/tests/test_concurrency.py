@@ -0,0 +1,88 @@
+import sqlite3
+import threading
+
+import pytest
+
+from data_access.concurrency import ConcurrencyMode
+from data_access.database import DatabaseManager
+from data_access.write_queue import WriteBehindQueue
+from models.employee import Employee
+
+INSERT = "INSERT INTO departments (name) VALUES ('Ops')"
+
+@pytest.fixture
+def concurrent_manager(tmp_path):
+    mode = ConcurrencyMode(busy_timeout_ms=0, max_retries=3, backoff_base=0.05, backoff_max=0.05,
+                           checkpoint_interval=0)
+    manager = DatabaseManager(str(tmp_path / "employees.db"), concurrency=mode)
+    yield manager
+    manager.close()
+
+@pytest.fixture
+def writer(concurrent_manager):
+    """Another connection holding the write lock until released."""
+    conn = sqlite3.connect(concurrent_manager.db_path, isolation_level=None, check_same_thread=False)
+    conn.execute("BEGIN IMMEDIATE")
+    yield conn
+    if conn.in_transaction:
+        conn.rollback()
+    conn.close()
+
+def count_departments(manager):
+    with manager.get_read_connection() as conn:
+        return conn.execute("SELECT COUNT(*) FROM departments").fetchone()[0]
+
+def test_run_write_retries_until_lock_is_released(concurrent_manager, writer):
+    # Full-jitter backoff can be short, so allow enough retries to outlast the holder
+    concurrent_manager.concurrency.max_retries = 100
+    release = threading.Timer(0.05, writer.rollback)
+    release.start()
+    try:
+        concurrent_manager.run_write(lambda conn: conn.execute(INSERT))
+    finally:
+        release.join()
+    stats = concurrent_manager.concurrency_stats()
+    assert stats["retries"] >= 1
+    assert stats["transactions"] == 1
+    assert stats["lock_failures"] == 0
+    assert count_departments(concurrent_manager) == 1
+
+def test_run_write_gives_up_after_max_retries(concurrent_manager, writer):
+    with pytest.raises(sqlite3.OperationalError, match="locked"):
+        concurrent_manager.run_write(lambda conn: conn.execute(INSERT))
+    stats = concurrent_manager.concurrency_stats()
+    assert stats["retries"] == concurrent_manager.concurrency.max_retries
+    assert stats["lock_failures"] == 1
+    assert stats["transactions"] == 0
+
+def test_run_write_does_not_retry_other_errors(concurrent_manager):
+    with pytest.raises(sqlite3.OperationalError, match="no such table"):
+        concurrent_manager.run_write(lambda conn: conn.execute("DELETE FROM missing"))
+    assert concurrent_manager.concurrency_stats()["retries"] == 0
+
+def test_run_write_inside_outer_transaction_leaves_commit_to_caller(db_manager):
+    with pytest.raises(RuntimeError):
+        with db_manager.get_connection() as conn:
+            conn.execute("INSERT INTO departments (name) VALUES ('outer')")
+            db_manager.run_write(lambda inner: inner.execute("INSERT INTO departments (name) VALUES ('inner')"))
+            raise RuntimeError("abort")
+    assert count_departments(db_manager) == 0
+    assert db_manager.concurrency_stats()["transactions"] == 0
+
+def test_write_queue_batch_retries_a_locked_database(concurrent_manager):
+    concurrent_manager.concurrency.max_retries = 100
+    department_id = concurrent_manager.run_write(lambda conn: conn.execute(INSERT).lastrowid)
+    holder = sqlite3.connect(concurrent_manager.db_path, isolation_level=None, check_same_thread=False)
+    holder.execute("BEGIN IMMEDIATE")
+    queue = WriteBehindQueue(concurrent_manager, flush_interval=0)
+    try:
+        future = queue.create(Employee(name="Ada", department_id=department_id))
+        release = threading.Timer(0.05, holder.rollback)
+        release.start()
+        assert future.result(timeout=10) > 0
+        release.join()
+    finally:
+        queue.close()
+        holder.close()
+    assert queue.stats()["batch_errors"] == 0
+    assert concurrent_manager.concurrency_stats()["retries"] >= 1
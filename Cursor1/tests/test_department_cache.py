@@ -0,0 +1,20 @@
+import sqlite3
+
+from data_access.database import CachedDepartmentDAO, DatabaseManager
+
+def test_cache_reloads_from_disk_not_a_stale_replica(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "employees.db"), read_replica=True, max_staleness=60.0)
+    try:
+        dao = CachedDepartmentDAO(manager)
+        assert dao.read_all() == []
+        with manager.get_read_connection() as conn:
+            conn.execute("SELECT COUNT(*) FROM departments").fetchone()
+        # Another process commits; the replica will not refresh for a minute
+        other = sqlite3.connect(manager.db_path)
+        other.execute("INSERT INTO departments (name) VALUES ('Ops')")
+        other.commit()
+        other.close()
+        assert [dept.name for dept in dao.read_all()] == ["Ops"]
+        assert dao.existing_ids([1]) == {1}
+    finally:
+        manager.close()
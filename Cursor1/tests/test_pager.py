@@ -0,0 +1,68 @@
+import pytest
+
+from controllers.employee_controller import EmployeeController
+from data_access.query import SORT_KEYS
+from main import EmployeeManagementApp
+from models.employee import EmployeeWithDepartment
+from tests.conftest import make_employee
+
+@pytest.fixture
+def controller(db_manager, employee_dao, departments):
+    engineering, sales = departments
+    employee_dao.create_many([
+        make_employee(f"Employee {i:02d}", engineering if i % 2 else sales,
+                      None if i % 3 == 0 else 50000 + 1000 * (i % 5),
+                      None if i % 4 == 0 else f"2020-01-{i % 28 + 1:02d}")
+        for i in range(23)])
+    return EmployeeController(db_manager)
+
+@pytest.mark.parametrize("sort_key", SORT_KEYS)
+def test_total_is_the_same_under_every_sort(controller, sort_key):
+    pager = controller.pager(page_size=5)
+    pager.sort_by(sort_key)
+    assert pager.total == 23
+    assert pager.page_count == 5
+    descending = pager.query.descending
+    pager.sort_by(sort_key)
+    assert pager.query.descending != descending
+    assert pager.total == 23
+
+@pytest.mark.parametrize("sort_key", SORT_KEYS)
+@pytest.mark.parametrize("descending", [False, True])
+def test_stepping_forward_matches_the_full_query(controller, sort_key, descending):
+    pager = controller.pager(page_size=5)
+    pager.sort_by(sort_key)
+    if descending:
+        pager.sort_by(sort_key)
+    seen = list(pager.current().employees)
+    while pager.next():
+        seen.extend(pager.current().employees)
+    expected = controller.query_employees(pager.query).employees
+    assert [e.id for e in seen] == [e.id for e in expected]
+    assert len(seen) == 23
+
+def test_jump_and_previous_agree_with_offsets(controller):
+    pager = controller.pager(page_size=5)
+    expected = [e.id for e in controller.query_employees(pager.query).employees]
+    assert pager.jump(4)
+    assert [e.id for e in pager.current().employees] == expected[15:20]
+    assert pager.previous()
+    assert [e.id for e in pager.current().employees] == expected[10:15]
+    assert pager.jump(5) and not pager.next()
+    assert [e.id for e in pager.current().employees] == expected[20:]
+    assert not pager.jump(6) and not pager.jump(0)
+
+def test_pages_carry_department_names(controller):
+    employees = controller.pager(page_size=5).current().employees
+    assert all(isinstance(e, EmployeeWithDepartment) for e in employees)
+    assert {e.department_name for e in employees} <= {"Engineering", "Sales"}
+
+def test_single_page_listing_still_offers_sorting(db_manager, controller, monkeypatch, capsys):
+    app = EmployeeManagementApp(db_manager, page_size=50)
+    commands = iter(["salary", "salary", "n", "q"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(commands))
+    app.view_all_employees()
+    output = capsys.readouterr().out
+    assert "Salary ▲" in output and "Salary ▼" in output
+    assert "Unknown command." in output
+    assert output.count("Page 1 of 1 (23 employees)") == 3
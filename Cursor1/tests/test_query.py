@@ -0,0 +1,52 @@
+import pytest
+
+from data_access.query import EmployeeQuery, SORT_KEYS
+from tests.conftest import make_employee
+
+@pytest.fixture
+def employees(employee_dao, departments):
+    engineering, sales = departments
+    rows = [
+        make_employee("Ada", engineering, 120000, "2019-04-01"),
+        make_employee("Bob", sales, None, "2021-01-15"),
+        make_employee("Cy", engineering, 90000, None),
+        make_employee("Di", sales, 90000, "2019-04-01"),
+        make_employee("Ed", engineering, None, None),
+        make_employee("Flo", sales, 75000, "2023-09-30"),
+    ]
+    employee_dao.create_many(rows)
+    return employee_dao.query(EmployeeQuery())
+
+@pytest.mark.parametrize("sort_key", SORT_KEYS)
+@pytest.mark.parametrize("descending", [False, True])
+def test_sorting_never_filters(employee_dao, employees, sort_key, descending):
+    query = EmployeeQuery().order_by(sort_key, descending)
+    rows = employee_dao.query(query)
+    assert employee_dao.count(query) == len(rows) == len(employees)
+    expected = sorted(employees, key=query.order_key, reverse=descending)
+    assert [e.id for e in rows] == [e.id for e in expected]
+
+@pytest.mark.parametrize("sort_key", SORT_KEYS)
+@pytest.mark.parametrize("descending", [False, True])
+def test_keyset_pages_cover_the_full_result(employee_dao, employees, sort_key, descending):
+    query = EmployeeQuery().order_by(sort_key, descending)
+    paged, cursor = [], None
+    while True:
+        page = employee_dao.query(query.page(2).starting_after(cursor))
+        paged.extend(page)
+        if len(page) < 2:
+            break
+        cursor = query.cursor_for(page[-1])
+    assert [e.id for e in paged] == [e.id for e in employee_dao.query(query)]
+    assert [e.id for e in employee_dao.iter_query(query, page_size=1)] == [e.id for e in paged]
+
+def test_nulls_sort_first_ascending_and_last_descending(employee_dao, employees):
+    ascending = employee_dao.query(EmployeeQuery().order_by("salary"))
+    descending = employee_dao.query(EmployeeQuery().order_by("salary", descending=True))
+    assert [e.salary for e in ascending[:2]] == [None, None]
+    assert [e.salary for e in descending[-2:]] == [None, None]
+
+def test_filters_still_apply_with_a_nullable_sort(employee_dao, employees, departments):
+    query = EmployeeQuery(department_id=departments[0]).order_by("hire_date", descending=True)
+    assert [e.name for e in employee_dao.query(query)] == ["Ada", "Ed", "Cy"]
+    assert employee_dao.count(query) == 3
@@ -0,0 +1,30 @@
+import pytest
+
+from controllers.employee_controller import EmployeeController
+from main import EmployeeManagementApp
+from tests.conftest import make_employee
+
+@pytest.fixture
+def controller(db_manager, employee_dao, departments):
+    engineering, sales = departments
+    employee_dao.create_many([make_employee("Ada Lovelace", engineering),
+                              make_employee("Adam Smith", sales),
+                              make_employee("Grace Hopper", engineering)])
+    return EmployeeController(db_manager)
+
+@pytest.mark.parametrize("fts_enabled", [True, False])
+def test_joined_search_matches_plain_search(db_manager, controller, fts_enabled):
+    db_manager.fts_enabled = fts_enabled
+    joined = controller.search_employees_with_department("Ada")
+    assert [e.id for e in joined] == [e.id for e in controller.search_employees("Ada")]
+    assert [(e.name, e.department_name) for e in joined] == \
+        [("Ada Lovelace", "Engineering"), ("Adam Smith", "Sales")]
+
+def test_search_screen_reads_departments_from_the_join(db_manager, controller, monkeypatch, capsys):
+    app = EmployeeManagementApp(db_manager)
+    monkeypatch.setattr("builtins.input", lambda prompt="": "Ada")
+    monkeypatch.setattr(app.controller, "get_all_departments", lambda: pytest.fail("separate department query"))
+    app.search_employees()
+    output = capsys.readouterr().out
+    assert "Found 2 employee(s)" in output
+    assert "Engineering" in output and "Sales" in output
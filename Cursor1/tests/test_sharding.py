@@ -0,0 +1,57 @@
+import sqlite3
+
+from data_access.database import CachedDepartmentDAO
+from data_access.sharding import ShardedDatabaseManager, ShardedEmployeeDAO
+from models.employee import Department
+from tests.conftest import make_employee
+
+def _changelog_rows(path: str) -> int:
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM changelog").fetchone()[0]
+
+def test_existing_ids_are_never_reassigned(tmp_path, employee_dao, db_manager, departments):
+    # A populated single-file database becomes shard 0 and holds IDs of every residue class
+    existing = [employee_dao.create(make_employee(f"E{i}", departments[i % 2])) for i in range(5)]
+    paths = [db_manager.db_path, str(tmp_path / "shard1.db"), str(tmp_path / "shard2.db")]
+    sharded = ShardedDatabaseManager(paths)
+    try:
+        dao = ShardedEmployeeDAO(sharded)
+        created = [dao.create(make_employee(f"N{i}", departments[i % 2])) for i in range(6)]
+        assert not set(created) & set(existing)
+        assert len(set(created)) == len(created)
+        assert min(created) > max(existing)
+    finally:
+        sharded.close()
+
+def test_reopening_does_not_rewrite_departments(tmp_path, db_manager, departments):
+    paths = [db_manager.db_path, str(tmp_path / "shard1.db")]
+    ShardedDatabaseManager(paths).close()
+    replicated = _changelog_rows(paths[1])
+    ShardedDatabaseManager(paths).close()
+    assert _changelog_rows(paths[1]) == replicated
+
+    with db_manager.get_connection() as conn:
+        conn.execute("UPDATE departments SET name = 'Ops' WHERE id = ?", (departments[1],))
+        conn.commit()
+    ShardedDatabaseManager(paths).close()
+    with sqlite3.connect(paths[1]) as conn:
+        names = dict(conn.execute("SELECT id, name FROM departments"))
+    assert names == {departments[0]: "Engineering", departments[1]: "Ops"}
+    assert _changelog_rows(paths[1]) == replicated + 1
+
+def test_department_writes_reach_every_shard(tmp_path, db_manager, departments):
+    paths = [db_manager.db_path, str(tmp_path / "shard1.db")]
+    sharded = ShardedDatabaseManager(paths)
+    try:
+        department_dao = CachedDepartmentDAO(sharded)
+        dao = ShardedEmployeeDAO(sharded)
+        # Created after startup; its employees live on a shard other than the primary
+        ops = department_dao.create(Department(name="Ops"))
+        assert sharded.shard_for(ops) != 0
+        employee_id = dao.create(make_employee("Ada", ops))
+        assert dao.read_with_department(employee_id).department_name == "Ops"
+        department_dao.update(Department(id=ops, name="Platform"))
+        assert dao.read_with_department(employee_id).department_name == "Platform"
+        assert department_dao.read(ops).name == "Platform"
+    finally:
+        sharded.close()
@@ -1,5 +1,26 @@
-from typing import List
+import sys
+from itertools import islice
+from typing import Iterable, List, Optional, Sequence, Tuple
 from models.employee import Employee, Department
+from models.analytics import DepartmentPayroll, HireCohort, SalaryBucket
+
+# Rows formatted into one buffered write by display_employees
+RENDER_CHUNK_ROWS = 100
+
+# Longest cell before it is cut short with an ellipsis
+MAX_CELL_WIDTH = 30
+
+# Table columns: (header, sort key, right-aligned)
+EMPLOYEE_COLUMNS = [
+    ("ID", "id", True),
+    ("Name", "name", False),
+    ("Department", None, False),
+    ("Salary", "salary", True),
+    ("Hire Date", "hire_date", False),
+]
+
+# Pager commands that toggle sorting, by the column they sort
+SORT_COMMANDS = {"id": "id", "name": "name", "salary": "salary", "hired": "hire_date"}
 
 class EmployeeView:
     """View for displaying employee information and handling user input."""
@@ -15,37 +36,113 @@ class EmployeeView:
         print("4. Delete Employee")
         print("5. Search Employees")
         print("6. View Departments")
-        print("7. Exit")
+        print("7. Payroll Reports")
+        print("8. Exit")
         print("="*50)
     
     def get_menu_choice(self) -> int:
         """Get user's menu choice."""
         while True:
             try:
-                choice = int(input("\nEnter your choice (1-7): "))
-                if 1 <= choice <= 7:
+                choice = int(input("\nEnter your choice (1-8): "))
+                if 1 <= choice <= 8:
                     return choice
                 else:
-                    print("Please enter a number between 1 and 7.")
+                    print("Please enter a number between 1 and 8.")
             except ValueError:
                 print("Please enter a valid number.")
     
-    def display_employees(self, employees: List[Employee], departments: List[Department]):
-        """Display a list of employees."""
-        if not employees:
-            print("\nNo employees found.")
-            return
+    def _department_name(self, employee: Employee, dept_lookup: dict) -> str:
+        """Resolve a department name, preferring one joined onto the employee."""
+        joined = getattr(employee, "department_name", None)
+        if joined is not None:
+            return joined
+        return dept_lookup.get(employee.department_id, "Unknown")
+    
+    def format_employee_table(self, employees: Sequence[Employee], dept_lookup: dict,
+                              sort_key: Optional[str] = None, descending: bool = False) -> List[str]:
+        """Format employees as table lines, sizing columns to these rows only.
+        
+        The sorted column's header is marked with an arrow.
+        """
+        def clip(text: str) -> str:
+            return text if len(text) <= MAX_CELL_WIDTH else text[:MAX_CELL_WIDTH - 1] + "…"
+        
+        headers = [header + ((" ▼" if descending else " ▲") if key is not None and key == sort_key else "")
+                   for header, key, _ in EMPLOYEE_COLUMNS]
+        rows = [[str(emp.id), clip(emp.name), clip(self._department_name(emp, dept_lookup)),
+                 f"${emp.salary:,.2f}" if emp.salary else "N/A", emp.hire_date or "N/A"]
+                for emp in employees]
+        widths = [max(len(cell) for cell in column) for column in zip(headers, *rows)]
+        
+        def line(cells: List[str]) -> str:
+            return " ".join(cell.rjust(width) if right else cell.ljust(width)
+                            for cell, width, (_, _, right) in zip(cells, widths, EMPLOYEE_COLUMNS)).rstrip()
+        
+        return [line(headers), "-" * (sum(widths) + len(widths) - 1)] + [line(row) for row in rows]
+    
+    def _write(self, lines: List[str]):
+        """Emit lines as a single write instead of one print per line."""
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+    
+    def display_employees(self, employees: Iterable[Employee],
+                          departments: Optional[List[Department]] = None):
+        """Display employees, consuming them lazily so streams stay bounded.
         
+        Rows are rendered in chunks of RENDER_CHUNK_ROWS, each sized to its
+        own rows and written at once. Departments are only needed for
+        employees that do not already carry a joined department name.
+        """
         # Create department lookup
-        dept_lookup = {dept.id: dept.name for dept in departments}
+        dept_lookup = {dept.id: dept.name for dept in departments or []}
         
-        print(f"\n{'ID':<5} {'Name':<20} {'Department':<15} {'Salary':<10} {'Hire Date':<12}")
-        print("-" * 70)
+        employees = iter(employees)
+        shown = 0
+        while True:
+            chunk = list(islice(employees, RENDER_CHUNK_ROWS))
+            if not chunk:
+                break
+            shown += len(chunk)
+            self._write([""] + self.format_employee_table(chunk, dept_lookup))
+        
+        if not shown:
+            print("\nNo employees found.")
+    
+    def display_employee_page(self, employees: Sequence[Employee], page_number: int, page_count: int,
+                              total: int, sort_key: Optional[str] = None, descending: bool = False):
+        """Display one page of a paged listing with its position, in one write.
+        
+        Employees are expected to carry joined department names.
+        """
+        if not employees:
+            self._write(["", "No employees found."])
+            return
+        lines = [""] + self.format_employee_table(employees, {}, sort_key, descending)
+        lines.append(f"Page {page_number} of {page_count} ({total} employees)")
+        self._write(lines)
+    
+    def get_pager_command(self, paging: bool = True) -> Tuple[str, Optional[object]]:
+        """Read a paging command: ("next"|"prev"|"first"|"last"|"quit", None),
+        ("jump", page number) or ("sort", sort key).
         
-        for emp in employees:
-            dept_name = dept_lookup.get(emp.department_id, "Unknown")
-            salary_str = f"${emp.salary:,.2f}" if emp.salary else "N/A"
-            print(f"{emp.id:<5} {emp.name:<20} {dept_name:<15} {salary_str:<10} {emp.hire_date or 'N/A':<12}")
+        Without `paging` (a single page) only sorting and quitting are offered.
+        """
+        if paging:
+            commands = {"n": "next", "": "next", "p": "prev", "f": "first", "l": "last", "q": "quit"}
+            prompt = "[n]ext [p]rev [f]irst [l]ast, page number, sort by id/name/salary/hired, [q]uit: "
+        else:
+            commands = {"": "quit", "q": "quit"}
+            prompt = "Sort by id/name/salary/hired, [q]uit: "
+        while True:
+            choice = input(prompt).strip().lower()
+            if choice in commands:
+                return commands[choice], None
+            if choice in SORT_COMMANDS:
+                return "sort", SORT_COMMANDS[choice]
+            if paging and choice.isdigit():
+                return "jump", int(choice)
+            print("Unknown command.")
     
     def display_departments(self, departments: List[Department]):
         """Display a list of departments."""
@@ -59,6 +156,38 @@ class EmployeeView:
         for dept in departments:
             print(f"{dept.id:<5} {dept.name:<20}")
     
+    def display_payroll_report(self, overall: Optional[DepartmentPayroll],
+                               departments: List[DepartmentPayroll],
+                               cohorts: List[HireCohort], histogram: List[SalaryBucket]):
+        """Display payroll statistics, hire cohorts and a salary histogram."""
+        def money(value):
+            return f"${value:,.0f}" if value is not None else "N/A"
+        
+        print("\n--- Payroll by Department ---")
+        print(f"{'Department':<18} {'Count':>6} {'Total':>14} {'Mean':>10} {'Median':>10} {'P90':>10}")
+        print("-" * 73)
+        rows = departments + ([overall] if overall else [])
+        for report in rows:
+            print(f"{report.department_name:<18} {report.headcount:>6} {money(report.total_salary):>14} "
+                  f"{money(report.mean_salary):>10} {money(report.median_salary):>10} "
+                  f"{money(report.percentiles.get(0.9)):>10}")
+        
+        print("\n--- Hire Cohorts ---")
+        print(f"{'Period':<10} {'Count':>6} {'Total':>14} {'Mean':>10}")
+        print("-" * 43)
+        for cohort in cohorts:
+            print(f"{cohort.period:<10} {cohort.headcount:>6} {money(cohort.total_salary):>14} "
+                  f"{money(cohort.mean_salary):>10}")
+        
+        print("\n--- Salary Distribution ---")
+        if not histogram:
+            print("No salary data.")
+            return
+        peak = max(bucket.count for bucket in histogram) or 1
+        for bucket in histogram:
+            bar = "#" * round(40 * bucket.count / peak)
+            print(f"{money(bucket.lower):>10} - {money(bucket.upper):<10} {bucket.count:>6} {bar}")
+    
     def get_employee_input(self, departments: List[Department]) -> dict:
         """Get employee information from user."""
         print("\n--- Add New Employee ---")
@@ -176,10 +305,11 @@ class EmployeeView:
         """Display error message."""
         print(f"\n✗ Error: {message}")
     
-    def display_employee_details(self, employee: Employee, departments: List[Department]):
+    def display_employee_details(self, employee: Employee,
+                                 departments: Optional[List[Department]] = None):
         """Display detailed employee information."""
-        dept_lookup = {dept.id: dept.name for dept in departments}
-        dept_name = dept_lookup.get(employee.department_id, "Unknown")
+        dept_lookup = {dept.id: dept.name for dept in departments or []}
+        dept_name = self._department_name(employee, dept_lookup)
         
         print(f"\n--- Employee Details ---")
         print(f"ID: {employee.id}")